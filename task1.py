@@ -2,19 +2,249 @@
 Завдання 1: Додати метод delete для видалення пар ключ-значення в HashTable
 
 Реалізація хеш-таблиці з методом видалення, що використовує метод ланцюжків 
-для розв'язання колізій.
+для розв'язання колізій. Таблиця автоматично змінює кількість кошиків при
+перевищенні коефіцієнта заповнення, переносячи елементи поступово.
+Альтернативне сховище з відкритою адресацією обирається параметром storage,
+а спосіб перетворення ключа в індекс - параметром hash_strategy.
 """
 
+import hashlib
+import itertools
+import mmap
+import os
+import pickle
+import struct
+import threading
+import time
+from array import array
+
+
+STORAGES = ("chaining", "open_addressing")
+
+# Маркери слотів відкритої адресації: ніколи не зайнятий та видалений
+_EMPTY = object()
+_DELETED = object()
+# Маркер відсутнього аргументу default у pop
+_MISSING = object()
+
+
+class ModuloHash:
+    """
+    Стратегія хешування за замовчуванням: hash(key) % size.
+    """
+
+    hash = staticmethod(hash)
+
+    def reduce(self, key_hash, size):
+        """
+        Перетворює повний хеш ключа в індекс таблиці.
+
+        Args:
+            key_hash (int): Повний хеш ключа
+            size (int): Кількість кошиків
+
+        Returns:
+            int: Індекс в таблиці
+        """
+        return key_hash % size
+
+    def table_size(self, size):
+        """
+        Повертає розмір таблиці, придатний для стратегії.
+
+        Args:
+            size (int): Бажаний розмір
+
+        Returns:
+            int: Розмір таблиці
+        """
+        return size
+
+
+class MaskHash(ModuloHash):
+    """
+    Таблиці розміром у степінь двійки: індекс береться бітовою маскою
+    замість ділення, а перед цим хеш перемішується множенням на 2^64/φ,
+    щоб послідовні та кратні степеню двійки ключі не потрапляли в одні
+    й ті самі кошики.
+    """
+
+    def reduce(self, key_hash, size):
+        mixed = (key_hash * 0x9E3779B97F4A7C15) & 0xFFFFFFFFFFFFFFFF
+        return (mixed ^ (mixed >> 32)) & (size - 1)
+
+    def table_size(self, size):
+        return 1 << (size - 1).bit_length()
+
+
+class KeyedHash(ModuloHash):
+    """
+    Хешування з секретним ключем (BLAKE2b), стійке до підбору ключів,
+    що навмисно потрапляють в один кошик.
+
+    Рядки, байти та цілі числа хешуються за своїм вмістом; інші ключі -
+    за значенням hash(key), щоб рівні ключі різних типів (наприклад, 1 і 1.0)
+    мали однаковий хеш. Хеші рядків кешуються в межах стратегії, тобто
+    окремо для кожної таблиці.
+    """
+
+    def __init__(self, secret=None, cache_size=65536):
+        """
+        Args:
+            secret (bytes): Секретний ключ до 64 байт (None - випадковий)
+            cache_size (int): Максимальна кількість закешованих рядків
+        """
+        self.secret = os.urandom(16) if secret is None else secret
+        self.cache_size = cache_size
+        self._cache = {}
+
+    def _digest(self, data):
+        digest = hashlib.blake2b(data, digest_size=8, key=self.secret).digest()
+        return int.from_bytes(digest, "little", signed=True)
+
+    def hash(self, key):
+        """
+        Повертає повний хеш ключа.
+
+        Args:
+            key: Ключ для хешування
+
+        Returns:
+            int: 64-бітний знаковий хеш
+        """
+        if isinstance(key, str):
+            cached = self._cache.get(key)
+            if cached is not None:
+                return cached
+            key_hash = self._digest(b"s" + key.encode("utf-8", "surrogatepass"))
+            if len(self._cache) >= self.cache_size:
+                self._cache.clear()
+            self._cache[key] = key_hash
+            return key_hash
+        if isinstance(key, bytes):
+            return self._digest(b"b" + key)
+
+        # Дробові та інші числа, рівні цілому, хешуються як це ціле
+        integral = key if isinstance(key, int) else _as_integral(key)
+        if integral is not None:
+            length = integral.bit_length() // 8 + 1
+            return self._digest(b"i" + integral.to_bytes(length, "little", signed=True))
+        return self._digest(b"h" + hash(key).to_bytes(8, "little", signed=True))
+
+
+def _as_integral(value):
+    """
+    Повертає ціле число, рівне value, або None.
+
+    Args:
+        value: Довільний об'єкт
+
+    Returns:
+        int: Рівне ціле або None
+    """
+    try:
+        if value.imag != 0:
+            return None
+        integral = int(value.real)
+    except (AttributeError, TypeError, ValueError, OverflowError):
+        return None
+    return integral if integral == value else None
+
+
+HASH_STRATEGIES = {
+    "modulo": ModuloHash,
+    "mask": MaskHash,
+    "keyed": KeyedHash,
+}
+
+
 class HashTable:
-    def __init__(self, size):
+    def __new__(cls, *args, storage="chaining", **kwargs):
+        """
+        Обирає клас сховища за параметром storage.
+
+        storage та наступні параметри __init__ передаються лише за
+        іменем, тож клас завжди обирається за тим самим значенням, яке
+        потрапляє в __init__.
+
+        Args:
+            storage (str): "chaining" (метод ланцюжків) або
+                "open_addressing" (відкрита адресація)
+        """
+        if storage not in STORAGES:
+            raise ValueError(f"Невідомий тип сховища: {storage!r}")
+        if cls is HashTable and storage == "open_addressing":
+            cls = OpenAddressingHashTable
+        return super().__new__(cls)
+
+    def __init__(self, size=8, max_load_factor=0.75, min_load_factor=None,
+                 rehash_step=4, *, storage="chaining", items=None,
+                 hash_strategy="modulo"):
         """
         Ініціалізує хеш-таблицю заданого розміру.
         
         Args:
-            size (int): Розмір хеш-таблиці
+            size (int): Початковий розмір хеш-таблиці
+            max_load_factor (float): Коефіцієнт заповнення, після перевищення
+                якого таблиця подвоює кількість кошиків (None - без росту)
+            min_load_factor (float): Коефіцієнт заповнення, нижче якого таблиця
+                зменшується вдвічі, але не менше початкового розміру
+                (None - без зменшення)
+            rehash_step (int): Кількість кошиків старої таблиці, що переносяться
+                за одну операцію під час поступового рехешування
+            storage (str): Тип сховища - "chaining" або "open_addressing"
+            items: Початковий вміст - словник, HashTable або ітерабельний
+                об'єкт пар (ключ, значення)
+            hash_strategy: Назва стратегії з HASH_STRATEGIES ("modulo",
+                "mask", "keyed") або її екземпляр
         """
+        if size < 1:
+            raise ValueError("Розмір хеш-таблиці має бути додатним")
+        if max_load_factor is not None and max_load_factor <= 0:
+            raise ValueError("max_load_factor має бути додатним")
+        if min_load_factor is not None:
+            if min_load_factor <= 0:
+                raise ValueError("min_load_factor має бути додатним")
+            if max_load_factor is not None and min_load_factor * 2 >= max_load_factor:
+                raise ValueError("min_load_factor має бути меншим за половину max_load_factor")
+        if rehash_step < 1:
+            raise ValueError("rehash_step має бути додатним")
+        if isinstance(hash_strategy, str):
+            if hash_strategy not in HASH_STRATEGIES:
+                raise ValueError(f"Невідома стратегія хешування: {hash_strategy!r}")
+            hash_strategy = HASH_STRATEGIES[hash_strategy]()
+
+        self.hash_strategy = hash_strategy
+        # Методи стратегії зв'язуються один раз, щоб не шукати їх на кожній операції
+        self._key_hash = hash_strategy.hash
+        self._reduce = hash_strategy.reduce
+        size = hash_strategy.table_size(size)
         self.size = size
-        self.table = [[] for _ in range(self.size)]
+        self.storage = storage
+        self.max_load_factor = max_load_factor
+        self.min_load_factor = min_load_factor
+        self.rehash_step = rehash_step
+        self._min_size = size
+        self._count = 0
+        # Версія змінюється при додаванні чи видаленні ключа, щоб ітератори
+        # могли виявити зміну таблиці під час перебору
+        self._version = 0
+        # Стан поступового рехешування: стара таблиця, її розмір та індекс
+        # наступного кошика, який потрібно перенести
+        self._old_table = None
+        self._old_size = 0
+        self._rehash_index = 0
+        self._init_storage()
+        if items is not None:
+            self.update(items)
+
+    def _init_storage(self):
+        """
+        Створює порожні кошики для поточного розміру таблиці.
+        """
+        # Порожні кошики зберігаються як None, щоб створення великої таблиці
+        # під час росту не виділяло окремий список для кожного кошика
+        self.table = [None] * self.size
 
     def hash_function(self, key):
         """
@@ -26,7 +256,174 @@ class HashTable:
         Returns:
             int: Індекс в таблиці
         """
-        return hash(key) % self.size
+        return self._reduce(self._key_hash(key), self.size)
+
+    def _rehash_step(self):
+        """
+        Переносить наступні rehash_step кошиків старої таблиці в нову.
+        """
+        old_table = self._old_table
+        if old_table is None:
+            return
+
+        # Перенесення змінює розташування пар, тому активні ітератори
+        # мають бути інвалідовані
+        self._version += 1
+        end = min(self._rehash_index + self.rehash_step, self._old_size)
+        for i in range(self._rehash_index, end):
+            bucket = old_table[i]
+            if bucket:
+                for pair in bucket:
+                    # Пара зберігає повний хеш ключа, тому ключ не хешується знову
+                    index = self._reduce(pair[2], self.size)
+                    if self.table[index]:
+                        self.table[index].append(pair)
+                    else:
+                        self.table[index] = [pair]
+                old_table[i] = None
+        self._rehash_index = end
+
+        if end >= self._old_size:
+            self._old_table = None
+            self._old_size = 0
+            self._rehash_index = 0
+
+    def _finish_rehash(self):
+        """
+        Завершує розпочате рехешування, переносячи всі кошики, що залишилися.
+        """
+        while self._old_table is not None:
+            self._rehash_step()
+
+    def _resize(self, new_size):
+        """
+        Розпочинає поступове перенесення елементів у таблицю нового розміру.
+
+        Args:
+            new_size (int): Нова кількість кошиків
+        """
+        # Попереднє рехешування має завершитися до початку наступного
+        self._finish_rehash()
+        self._old_table = self.table
+        self._old_size = self.size
+        self._rehash_index = 0
+        self.size = new_size
+        self._init_storage()
+
+    def _reserve(self, total):
+        """
+        Одразу збільшує таблицю до розміру, достатнього для total елементів,
+        щоб пакетна вставка не викликала проміжних рехешувань.
+
+        Args:
+            total (int): Очікувана кількість елементів після вставки
+        """
+        if self.max_load_factor is None:
+            return
+        new_size = self.size
+        while total > self.max_load_factor * new_size:
+            new_size *= 2
+        if new_size != self.size:
+            self._resize(new_size)
+            self._finish_rehash()
+
+    def _maybe_grow(self):
+        """
+        Збільшує таблицю вдвічі, якщо перевищено max_load_factor.
+        """
+        if (self.max_load_factor is not None
+                and self._count > self.max_load_factor * self.size):
+            self._resize(self.size * 2)
+
+    def _maybe_shrink(self):
+        """
+        Зменшує таблицю вдвічі, якщо коефіцієнт заповнення впав нижче
+        min_load_factor.
+        """
+        if (self.min_load_factor is not None
+                and self.size > self._min_size
+                and self._count < self.min_load_factor * self.size):
+            self._resize(max(self._min_size, self.size // 2))
+
+    def load_factor(self):
+        """
+        Повертає поточний коефіцієнт заповнення таблиці.
+
+        Returns:
+            float: Відношення кількості елементів до кількості кошиків
+        """
+        return self._count / self.size
+
+    def _find(self, key):
+        """
+        Спільне ядро пошуку: один прохід по ланцюжку, в якому може бути ключ.
+
+        Args:
+            key: Ключ для пошуку
+
+        Returns:
+            tuple: (повний хеш ключа, ланцюжок з ключем або None,
+                позиція пари в ланцюжку або -1)
+        """
+        key_hash = self._key_hash(key)
+
+        # Ключ може ще знаходитися у не перенесеному кошику старої таблиці
+        if self._old_table is not None:
+            old_index = self._reduce(key_hash, self._old_size)
+            if old_index >= self._rehash_index:
+                old_bucket = self._old_table[old_index]
+                if old_bucket:
+                    for i, pair in enumerate(old_bucket):
+                        if pair[0] == key:
+                            return key_hash, old_bucket, i
+
+        bucket = self.table[self._reduce(key_hash, self.size)]
+        if bucket:
+            for i, pair in enumerate(bucket):
+                if pair[0] == key:
+                    return key_hash, bucket, i
+        return key_hash, None, -1
+
+    def _add(self, key_hash, key, value):
+        """
+        Додає новий ключ, якого гарантовано немає в таблиці.
+
+        Args:
+            key_hash (int): Повний хеш ключа
+            key: Ключ для вставки
+            value: Значення для вставки
+        """
+        # Пара [ключ, значення, хеш]: хеш зберігається для рехешування
+        key_value = [key, value, key_hash]
+        index = self._reduce(key_hash, self.size)
+        if not self.table[index]:
+            self.table[index] = [key_value]
+        else:
+            self.table[index].append(key_value)
+
+        self._count += 1
+        self._version += 1
+        self._rehash_step()
+        self._maybe_grow()
+
+    def _remove(self, bucket, position):
+        """
+        Видаляє пару з ланцюжка та повертає її значення.
+
+        Args:
+            bucket (list): Ланцюжок, що містить пару
+            position (int): Позиція пари в ланцюжку
+
+        Returns:
+            Значення видаленої пари
+        """
+        value = bucket[position][1]
+        del bucket[position]
+        self._count -= 1
+        self._version += 1
+        self._rehash_step()
+        self._maybe_shrink()
+        return value
 
     def insert(self, key, value):
         """
@@ -39,138 +436,1642 @@ class HashTable:
         Returns:
             bool: True, якщо операція успішна
         """
-        key_hash = self.hash_function(key)
-        key_value = [key, value]
-
-        if not self.table[key_hash]:
-            self.table[key_hash] = [key_value]
-            return True
+        key_hash, bucket, position = self._find(key)
+        if bucket is not None:
+            bucket[position][1] = value  # Оновлюємо значення
         else:
-            # Перевіряємо, чи існує вже такий ключ
-            for pair in self.table[key_hash]:
+            self._add(key_hash, key, value)
+        return True
+
+    def get(self, key, default=None):
+        """
+        Повертає значення за ключем.
+        
+        Args:
+            key: Ключ для пошуку
+            default: Значення, що повертається для відсутнього ключа
+            
+        Returns:
+            Значення, пов'язане з ключем, або default, якщо ключ не знайдено
+        """
+        _, bucket, position = self._find(key)
+        if bucket is None:
+            return default
+        return bucket[position][1]
+
+    def setdefault(self, key, default=None):
+        """
+        Повертає значення ключа, вставляючи default, якщо ключа немає.
+
+        Args:
+            key: Ключ для пошуку
+            default: Значення для вставки відсутнього ключа
+
+        Returns:
+            Наявне значення або default
+        """
+        key_hash, bucket, position = self._find(key)
+        if bucket is not None:
+            return bucket[position][1]
+        self._add(key_hash, key, default)
+        return default
+
+    def pop(self, key, default=_MISSING):
+        """
+        Видаляє ключ та повертає його значення.
+
+        Args:
+            key: Ключ для видалення
+            default: Значення для відсутнього ключа
+
+        Returns:
+            Значення видаленого ключа або default
+
+        Raises:
+            KeyError: Якщо ключа немає і default не задано
+        """
+        _, bucket, position = self._find(key)
+        if bucket is None:
+            if default is _MISSING:
+                raise KeyError(key)
+            return default
+        return self._remove(bucket, position)
+
+    def delete(self, key):
+        """
+        Видаляє пару ключ-значення з хеш-таблиці.
+        
+        Args:
+            key: Ключ для видалення
+            
+        Returns:
+            bool: True, якщо ключ було знайдено та видалено, False - інакше
+        """
+        _, bucket, position = self._find(key)
+        if bucket is None:
+            # Ключ не знайдено
+            return False
+        self._remove(bucket, position)
+        return True
+
+    def insert_many(self, pairs):
+        """
+        Вставляє пакет пар ключ-значення.
+
+        Таблиця збільшується один раз під розмір усього пакета, тому вставка
+        не викликає проміжних рехешувань.
+
+        Args:
+            pairs: Ітерабельний об'єкт пар (ключ, значення)
+
+        Returns:
+            int: Кількість доданих нових ключів
+        """
+        pairs = list(pairs)
+        self._reserve(self._count + len(pairs))
+        # Пакетна операція завершує розпочате рехешування, щоб далі
+        # працювати лише з однією таблицею
+        self._finish_rehash()
+
+        table = self.table
+        size = self.size
+        key_hash_of = self._key_hash
+        reduce = self._reduce
+        added = 0
+        for key, value in pairs:
+            key_hash = key_hash_of(key)
+            index = reduce(key_hash, size)
+            bucket = table[index]
+            if not bucket:
+                table[index] = [[key, value, key_hash]]
+                added += 1
+                continue
+            for pair in bucket:
                 if pair[0] == key:
-                    pair[1] = value  # Оновлюємо значення
-                    return True
-            # Якщо ключ не знайдено, додаємо нову пару
-            self.table[key_hash].append(key_value)
-            return True
+                    pair[1] = value
+                    break
+            else:
+                bucket.append([key, value, key_hash])
+                added += 1
+
+        if added:
+            self._count += added
+            self._version += 1
+            # Ключі у пакеті можуть повторюватися, тому розмір перевіряємо
+            # ще раз за фактичною кількістю
+            self._maybe_grow()
+        return added
+
+    def update(self, other):
+        """
+        Оновлює таблицю парами з іншого відображення, як dict.update.
+
+        Args:
+            other: Словник, HashTable або ітерабельний об'єкт пар
+
+        Returns:
+            int: Кількість доданих нових ключів
+        """
+        if hasattr(other, "items"):
+            other = other.items()
+        return self.insert_many(other)
+
+    def get_many(self, keys, default=None):
+        """
+        Повертає значення для пакета ключів.
+
+        Args:
+            keys: Ітерабельний об'єкт ключів
+            default: Значення для відсутніх ключів
+
+        Returns:
+            list: Значення у порядку ключів
+        """
+        if self._old_table is not None:
+            # Під час рехешування ключ може бути ще у старій таблиці
+            get = self.get
+            return [get(key, default) for key in keys]
+
+        table = self.table
+        index = self.hash_function
+        values = []
+        for key in keys:
+            value = default
+            bucket = table[index(key)]
+            if bucket:
+                for pair in bucket:
+                    if pair[0] == key:
+                        value = pair[1]
+                        break
+            values.append(value)
+        return values
+
+    def delete_many(self, keys):
+        """
+        Видаляє пакет ключів.
+
+        Таблиця зменшується (якщо задано min_load_factor) один раз після
+        видалення всього пакета.
+
+        Args:
+            keys: Ітерабельний об'єкт ключів
+
+        Returns:
+            int: Кількість видалених ключів
+        """
+        self._finish_rehash()
+        table = self.table
+        index = self.hash_function
+        removed = 0
+        for key in keys:
+            bucket = table[index(key)]
+            if not bucket:
+                continue
+            for i, pair in enumerate(bucket):
+                if pair[0] == key:
+                    del bucket[i]
+                    removed += 1
+                    break
+
+        if removed:
+            self._count -= removed
+            self._version += 1
+            self._shrink_to_fit()
+        return removed
+
+    def _shrink_to_fit(self):
+        """
+        Зменшує таблицю одразу до найменшого розміру, що задовольняє
+        min_load_factor, замість кількох послідовних зменшень удвічі.
+        """
+        if self.min_load_factor is None:
+            return
+        new_size = self.size
+        while new_size > self._min_size and self._count < self.min_load_factor * new_size:
+            new_size = max(self._min_size, new_size // 2)
+        if new_size != self.size:
+            self._resize(new_size)
+
+    def _buckets(self):
+        """
+        Перебирає всі непорожні ланцюжки, включно з ще не перенесеними.
+
+        Yields:
+            list: Ланцюжок нової або старої таблиці
+        """
+        for bucket in self.table:
+            if bucket:
+                yield bucket
+        if self._old_table is not None:
+            for bucket in self._old_table:
+                if bucket:
+                    yield bucket
+
+    def _pairs(self):
+        """
+        Перебирає всі пари ключ-значення таблиці.
+
+        Yields:
+            tuple: Пара (ключ, значення)
+        """
+        for bucket in self._buckets():
+            for pair in bucket:
+                yield pair[0], pair[1]
+
+    def _checked_pairs(self):
+        """
+        Перебирає пари ключ-значення, перевіряючи, що таблиця не змінилася.
+
+        Yields:
+            tuple: Пара (ключ, значення)
+
+        Raises:
+            RuntimeError: Якщо під час перебору додано чи видалено ключ
+        """
+        version = self._version
+        for pair in self._pairs():
+            yield pair
+            if self._version != version:
+                raise RuntimeError("HashTable змінилася під час перебору")
+
+    def save(self, path):
+        """
+        Зберігає таблицю у двійковий знімок, який можна відкрити через
+        HashTable.load без повторної вставки всіх елементів.
+
+        Ключами знімка можуть бути рядки, байти, None, числа, а також
+        кортежі та frozenset з таких ключів; значення - будь-які об'єкти,
+        що підтримують pickle.
+
+        Args:
+            path (str): Шлях до файлу знімка
+
+        Raises:
+            TypeError: Якщо тип ключа не підтримується (файл не змінюється)
+        """
+        count = len(self)
+        bucket_count = max(1, count)
+        records = []
+        buckets = array('Q')
+        for key, value in self._pairs():
+            encoded = _encode_key(key)
+            records.append((encoded, pickle.dumps(value, protocol=4)))
+            buckets.append(_snapshot_bucket(encoded, bucket_count))
+        order = sorted(range(len(records)), key=buckets.__getitem__)
+
+        # Зміщення кошика i - початок його першого запису; кошик i
+        # займає діапазон [offsets[i], offsets[i + 1])
+        offsets = array('Q', bytes(8 * (bucket_count + 1)))
+        position = _SNAPSHOT_HEADER.size + len(offsets) * _SNAPSHOT_OFFSET.size
+        bucket = 0
+        for i in order:
+            while bucket <= buckets[i]:
+                offsets[bucket] = position
+                bucket += 1
+            encoded, value = records[i]
+            position += _SNAPSHOT_RECORD.size + len(encoded) + len(value)
+        while bucket <= bucket_count:
+            offsets[bucket] = position
+            bucket += 1
+
+        # Запис у тимчасовий файл із подальшою заміною, щоб відкритий
+        # знімок ніколи не був записаний частково
+        temp_path = f"{path}.tmp"
+        with open(temp_path, "wb") as f:
+            f.write(_SNAPSHOT_HEADER.pack(_SNAPSHOT_MAGIC, _SNAPSHOT_VERSION, 0,
+                                          bucket_count, count))
+            f.write(b"".join(_SNAPSHOT_OFFSET.pack(offset) for offset in offsets))
+            for i in order:
+                encoded, value = records[i]
+                f.write(_SNAPSHOT_RECORD.pack(len(encoded), len(value)))
+                f.write(encoded)
+                f.write(value)
+        os.replace(temp_path, path)
+
+    @classmethod
+    def load(cls, path):
+        """
+        Відкриває знімок, збережений методом save, лише для читання.
+
+        Args:
+            path (str): Шлях до файлу знімка
+
+        Returns:
+            SnapshotHashTable: Таблиця, що читає дані безпосередньо з файлу
+        """
+        return SnapshotHashTable(path)
+
+    def display(self):
+        """
+        Виводить весь вміст хеш-таблиці для відладки.
+        """
+        print("Хеш-таблиця:")
+        for i, bucket in enumerate(self.table):
+            if bucket:
+                print(f"  Індекс {i}: {[(pair[0], pair[1]) for pair in bucket]}")
+            else:
+                print(f"  Індекс {i}: порожньо")
+        if self._old_table is not None:
+            print(f"  Рехешування: перенесено {self._rehash_index} з {self._old_size} кошиків")
+            for i in range(self._rehash_index, self._old_size):
+                if self._old_table[i]:
+                    pairs = [(pair[0], pair[1]) for pair in self._old_table[i]]
+                    print(f"  Стара таблиця, індекс {i}: {pairs}")
+
+    def keys(self):
+        """
+        Повертає ліниве представлення всіх ключів у хеш-таблиці.
+        
+        Returns:
+            HashTableKeysView: Представлення ключів
+        """
+        return HashTableKeysView(self)
+
+    def values(self):
+        """
+        Повертає ліниве представлення всіх значень у хеш-таблиці.
+        
+        Returns:
+            HashTableValuesView: Представлення значень
+        """
+        return HashTableValuesView(self)
+
+    def items(self):
+        """
+        Повертає ліниве представлення всіх пар ключ-значення у хеш-таблиці.
+        
+        Returns:
+            HashTableItemsView: Представлення кортежів (ключ, значення)
+        """
+        return HashTableItemsView(self)
+
+    def __iter__(self):
+        """
+        Перебирає ключі хеш-таблиці без створення проміжного списку.
+        
+        Returns:
+            iterator: Ітератор ключів
+        """
+        return iter(self.keys())
+
+    def __len__(self):
+        """
+        Повертає кількість елементів у хеш-таблиці.
+        
+        Returns:
+            int: Кількість елементів
+        """
+        # Лічильник оновлюється при вставці нового ключа та видаленні,
+        # тому len() не обходить кошики
+        return self._count
+
+    def __contains__(self, key):
+        """
+        Перевіряє, чи містить хеш-таблиця заданий ключ.
+        
+        Args:
+            key: Ключ для перевірки
+            
+        Returns:
+            bool: True, якщо ключ існує, False - інакше
+        """
+        # Значення не порівнюється з None, тому ключ зі значенням None
+        # теж вважається наявним
+        return self._find(key)[1] is not None
+
+class OpenAddressingHashTable(HashTable):
+    """
+    Хеш-таблиця з відкритою адресацією та лінійним пробуванням.
+
+    Ключі, значення та хеші ключів зберігаються у трьох паралельних плоских
+    масивах, тому запис не потребує окремого списку-пари та ланцюжка.
+    Видалений слот позначається надгробком (_DELETED), щоб не розривати
+    послідовність пробування для інших ключів.
+
+    Зазвичай створюється через HashTable(size, storage="open_addressing").
+    """
+
+    def __init__(self, size=8, max_load_factor=0.75, min_load_factor=None,
+                 rehash_step=4, *, storage="open_addressing", items=None,
+                 hash_strategy="modulo"):
+        """
+        Ініціалізує таблицю з відкритою адресацією.
+
+        Args:
+            size (int): Початкова кількість слотів
+            max_load_factor (float): Максимальна частка зайнятих слотів
+                (разом з надгробками), має бути меншою за 1
+            min_load_factor (float): Коефіцієнт заповнення для зменшення
+                таблиці (None - без зменшення)
+            rehash_step (int): Не використовується - при зміні розміру
+                таблиця перебудовується повністю, оскільки послідовності
+                пробування охоплюють увесь масив
+            storage (str): Завжди "open_addressing"
+            items: Початковий вміст - словник, HashTable або ітерабельний
+                об'єкт пар (ключ, значення)
+            hash_strategy: Назва або екземпляр стратегії хешування
+        """
+        if max_load_factor is None or not 0 < max_load_factor < 1:
+            raise ValueError("Для відкритої адресації max_load_factor має бути в (0, 1)")
+        super().__init__(size, max_load_factor, min_load_factor, rehash_step,
+                         storage="open_addressing", items=items,
+                         hash_strategy=hash_strategy)
+
+    def _init_storage(self):
+        """
+        Створює порожні паралельні масиви ключів, значень та хешів.
+        """
+        self._keys = [_EMPTY] * self.size
+        self._values = [None] * self.size
+        self._hashes = array('q', bytes(8 * self.size))
+        self._tombstones = 0
+
+    def _probe(self, key, key_hash):
+        """
+        Шукає слот ключа лінійним пробуванням.
+
+        Args:
+            key: Ключ для пошуку
+            key_hash (int): Повний хеш ключа
+
+        Returns:
+            tuple: (слот ключа або -1, перший слот, придатний для вставки)
+        """
+        keys = self._keys
+        hashes = self._hashes
+        size = self.size
+        index = self._reduce(key_hash, size)
+        free = -1
+
+        while True:
+            slot_key = keys[index]
+            if slot_key is _EMPTY:
+                return -1, (index if free < 0 else free)
+            if slot_key is _DELETED:
+                if free < 0:
+                    free = index
+            elif hashes[index] == key_hash and (slot_key is key or slot_key == key):
+                return index, free
+            index += 1
+            if index == size:
+                index = 0
+
+    def _resize(self, new_size):
+        """
+        Перебудовує масиви під новий розмір, відкидаючи надгробки.
+
+        Args:
+            new_size (int): Нова кількість слотів
+        """
+        old_keys = self._keys
+        old_values = self._values
+        old_hashes = self._hashes
+        self.size = new_size
+        self._init_storage()
+
+        keys = self._keys
+        values = self._values
+        hashes = self._hashes
+        for slot_key, value, key_hash in zip(old_keys, old_values, old_hashes):
+            if slot_key is _EMPTY or slot_key is _DELETED:
+                continue
+            index = self._reduce(key_hash, new_size)
+            while keys[index] is not _EMPTY:
+                index += 1
+                if index == new_size:
+                    index = 0
+            keys[index] = slot_key
+            values[index] = value
+            hashes[index] = key_hash
+
+    def _maybe_grow(self):
+        """
+        Перебудовує таблицю, коли зайняті слоти та надгробки перевищують
+        max_load_factor. Якщо більшість з них - надгробки, розмір не змінюється.
+        """
+        limit = self.max_load_factor * self.size
+        if self._count + self._tombstones > limit:
+            new_size = self.size * 2 if self._count * 2 > limit else self.size
+            self._resize(new_size)
+
+    def _add(self, free, key, key_hash, value):
+        """
+        Записує новий ключ у вільний слот, знайдений _probe.
+
+        Args:
+            free (int): Вільний слот
+            key: Ключ для вставки
+            key_hash (int): Повний хеш ключа
+            value: Значення для вставки
+        """
+        if self._keys[free] is _DELETED:
+            self._tombstones -= 1
+        self._keys[free] = key
+        self._values[free] = value
+        self._hashes[free] = key_hash
+        self._count += 1
+        self._version += 1
+        self._maybe_grow()
+
+    def _remove(self, slot):
+        """
+        Звільняє слот та повертає значення, що в ньому зберігалося.
+
+        Args:
+            slot (int): Зайнятий слот
+
+        Returns:
+            Значення видаленого ключа
+        """
+        value = self._values[slot]
+        # Якщо наступний слот ніколи не був зайнятий, жодна послідовність
+        # пробування не проходить через цей слот і надгробок не потрібен
+        next_slot = slot + 1 if slot + 1 < self.size else 0
+        if self._keys[next_slot] is _EMPTY:
+            self._keys[slot] = _EMPTY
+        else:
+            self._keys[slot] = _DELETED
+            self._tombstones += 1
+        self._values[slot] = None
+        self._count -= 1
+        self._version += 1
+        self._maybe_shrink()
+        return value
+
+    def insert(self, key, value):
+        """
+        Вставляє пару ключ-значення в хеш-таблицю.
+
+        Args:
+            key: Ключ для вставки
+            value: Значення для вставки
+
+        Returns:
+            bool: True, якщо операція успішна
+        """
+        key_hash = self._key_hash(key)
+        slot, free = self._probe(key, key_hash)
+        if slot >= 0:
+            self._values[slot] = value
+        else:
+            self._add(free, key, key_hash, value)
+        return True
+
+    def get(self, key, default=None):
+        """
+        Повертає значення за ключем.
+
+        Args:
+            key: Ключ для пошуку
+            default: Значення, що повертається для відсутнього ключа
+
+        Returns:
+            Значення, пов'язане з ключем, або default, якщо ключ не знайдено
+        """
+        slot, _ = self._probe(key, self._key_hash(key))
+        if slot < 0:
+            return default
+        return self._values[slot]
+
+    def setdefault(self, key, default=None):
+        """
+        Повертає значення ключа, вставляючи default, якщо ключа немає.
+
+        Args:
+            key: Ключ для пошуку
+            default: Значення для вставки відсутнього ключа
+
+        Returns:
+            Наявне значення або default
+        """
+        key_hash = self._key_hash(key)
+        slot, free = self._probe(key, key_hash)
+        if slot >= 0:
+            return self._values[slot]
+        self._add(free, key, key_hash, default)
+        return default
+
+    def pop(self, key, default=_MISSING):
+        """
+        Видаляє ключ та повертає його значення.
+
+        Args:
+            key: Ключ для видалення
+            default: Значення для відсутнього ключа
+
+        Returns:
+            Значення видаленого ключа або default
+
+        Raises:
+            KeyError: Якщо ключа немає і default не задано
+        """
+        slot, _ = self._probe(key, self._key_hash(key))
+        if slot < 0:
+            if default is _MISSING:
+                raise KeyError(key)
+            return default
+        return self._remove(slot)
+
+    def delete(self, key):
+        """
+        Видаляє пару ключ-значення з хеш-таблиці.
+
+        Args:
+            key: Ключ для видалення
+
+        Returns:
+            bool: True, якщо ключ було знайдено та видалено, False - інакше
+        """
+        slot, _ = self._probe(key, self._key_hash(key))
+        if slot < 0:
+            return False
+        self._remove(slot)
+        return True
+
+    def __contains__(self, key):
+        """
+        Перевіряє, чи містить хеш-таблиця заданий ключ.
+
+        Args:
+            key: Ключ для перевірки
+
+        Returns:
+            bool: True, якщо ключ існує, False - інакше
+        """
+        return self._probe(key, self._key_hash(key))[0] >= 0
+
+    def _reserve(self, total):
+        """
+        Одразу перебудовує таблицю так, щоб total елементів разом з
+        надгробками не перевищували max_load_factor.
+
+        Args:
+            total (int): Очікувана кількість елементів після вставки
+        """
+        new_size = self.size
+        while total > self.max_load_factor * new_size:
+            new_size *= 2
+        if new_size != self.size or total + self._tombstones > self.max_load_factor * new_size:
+            self._resize(new_size)
+
+    def insert_many(self, pairs):
+        """
+        Вставляє пакет пар ключ-значення з однією попередньою перебудовою.
+
+        Args:
+            pairs: Ітерабельний об'єкт пар (ключ, значення)
+
+        Returns:
+            int: Кількість доданих нових ключів
+        """
+        pairs = list(pairs)
+        self._reserve(self._count + len(pairs))
+
+        probe = self._probe
+        key_hash_of = self._key_hash
+        keys = self._keys
+        values = self._values
+        hashes = self._hashes
+        added = 0
+        for key, value in pairs:
+            key_hash = key_hash_of(key)
+            slot, free = probe(key, key_hash)
+            if slot >= 0:
+                values[slot] = value
+                continue
+            if keys[free] is _DELETED:
+                self._tombstones -= 1
+            keys[free] = key
+            values[free] = value
+            hashes[free] = key_hash
+            added += 1
+
+        if added:
+            self._count += added
+            self._version += 1
+        return added
+
+    def get_many(self, keys, default=None):
+        """
+        Повертає значення для пакета ключів.
+
+        Args:
+            keys: Ітерабельний об'єкт ключів
+            default: Значення для відсутніх ключів
+
+        Returns:
+            list: Значення у порядку ключів
+        """
+        slot_keys = self._keys
+        values = self._values
+        hashes = self._hashes
+        size = self.size
+        key_hash_of = self._key_hash
+        reduce = self._reduce
+        result = []
+        append = result.append
+        for key in keys:
+            # Пробування вбудовано в цикл: пошуку не потрібен вільний слот,
+            # який додатково обчислює _probe
+            key_hash = key_hash_of(key)
+            index = reduce(key_hash, size)
+            while True:
+                slot_key = slot_keys[index]
+                if slot_key is _EMPTY:
+                    append(default)
+                    break
+                if (slot_key is not _DELETED and hashes[index] == key_hash
+                        and (slot_key is key or slot_key == key)):
+                    append(values[index])
+                    break
+                index += 1
+                if index == size:
+                    index = 0
+        return result
+
+    def delete_many(self, keys):
+        """
+        Видаляє пакет ключів, перевіряючи потребу в зменшенні один раз.
+
+        Args:
+            keys: Ітерабельний об'єкт ключів
+
+        Returns:
+            int: Кількість видалених ключів
+        """
+        probe = self._probe
+        key_hash_of = self._key_hash
+        slot_keys = self._keys
+        values = self._values
+        removed = 0
+        for key in keys:
+            slot, _ = probe(key, key_hash_of(key))
+            if slot < 0:
+                continue
+            slot_keys[slot] = _DELETED
+            values[slot] = None
+            removed += 1
+
+        if removed:
+            self._count -= removed
+            self._tombstones += removed
+            self._version += 1
+            self._shrink_to_fit()
+        return removed
+
+    def _pairs(self):
+        """
+        Перебирає всі пари ключ-значення таблиці.
+
+        Yields:
+            tuple: Пара (ключ, значення)
+        """
+        for slot_key, value in zip(self._keys, self._values):
+            if slot_key is not _EMPTY and slot_key is not _DELETED:
+                yield slot_key, value
+
+    def display(self):
+        """
+        Виводить вміст усіх слотів таблиці для відладки.
+        """
+        print("Хеш-таблиця (відкрита адресація):")
+        for i, slot_key in enumerate(self._keys):
+            if slot_key is _EMPTY:
+                print(f"  Слот {i}: порожньо")
+            elif slot_key is _DELETED:
+                print(f"  Слот {i}: видалено")
+            else:
+                print(f"  Слот {i}: {slot_key!r} = {self._values[i]!r}")
+
+class ConcurrentHashTable(HashTable):
+    """
+    Потокобезпечна хеш-таблиця з розподілом замків по смугах кошиків.
+
+    Кошик з індексом i захищає замок i % stripes, тому записи в різні смуги
+    не блокують один одного. Ланцюжки змінюються за принципом копіювання
+    при записі (кошик замінюється новим списком), тож читання виконується
+    без замків: читач завжди бачить узгоджений ланцюжок. Зміна розміру
+    захоплює всі замки та перебудовує таблицю повністю, після чого нова
+    таблиця підміняє стару одним присвоєнням.
+    """
+
+    def __init__(self, size=8, max_load_factor=0.75, min_load_factor=None,
+                 *, stripes=16, items=None, hash_strategy="modulo"):
+        """
+        Ініціалізує потокобезпечну хеш-таблицю.
+
+        Args:
+            size (int): Початковий розмір хеш-таблиці
+            max_load_factor (float): Коефіцієнт заповнення для росту
+                (None - без росту)
+            min_load_factor (float): Коефіцієнт заповнення для зменшення
+                (None - без зменшення)
+            stripes (int): Кількість замків, між якими розподілено кошики
+            items: Початковий вміст - словник, HashTable або ітерабельний
+                об'єкт пар (ключ, значення)
+            hash_strategy: Назва або екземпляр стратегії хешування
+        """
+        if stripes < 1:
+            raise ValueError("Кількість смуг має бути додатною")
+        self._stripes = stripes
+        self._locks = [threading.Lock() for _ in range(stripes)]
+        # Лічильник ведеться окремо для кожної смуги під її замком,
+        # загальна кількість - сума лічильників
+        self._stripe_counts = [0] * stripes
+        # Записи в різні смуги виконуються паралельно, тож "+= 1" могло б
+        # загубити оновлення версії. next() лічильника атомарний, і кожен
+        # запис отримує нову, ще не використану версію
+        self._versions = itertools.count(1)
+        super().__init__(size, max_load_factor, min_load_factor,
+                         storage="chaining", items=items,
+                         hash_strategy=hash_strategy)
+
+    def _lock_bucket(self, key_hash):
+        """
+        Захоплює замок смуги, до якої належить кошик ключа.
+
+        Якщо поки очікувався замок таблицю було перебудовано, індекс
+        обчислюється заново для нової таблиці.
+
+        Args:
+            key_hash (int): Повний хеш ключа
+
+        Returns:
+            tuple: (таблиця, індекс кошика, номер смуги) із захопленим замком
+        """
+        while True:
+            table = self.table
+            index = self._reduce(key_hash, len(table))
+            stripe = index % self._stripes
+            self._locks[stripe].acquire()
+            if table is self.table:
+                return table, index, stripe
+            self._locks[stripe].release()
+
+    def _rebuild(self, expected_size, new_size):
+        """
+        Перебудовує таблицю під новий розмір, утримуючи всі замки.
+
+        Args:
+            expected_size (int): Розмір, для якого було прийнято рішення;
+                якщо інший потік уже змінив розмір, перебудова пропускається
+            new_size (int): Нова кількість кошиків
+        """
+        # Замки захоплюються завжди в одному порядку, а записи утримують
+        # не більше одного замка, тому взаємне блокування неможливе
+        for lock in self._locks:
+            lock.acquire()
+        try:
+            if self.size != expected_size:
+                return
+            new_table = [None] * new_size
+            for bucket in self.table:
+                if not bucket:
+                    continue
+                for pair in bucket:
+                    index = self._reduce(pair[2], new_size)
+                    if new_table[index]:
+                        new_table[index].append(pair)
+                    else:
+                        new_table[index] = [pair]
+            self.table = new_table
+            self.size = new_size
+            self._version = next(self._versions)
+        finally:
+            for lock in reversed(self._locks):
+                lock.release()
+
+    def _resize(self, new_size):
+        """
+        Змінює розмір одразу повністю, оскільки поступове перенесення
+        потребувало б координації всіх смуг на кожній операції.
+        """
+        self._rebuild(self.size, new_size)
+
+    def _maybe_grow(self):
+        """
+        Збільшує таблицю вдвічі, якщо перевищено max_load_factor.
+        """
+        size = self.size
+        if self.max_load_factor is not None and len(self) > self.max_load_factor * size:
+            self._rebuild(size, size * 2)
+
+    def _maybe_shrink(self):
+        """
+        Зменшує таблицю вдвічі, якщо коефіцієнт заповнення впав нижче
+        min_load_factor.
+        """
+        size = self.size
+        if (self.min_load_factor is not None
+                and size > self._min_size
+                and len(self) < self.min_load_factor * size):
+            self._rebuild(size, max(self._min_size, size // 2))
+
+    def _find_in(self, table, key):
+        """
+        Шукає пару ключа у знімку таблиці без замків.
+
+        Args:
+            table (list): Знімок self.table
+            key: Ключ для пошуку
+
+        Returns:
+            list: Пара [ключ, значення] або None
+        """
+        bucket = table[self._reduce(self._key_hash(key), len(table))]
+        if bucket:
+            for pair in bucket:
+                if pair[0] == key:
+                    return pair
+        return None
+
+    def _put(self, key, value, overwrite=True):
+        """
+        Вставляє або оновлює ключ під замком його смуги.
+
+        Args:
+            key: Ключ для вставки
+            value: Значення для вставки
+            overwrite (bool): Чи оновлювати значення наявного ключа
+
+        Returns:
+            tuple: (чи додано новий ключ, поточне значення ключа)
+        """
+        key_hash = self._key_hash(key)
+        table, index, stripe = self._lock_bucket(key_hash)
+        try:
+            bucket = table[index]
+            if bucket:
+                for pair in bucket:
+                    if pair[0] == key:
+                        if overwrite:
+                            pair[1] = value
+                        return False, pair[1]
+                table[index] = bucket + [[key, value, key_hash]]
+            else:
+                table[index] = [[key, value, key_hash]]
+            self._stripe_counts[stripe] += 1
+            self._version = next(self._versions)
+        finally:
+            self._locks[stripe].release()
+        self._maybe_grow()
+        return True, value
+
+    def _take(self, key):
+        """
+        Видаляє ключ під замком його смуги.
+
+        Args:
+            key: Ключ для видалення
+
+        Returns:
+            list: Видалена пара [ключ, значення] або None
+        """
+        table, index, stripe = self._lock_bucket(self._key_hash(key))
+        try:
+            bucket = table[index]
+            if not bucket:
+                return None
+            for i, pair in enumerate(bucket):
+                if pair[0] == key:
+                    table[index] = bucket[:i] + bucket[i + 1:]
+                    self._stripe_counts[stripe] -= 1
+                    self._version = next(self._versions)
+                    break
+            else:
+                return None
+        finally:
+            self._locks[stripe].release()
+        self._maybe_shrink()
+        return pair
+
+    def insert(self, key, value):
+        """
+        Вставляє або оновлює пару ключ-значення.
+
+        Returns:
+            bool: True, якщо операція успішна
+        """
+        self._put(key, value)
+        return True
+
+    def get(self, key, default=None):
+        """
+        Повертає значення за ключем без захоплення замків.
+
+        Returns:
+            Значення ключа або default, якщо ключ не знайдено
+        """
+        pair = self._find_in(self.table, key)
+        return default if pair is None else pair[1]
+
+    def setdefault(self, key, default=None):
+        """
+        Атомарно повертає наявне значення або вставляє default.
+
+        Returns:
+            Наявне значення або default
+        """
+        return self._put(key, default, overwrite=False)[1]
+
+    def pop(self, key, default=_MISSING):
+        """
+        Атомарно видаляє ключ та повертає його значення.
+
+        Raises:
+            KeyError: Якщо ключа немає і default не задано
+        """
+        pair = self._take(key)
+        if pair is None:
+            if default is _MISSING:
+                raise KeyError(key)
+            return default
+        return pair[1]
+
+    def delete(self, key):
+        """
+        Видаляє пару ключ-значення.
+
+        Returns:
+            bool: True, якщо ключ було знайдено та видалено, False - інакше
+        """
+        return self._take(key) is not None
+
+    def insert_many(self, pairs):
+        """
+        Вставляє пакет пар, попередньо збільшивши таблицю один раз.
+
+        Args:
+            pairs: Ітерабельний об'єкт пар (ключ, значення)
+
+        Returns:
+            int: Кількість доданих нових ключів
+        """
+        pairs = list(pairs)
+        self._reserve(len(self) + len(pairs))
+        put = self._put
+        return sum(put(key, value)[0] for key, value in pairs)
+
+    def get_many(self, keys, default=None):
+        """
+        Повертає значення для пакета ключів.
+
+        Returns:
+            list: Значення у порядку ключів
+        """
+        get = self.get
+        return [get(key, default) for key in keys]
+
+    def delete_many(self, keys):
+        """
+        Видаляє пакет ключів.
+
+        Returns:
+            int: Кількість видалених ключів
+        """
+        take = self._take
+        return sum(take(key) is not None for key in keys)
+
+    def load_factor(self):
+        """
+        Повертає поточний коефіцієнт заповнення таблиці.
+        """
+        return len(self) / self.size
+
+    def __len__(self):
+        """
+        Повертає кількість елементів як суму лічильників смуг.
+        """
+        return sum(self._stripe_counts)
+
+    def __contains__(self, key):
+        """
+        Перевіряє наявність ключа без захоплення замків.
+        """
+        return self._find_in(self.table, key) is not None
+
+
+class _CacheEntry:
+    """Вузол двозв'язного списку LRU, що одночасно є записом кешу."""
+
+    __slots__ = ("key", "value", "expires", "prev", "next")
+
+    def __init__(self, key=None, value=None, expires=None):
+        self.key = key
+        self.value = value
+        self.expires = expires
+        self.prev = self
+        self.next = self
+
+
+class LRUCache:
+    """
+    Обмежений кеш з витісненням найдавніше використаних записів (LRU)
+    та необов'язковим часом життя (TTL) записів.
+
+    Записи зберігаються в HashTable, а порядок використання - у
+    двозв'язному списку, що проходить через самі записи, тому get, insert
+    та delete виконуються за O(1).
+    """
+
+    def __init__(self, capacity, ttl=None, clock=time.monotonic, **table_options):
+        """
+        Ініціалізує кеш.
+
+        Args:
+            capacity (int): Максимальна кількість записів
+            ttl (float): Час життя запису в секундах за замовчуванням
+                (None - записи не застарівають)
+            clock (callable): Джерело поточного часу
+            **table_options: Параметри внутрішньої HashTable; початковий
+                вміст items (словник, HashTable або пари) додається через
+                insert, тож враховує місткість і ttl
+        """
+        if capacity < 1:
+            raise ValueError("Місткість кешу має бути додатною")
+        self.capacity = capacity
+        self.ttl = ttl
+        self._clock = clock
+        # Таблиця зберігає записи _CacheEntry, тому items не можна
+        # передавати їй напряму
+        items = table_options.pop("items", None)
+        self._table = HashTable(**table_options)
+        # Кільцевий список з вузлом-охоронцем: head.next - найсвіжіший запис,
+        # head.prev - найдавніший
+        self._head = _CacheEntry()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        if items is not None:
+            if hasattr(items, "items"):
+                items = items.items()
+            for key, value in items:
+                self.insert(key, value)
+
+    def _unlink(self, entry):
+        """Вилучає запис зі списку LRU."""
+        entry.prev.next = entry.next
+        entry.next.prev = entry.prev
+
+    def _push_front(self, entry):
+        """Додає запис на початок списку LRU як найсвіжіший."""
+        head = self._head
+        entry.prev = head
+        entry.next = head.next
+        head.next.prev = entry
+        head.next = entry
+
+    def _expired(self, entry):
+        """Перевіряє, чи минув час життя запису."""
+        return entry.expires is not None and entry.expires <= self._clock()
+
+    def _drop(self, entry):
+        """Видаляє запис з таблиці та списку LRU."""
+        self._table.delete(entry.key)
+        self._unlink(entry)
+
+    def get(self, key, default=None):
+        """
+        Повертає значення за ключем та позначає запис як найсвіжіший.
+
+        Args:
+            key: Ключ для пошуку
+            default: Значення для відсутнього або застарілого ключа
+
+        Returns:
+            Значення ключа або default
+        """
+        entry = self._table.get(key)
+        if entry is None:
+            self.misses += 1
+            return default
+        if self._expired(entry):
+            self._drop(entry)
+            self.expirations += 1
+            self.misses += 1
+            return default
+
+        self._unlink(entry)
+        self._push_front(entry)
+        self.hits += 1
+        return entry.value
+
+    def insert(self, key, value, ttl=None):
+        """
+        Вставляє або оновлює запис, витісняючи найдавніший при переповненні.
+
+        Args:
+            key: Ключ для вставки
+            value: Значення для вставки
+            ttl (float): Час життя цього запису (None - ttl кешу)
+
+        Returns:
+            bool: True, якщо операція успішна
+        """
+        if ttl is None:
+            ttl = self.ttl
+        expires = None if ttl is None else self._clock() + ttl
+
+        entry = self._table.get(key)
+        if entry is not None:
+            entry.value = value
+            entry.expires = expires
+            self._unlink(entry)
+            self._push_front(entry)
+            return True
+
+        entry = _CacheEntry(key, value, expires)
+        self._table.insert(key, entry)
+        self._push_front(entry)
+        if len(self._table) > self.capacity:
+            self._drop(self._head.prev)
+            self.evictions += 1
+        return True
+
+    def delete(self, key):
+        """
+        Видаляє запис з кешу.
+
+        Args:
+            key: Ключ для видалення
+
+        Returns:
+            bool: True, якщо ключ було знайдено та видалено, False - інакше
+        """
+        entry = self._table.pop(key, None)
+        if entry is None:
+            return False
+        self._unlink(entry)
+        return True
+
+    def stats(self):
+        """
+        Повертає лічильники роботи кешу.
+
+        Returns:
+            dict: Кількість влучань, промахів, витіснень та застарілих записів
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+        }
+
+    def __len__(self):
+        """
+        Повертає кількість записів, включно із застарілими, які ще не
+        були прочитані або витіснені.
+        """
+        return len(self._table)
+
+    def __contains__(self, key):
+        """
+        Перевіряє наявність незастарілого запису, не змінюючи порядок LRU
+        та лічильники.
+        """
+        entry = self._table.get(key)
+        return entry is not None and not self._expired(entry)
+
+
+# Формат знімка: заголовок, таблиця зміщень кошиків (bucket_count + 1 чисел),
+# далі записи, згруповані за кошиками
+_SNAPSHOT_MAGIC = b"HTSNAP01"
+_SNAPSHOT_HEADER = struct.Struct("<8sIIQQ")  # magic, версія, резерв, кошики, елементи
+_SNAPSHOT_OFFSET = struct.Struct("<Q")
+_SNAPSHOT_RANGE = struct.Struct("<QQ")
+_SNAPSHOT_RECORD = struct.Struct("<II")  # довжина ключа, довжина значення
+_SNAPSHOT_VERSION = 2
+
+
+_KEY_LENGTH = struct.Struct("<I")
+
+
+def _encode_key(key):
+    """
+    Кодує ключ у байти, однакові для рівних ключів у будь-якому процесі.
+
+    Підтримуються рядки, байти, None, числа (рівні між собою числа
+    різних типів, як-от 1, 1.0 і True, кодуються однаково), а також
+    кортежі та frozenset з таких ключів. Елементи frozenset
+    упорядковуються за кодуванням, тож результат не залежить від
+    порядку їх перебору.
+
+    Args:
+        key: Ключ для кодування
+
+    Returns:
+        bytes: Закодований ключ
+
+    Raises:
+        TypeError: Якщо тип ключа (або його елемента) не підтримується
+    """
+    if isinstance(key, str):
+        return b"s" + key.encode("utf-8", "surrogatepass")
+    if isinstance(key, bytes):
+        return b"b" + key
+    if key is None:
+        return b"n"
+    if isinstance(key, tuple):
+        return b"t" + b"".join(_pack_key(item) for item in key)
+    if isinstance(key, frozenset):
+        return b"z" + b"".join(sorted(_pack_key(item) for item in key))
+    integral = key if isinstance(key, int) else _as_integral(key)
+    if integral is not None:
+        return b"i" + integral.to_bytes(integral.bit_length() // 8 + 1, "little", signed=True)
+    # Дробове число зберігається як float, якщо воно йому дорівнює
+    # (Fraction(1, 2) == 0.5), інакше рівність між типами не відтворити
+    try:
+        number = float(key)
+    except (TypeError, ValueError, OverflowError):
+        number = None
+    if number is not None and (number == key or isinstance(key, float)):
+        return b"f" + struct.pack("<d", number)
+    raise TypeError(f"Ключ типу {type(key).__name__!r} не підтримується у знімку HashTable")
+
+
+def _pack_key(key):
+    """
+    Кодує елемент складеного ключа з префіксом довжини.
+    """
+    encoded = _encode_key(key)
+    return _KEY_LENGTH.pack(len(encoded)) + encoded
+
+
+def _unpack_keys(body):
+    """
+    Відновлює елементи складеного ключа, закодовані _pack_key.
+    """
+    items = []
+    position = 0
+    while position < len(body):
+        (length,) = _KEY_LENGTH.unpack_from(body, position)
+        position += _KEY_LENGTH.size
+        items.append(_decode_key(body[position:position + length]))
+        position += length
+    return items
+
+
+def _decode_key(data):
+    """
+    Відновлює ключ, закодований _encode_key.
+
+    Args:
+        data (bytes): Закодований ключ
+
+    Returns:
+        Ключ
+    """
+    tag, body = data[:1], data[1:]
+    if tag == b"s":
+        return body.decode("utf-8", "surrogatepass")
+    if tag == b"b":
+        return bytes(body)
+    if tag == b"n":
+        return None
+    if tag == b"t":
+        return tuple(_unpack_keys(body))
+    if tag == b"z":
+        return frozenset(_unpack_keys(body))
+    if tag == b"i":
+        return int.from_bytes(body, "little", signed=True)
+    return struct.unpack("<d", body)[0]
+
+
+def _snapshot_bucket(encoded_key, bucket_count):
+    """
+    Стабільний між запусками індекс кошика знімка (hash() рядків
+    рандомізується для кожного процесу, тому тут використовується BLAKE2b).
+
+    Args:
+        encoded_key (bytes): Закодований ключ
+        bucket_count (int): Кількість кошиків знімка
+
+    Returns:
+        int: Індекс кошика
+    """
+    digest = hashlib.blake2b(encoded_key, digest_size=8).digest()
+    return int.from_bytes(digest, "little") % bucket_count
+
+
+class SnapshotHashTable:
+    """
+    Знімок HashTable, відкритий через mmap лише для читання.
+
+    Пошук читає з відображеного файлу тільки заголовок, два зміщення
+    кошика та записи цього кошика, тому відкриття не залежить від
+    розміру знімка, а в пам'ять потрапляють лише прочитані сторінки.
 
-    def get(self, key):
+    Ключі кодуються за вмістом (див. HashTable.save), тож рівні ключі
+    різних типів, як-от (1, 2) і (1.0, 2), знаходять той самий запис.
+    Значення зберігаються через pickle, тому знімки слід відкривати лише
+    з довірених джерел.
+    """
+
+    def __init__(self, path):
         """
-        Повертає значення за ключем.
-        
+        Відкриває знімок.
+
         Args:
-            key: Ключ для пошуку
-            
-        Returns:
-            Значення, пов'язане з ключем, або None, якщо ключ не знайдено
+            path (str): Шлях до файлу, створеного HashTable.save
+
+        Raises:
+            ValueError: Якщо файл не є знімком HashTable
         """
-        key_hash = self.hash_function(key)
-        if self.table[key_hash]:
-            for pair in self.table[key_hash]:
-                if pair[0] == key:
-                    return pair[1]
-        return None
+        self.path = path
+        self._file = open(path, "rb")
+        try:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Порожній файл неможливо відобразити в пам'ять
+            self._file.close()
+            raise ValueError(f"'{path}' не є знімком HashTable")
 
-    def delete(self, key):
+        magic, version, _, bucket_count, count = _SNAPSHOT_HEADER.unpack_from(self._mmap, 0)
+        if magic != _SNAPSHOT_MAGIC or version != _SNAPSHOT_VERSION:
+            self.close()
+            raise ValueError(f"'{path}' не є знімком HashTable версії {_SNAPSHOT_VERSION}")
+        self.bucket_count = bucket_count
+        self._count = count
+
+    def close(self):
         """
-        Видаляє пару ключ-значення з хеш-таблиці.
-        
-        Args:
-            key: Ключ для видалення
-            
-        Returns:
-            bool: True, якщо ключ було знайдено та видалено, False - інакше
+        Закриває відображення та файл знімка.
         """
-        key_hash = self.hash_function(key)
-        
-        # Перевіряємо, чи існує ланцюжок за цим індексом
-        if not self.table[key_hash]:
-            return False
-        
-        # Шукаємо ключ у ланцюжку
-        for i, pair in enumerate(self.table[key_hash]):
-            if pair[0] == key:
-                # Видаляємо пару зі списку
-                del self.table[key_hash][i]
-                return True
-        
-        # Ключ не знайдено
-        return False
+        self._mmap.close()
+        self._file.close()
 
-    def display(self):
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _records(self, start, end):
         """
-        Виводить весь вміст хеш-таблиці для відладки.
+        Перебирає записи у діапазоні файлу.
+
+        Yields:
+            tuple: (зміщення ключа, довжина ключа, довжина значення)
         """
-        print("Хеш-таблиця:")
-        for i, bucket in enumerate(self.table):
-            if bucket:
-                print(f"  Індекс {i}: {bucket}")
-            else:
-                print(f"  Індекс {i}: порожньо")
+        mm = self._mmap
+        position = start
+        while position < end:
+            key_length, value_length = _SNAPSHOT_RECORD.unpack_from(mm, position)
+            position += _SNAPSHOT_RECORD.size
+            yield position, key_length, value_length
+            position += key_length + value_length
 
-    def keys(self):
+    def _find(self, key):
         """
-        Повертає список всіх ключів у хеш-таблиці.
-        
+        Шукає запис ключа в його кошику.
+
         Returns:
-            list: Список всіх ключів
+            tuple: (зміщення значення, довжина значення) або None
         """
-        all_keys = []
-        for bucket in self.table:
-            for pair in bucket:
-                all_keys.append(pair[0])
-        return all_keys
+        try:
+            encoded = _encode_key(key)
+        except TypeError:
+            # Такий ключ не міг потрапити у знімок; незахешовувані ключі,
+            # як і в HashTable, викликають TypeError
+            hash(key)
+            return None
+        bucket = _snapshot_bucket(encoded, self.bucket_count)
+        offset = _SNAPSHOT_HEADER.size + bucket * _SNAPSHOT_OFFSET.size
+        start, end = _SNAPSHOT_RANGE.unpack_from(self._mmap, offset)
+        mm = self._mmap
+        for key_offset, key_length, value_length in self._records(start, end):
+            if key_length == len(encoded) and mm[key_offset:key_offset + key_length] == encoded:
+                return key_offset + key_length, value_length
+        return None
 
-    def values(self):
+    def get(self, key, default=None):
         """
-        Повертає список всіх значень у хеш-таблиці.
-        
+        Повертає значення за ключем, десеріалізуючи лише цей запис.
+
+        Args:
+            key: Ключ для пошуку
+            default: Значення для відсутнього ключа
+
         Returns:
-            list: Список всіх значень
+            Значення ключа або default
         """
-        all_values = []
-        for bucket in self.table:
-            for pair in bucket:
-                all_values.append(pair[1])
-        return all_values
+        found = self._find(key)
+        if found is None:
+            return default
+        offset, length = found
+        return pickle.loads(self._mmap[offset:offset + length])
+
+    def __contains__(self, key):
+        return self._find(key) is not None
+
+    def __len__(self):
+        return self._count
 
     def items(self):
         """
-        Повертає список всіх пар ключ-значення у хеш-таблиці.
-        
-        Returns:
-            list: Список кортежів (ключ, значення)
+        Перебирає всі пари знімка у порядку зберігання.
+
+        Yields:
+            tuple: Пара (ключ, значення)
         """
-        all_items = []
-        for bucket in self.table:
-            for pair in bucket:
-                all_items.append((pair[0], pair[1]))
-        return all_items
+        mm = self._mmap
+        start = _SNAPSHOT_HEADER.size + (self.bucket_count + 1) * _SNAPSHOT_OFFSET.size
+        for key_offset, key_length, value_length in self._records(start, len(mm)):
+            value_offset = key_offset + key_length
+            yield (_decode_key(mm[key_offset:value_offset]),
+                   pickle.loads(mm[value_offset:value_offset + value_length]))
 
-    def __len__(self):
+    def keys(self):
         """
-        Повертає кількість елементів у хеш-таблиці.
-        
-        Returns:
-            int: Кількість елементів
+        Перебирає всі ключі знімка.
         """
-        count = 0
-        for bucket in self.table:
-            count += len(bucket)
-        return count
+        for key, _ in self.items():
+            yield key
 
-    def __contains__(self, key):
+    def __iter__(self):
+        return self.keys()
+
+    def to_hashtable(self, **table_options):
         """
-        Перевіряє, чи містить хеш-таблиця заданий ключ.
-        
+        Завантажує весь знімок у звичайну змінювану HashTable.
+
         Args:
-            key: Ключ для перевірки
-            
+            **table_options: Параметри конструктора HashTable
+
         Returns:
-            bool: True, якщо ключ існує, False - інакше
+            HashTable: Нова таблиця з усіма парами знімка
+        """
+        table = HashTable(**table_options)
+        table.insert_many(self.items())
+        return table
+
+
+
+class _HashTableView:
+    """
+    Базове ліниве представлення вмісту HashTable.
+
+    Представлення не копіює дані: кожен перебір читає таблицю напряму,
+    а зміна набору ключів під час перебору призводить до RuntimeError.
+    """
+
+    def __init__(self, table):
+        """
+        Args:
+            table (HashTable): Таблиця, вміст якої представляється
         """
-        return self.get(key) is not None
+        self._table = table
+
+    def __len__(self):
+        return len(self._table)
+
+    def __repr__(self):
+        return f"{type(self).__name__}({list(self)!r})"
+
+
+class HashTableKeysView(_HashTableView):
+    """Представлення ключів хеш-таблиці."""
+
+    def __iter__(self):
+        for key, _ in self._table._checked_pairs():
+            yield key
+
+    def __contains__(self, key):
+        return key in self._table
+
+
+class HashTableValuesView(_HashTableView):
+    """Представлення значень хеш-таблиці."""
+
+    def __iter__(self):
+        for _, value in self._table._checked_pairs():
+            yield value
+
+    def __contains__(self, value):
+        # Як і в dict.values(), перевірка значення потребує повного перебору
+        for item in self:
+            if item is value or item == value:
+                return True
+        return False
+
+
+class HashTableItemsView(_HashTableView):
+    """Представлення пар (ключ, значення) хеш-таблиці."""
+
+    def __iter__(self):
+        return self._table._checked_pairs()
+
+    def __contains__(self, item):
+        if not isinstance(item, tuple) or len(item) != 2:
+            return False
+        key, value = item
+        stored = self._table.get(key, _MISSING)
+        if stored is _MISSING:
+            return False
+        return stored is value or stored == value
+
 
 
 def test_hashtable():
@@ -199,7 +2100,7 @@ def test_hashtable():
         print(f"   Вставлено: {key} = {value}")
     
     print(f"\n📊 Кількість елементів: {len(H)}")
-    print("🗂️  Всі ключі:", H.keys())
+    print("🗂️  Всі ключі:", list(H.keys()))
     
     # Відображаємо поточний стан
     print("\n🔍 Поточний стан хеш-таблиці:")
@@ -234,8 +2135,8 @@ def test_hashtable():
     
     # Показуємо фінальний стан
     print(f"\n📊 Кількість елементів після видалення: {len(H)}")
-    print("🗂️  Залишилися ключі:", H.keys())
-    print("💎 Залишилися значення:", H.values())
+    print("🗂️  Залишилися ключі:", list(H.keys()))
+    print("💎 Залишилися значення:", list(H.values()))
     
     print("\n🔍 Фінальний стан хеш-таблиці:")
     H.display()
@@ -260,6 +2161,284 @@ def test_hashtable():
     print(f"   test2 після видалення test1: {H.get('test2')}")
 
 
+def test_counter():
+    """
+    Перевіряє, що лічильник елементів залишається точним за різних операцій.
+    """
+    import random
+    
+    print("\n" + "=" * 50)
+    print("🔢 Тестування лічильника елементів")
+    print("=" * 50)
+    
+    def check(H, expected, description):
+        # Порівнюємо лічильник з фактичною кількістю пар у ланцюжках
+        actual = sum(len(bucket) for bucket in H._buckets())
+        ok = len(H) == expected == actual
+        mark = "✓" if ok else "✗"
+        print(f"   {mark} {description}: len={len(H)}, очікувано={expected}, фактично={actual}")
+    
+    H = HashTable(3)
+    for key in ["a", "b", "c"]:
+        H.insert(key, 1)
+    check(H, 3, "після вставки 3 ключів")
+    
+    # Перезапис існуючих ключів не змінює кількість
+    for key in ["a", "b", "c", "a"]:
+        H.insert(key, 2)
+    check(H, 3, "після перезапису")
+    
+    # Видалення відсутнього ключа не змінює кількість
+    H.delete("missing")
+    H.delete("a")
+    H.delete("a")
+    check(H, 2, "після видалення відсутніх та повторного видалення")
+    
+    # Змішане навантаження порівнюємо зі стандартним словником
+    random.seed(42)
+    H = HashTable(5, min_load_factor=0.1)
+    reference = {}
+    for _ in range(20000):
+        key = random.randint(0, 2000)
+        if random.random() < 0.6:
+            H.insert(key, key)
+            reference[key] = key
+        else:
+            H.delete(key)
+            reference.pop(key, None)
+    check(H, len(reference), "після змішаного навантаження")
+
+
+def demo_views():
+    """
+    Демонструє ліниві представлення keys/values/items та виявлення змін
+    таблиці під час перебору.
+    """
+    print("\n" + "=" * 50)
+    print("👀 Тестування лінивих представлень")
+    print("=" * 50)
+    
+    H = HashTable(8)
+    for i in range(5):
+        H.insert(f"k{i}", i * 10)
+    
+    keys = H.keys()
+    items = H.items()
+    print(f"   len(keys) = {len(keys)}, 'k1' in keys: {'k1' in keys}")
+    print(f"   ('k2', 20) in items: {('k2', 20) in items}, ('k2', 0) in items: {('k2', 0) in items}")
+    print(f"   30 in values: {30 in H.values()}")
+    
+    # Представлення відображає поточний стан таблиці, а не копію
+    H.insert("k5", 50)
+    print(f"   Після вставки k5: len(keys) = {len(keys)}, 'k5' in keys: {'k5' in keys}")
+    
+    # Оновлення значення існуючого ключа під час перебору дозволене
+    for key in H:
+        H.insert(key, 0)
+    print(f"   ✓ Оновлення значень під час перебору: {sorted(H.values())}")
+    
+    # Додавання нового ключа під час перебору виявляється
+    try:
+        for key in H:
+            H.insert(key + "_new", 1)
+        print("   ✗ Зміну таблиці під час перебору не виявлено")
+    except RuntimeError as error:
+        print(f"   ✓ Виявлено зміну під час перебору: {error}")
+
+
+def demo_none_values():
+    """
+    Демонструє, що значення None зберігається як звичайне значення.
+    """
+    print("\n" + "=" * 50)
+    print("🕳️  Тестування значень None")
+    print("=" * 50)
+    
+    for storage in STORAGES:
+        H = HashTable(8, storage=storage)
+        # None як маркер негативного кешу
+        H.insert("negative", None)
+        print(f"\n🔸 {storage}:")
+        print(f"   'negative' in H: {'negative' in H}")
+        print(f"   get('negative', 'відсутній'): {H.get('negative', 'відсутній')}")
+        print(f"   get('missing', 'відсутній'): {H.get('missing', 'відсутній')}")
+        print(f"   setdefault('negative', 1): {H.setdefault('negative', 1)}")
+        print(f"   setdefault('new', 1): {H.setdefault('new', 1)}")
+        print(f"   pop('negative'): {H.pop('negative')}, залишилось {len(H)}")
+        print(f"   pop('negative', 'немає'): {H.pop('negative', 'немає')}")
+        try:
+            H.pop("negative")
+        except KeyError:
+            print("   ✓ pop відсутнього ключа без default викликає KeyError")
+
+
+def test_concurrent():
+    """
+    Стрес-тест ConcurrentHashTable: кілька потоків одночасно вставляють,
+    видаляють та читають ключі, після чого вміст звіряється з очікуваним.
+    """
+    import random
+    import sys
+    from concurrent.futures import ThreadPoolExecutor
+    
+    print("\n" + "=" * 50)
+    print("🧵 Стрес-тест ConcurrentHashTable")
+    print("=" * 50)
+    
+    # Часте перемикання потоків збільшує ймовірність гонок
+    switch_interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    
+    H = ConcurrentHashTable(2, min_load_factor=0.1, stripes=4)
+    threads = 8
+    
+    def worker(thread_id):
+        rng = random.Random(thread_id)
+        expected = {}
+        errors = 0
+        for i in range(5000):
+            # Потоки працюють з власними ключами, але спільними кошиками
+            key = (thread_id, rng.randint(0, 300))
+            action = rng.random()
+            if action < 0.5:
+                H.insert(key, i)
+                expected[key] = i
+            elif action < 0.8:
+                if H.delete(key) != (key in expected):
+                    errors += 1
+                expected.pop(key, None)
+            elif H.get(key, "немає") != expected.get(key, "немає"):
+                errors += 1
+        return expected, errors
+    
+    try:
+        with ThreadPoolExecutor(max_workers=threads) as executor:
+            results = list(executor.map(worker, range(threads)))
+    finally:
+        sys.setswitchinterval(switch_interval)
+    
+    expected = {}
+    errors = 0
+    for thread_expected, thread_errors in results:
+        expected.update(thread_expected)
+        errors += thread_errors
+    
+    print(f"   Потоків: {threads}, розмір таблиці: {H.size}")
+    print(f"   {'✓' if errors == 0 else '✗'} Помилок читання/видалення: {errors}")
+    print(f"   {'✓' if len(H) == len(expected) else '✗'} len: {len(H)}, очікувано: {len(expected)}")
+    print(f"   {'✓' if dict(H.items()) == expected else '✗'} Вміст збігається з очікуваним")
+    
+    # Четвертий позиційний параметр HashTable - rehash_step, тому
+    # stripes та наступні параметри передаються лише за іменем
+    try:
+        ConcurrentHashTable(8, 0.75, None, 4)
+        print("   ✗ Позиційний stripes прийнято")
+    except TypeError:
+        print("   ✓ Позиційний stripes відхилено з TypeError")
+    
+    # Зміна з іншого потоку під час перебору має бути виявлена
+    keys = iter(H.keys())
+    next(keys)
+    writer = threading.Thread(target=H.insert, args=(("інший потік", 0), 0))
+    writer.start()
+    writer.join()
+    try:
+        list(keys)
+        print("   ✗ Зміну з іншого потоку під час перебору не виявлено")
+    except RuntimeError:
+        print("   ✓ Зміну з іншого потоку під час перебору виявлено")
+
+
+def test_snapshot(path="hashtable_snapshot_test.bin"):
+    """
+    Перевіряє, що знімок знаходить ключі так само, як HashTable: рівні
+    ключі різних типів дають той самий запис, а непідтримувані ключі
+    відхиляються під час збереження.
+    """
+    from fractions import Fraction
+    
+    print("\n" + "=" * 50)
+    print("💾 Тестування знімків HashTable")
+    print("=" * 50)
+    
+    keys = ["a", b"b", None, 7, 1.5, (1, 2), ("x", (3, None)), frozenset({1, "y", (2, 3)})]
+    H = HashTable(items=[(key, index) for index, key in enumerate(keys)])
+    # Рівні, але інакше записані ключі
+    probes = [
+        ((1.0, 2), 5),
+        ((True, Fraction(2)), 5),
+        (7.0, 3),
+        (Fraction(3, 2), 4),
+        (frozenset({(2.0, 3), "y", 1}), 7),
+        ((1, 3), None),
+        ("missing", None),
+    ]
+    errors = 0
+    try:
+        H.save(path)
+        with HashTable.load(path) as snapshot:
+            for key, expected in probes:
+                value = snapshot.get(key)
+                if value != expected or H.get(key) != expected:
+                    errors += 1
+                    print(f"   ✗ get({key!r}) = {value}, очікувалось {expected}")
+            restored = dict(snapshot.items())
+            if restored != dict(H.items()):
+                errors += 1
+                print(f"   ✗ Відновлені пари відрізняються: {restored}")
+        print(f"   Збережено {len(keys)} ключів, перевірено {len(probes)} пошуків")
+        
+        H.insert(("ok", object()), 0)
+        try:
+            H.save(path)
+            errors += 1
+            print("   ✗ Ключ з object() збережено")
+        except TypeError as error:
+            print(f"   ✓ Непідтримуваний ключ відхилено: {error}")
+    finally:
+        if os.path.exists(path):
+            os.remove(path)
+    
+    mark = "✓" if errors == 0 else "✗"
+    print(f"   {mark} Помилок: {errors}")
+
+
+def demo_lru_cache():
+    """
+    Демонструє витіснення LRU, час життя записів та лічильники кешу.
+    """
+    print("\n" + "=" * 50)
+    print("🗃️  Тестування LRUCache")
+    print("=" * 50)
+    
+    # Керований годинник, щоб продемонструвати TTL без очікування
+    now = [0.0]
+    cache = LRUCache(3, ttl=10, clock=lambda: now[0])
+    
+    for key in ["a", "b", "c"]:
+        cache.insert(key, key.upper())
+    cache.get("a")  # "a" стає найсвіжішим, найдавніший тепер "b"
+    cache.insert("d", "D")
+    print(f"   Після вставки 'd' у повний кеш: 'b' in cache = {'b' in cache}, "
+          f"'a' in cache = {'a' in cache}")
+    
+    cache.insert("short", "S", ttl=1)
+    now[0] = 5
+    print(f"   Через 5 с: get('short') = {cache.get('short')}, get('d') = {cache.get('d')}")
+    now[0] = 20
+    print(f"   Через 20 с: get('d') = {cache.get('d')}")
+    
+    cache.delete("a")
+    print(f"   Кількість записів: {len(cache)}")
+    print(f"   📊 Статистика: {cache.stats()}")
+    
+    # Початковий вміст проходить через insert і обмежується місткістю
+    cache = LRUCache(2, items={"x": 1, "y": 2, "z": 3}, storage="open_addressing")
+    values = (cache.get("x"), cache.get("y"), cache.get("z"))
+    mark = "✓" if values == (None, 2, 3) and len(cache) == 2 else "✗"
+    print(f"   {mark} LRUCache(2, items={{x, y, z}}): get x, y, z = {values}")
+
+
 def demo_edge_cases():
     """
     Демонструє роботу з граничними випадками.
@@ -291,11 +2470,317 @@ def demo_edge_cases():
     print("\n🚫 Спроба видалення з порожньої таблиці:")
     result = H.delete("nonexistent")
     print(f"   Результат: {result}")
+    
+    # Клас сховища обирається лише за іменованим параметром storage
+    print("\n🏗️  Вибір сховища:")
+    H = HashTable(8, 0.75, None, 4, storage="open_addressing")
+    mark = "✓" if type(H) is OpenAddressingHashTable else "✗"
+    print(f"   {mark} HashTable(8, 0.75, None, 4, storage='open_addressing'): {type(H).__name__}")
+    try:
+        H = HashTable(8, 0.75, None, 4, "open_addressing")
+        print(f"   ✗ Позиційний storage прийнято: {type(H).__name__}, storage = {H.storage!r}")
+    except TypeError:
+        print("   ✓ Позиційний storage відхилено з TypeError")
+
+
+def demo_resizing():
+    """
+    Демонструє автоматичну зміну розміру таблиці при рості та видаленні.
+    """
+    print("\n" + "=" * 50)
+    print("📈 Тестування автоматичної зміни розміру")
+    print("=" * 50)
+    
+    H = HashTable(5, max_load_factor=0.75, min_load_factor=0.2)
+    print(f"📦 Початковий розмір: {H.size}")
+    
+    # Вставляємо багато елементів у маленьку таблицю
+    count = 10000
+    for i in range(count):
+        H.insert(f"key{i}", i)
+    
+    print(f"📊 Після вставки {count:,} елементів:")
+    print(f"   Розмір таблиці: {H.size}")
+    print(f"   Коефіцієнт заповнення: {H.load_factor():.2f}")
+    longest = max(len(bucket) for bucket in H.table if bucket)
+    print(f"   Найдовший ланцюжок: {longest}")
+    
+    # Перевіряємо, що всі елементи доступні після рехешування
+    missing = [i for i in range(count) if H.get(f"key{i}") != i]
+    print("   ✓ Всі елементи знайдено" if not missing else f"   ✗ Втрачено: {len(missing)}")
+    
+    # Видаляємо більшість елементів, щоб таблиця зменшилася
+    for i in range(count - 10):
+        H.delete(f"key{i}")
+    
+    print(f"\n🗑️  Після видалення {count - 10:,} елементів:")
+    print(f"   Розмір таблиці: {H.size}")
+    print(f"   Кількість елементів: {len(H)}")
+    print(f"   Залишилися ключі: {sorted(H.keys())}")
+
+
+def benchmark_storage(count=200000):
+    """
+    Порівнює пам'ять на запис та час пошуку для двох типів сховища.
+    
+    Args:
+        count (int): Кількість елементів у таблиці
+    """
+    import timeit
+    import tracemalloc
+    
+    print("\n" + "=" * 50)
+    print("⚡ Порівняння сховищ: ланцюжки vs відкрита адресація")
+    print("=" * 50)
+    print(f"📊 Кількість елементів: {count:,}")
+    
+    # Ключі та значення створюємо заздалегідь, щоб вимірювати лише таблицю
+    keys = [f"key{i}" for i in range(count)]
+    values = list(range(count))
+    missing_keys = [f"missing{i}" for i in range(count)]
+    
+    for storage in STORAGES:
+        tracemalloc.start()
+        H = HashTable(8, storage=storage)
+        for key, value in zip(keys, values):
+            H.insert(key, value)
+        memory, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        
+        get = H.get
+        lookup_time = timeit.timeit(lambda: [get(key) for key in keys], number=3) / 3
+        miss_time = timeit.timeit(lambda: [get(key) for key in missing_keys], number=3) / 3
+        
+        print(f"\n🔸 {storage}:")
+        print(f"   Пам'ять на запис: {memory / count:.1f} байт")
+        print(f"   Пошук існуючого ключа: {lookup_time / count * 1e9:.0f} нс")
+        print(f"   Пошук відсутнього ключа: {miss_time / count * 1e9:.0f} нс")
+
+
+def benchmark_bulk(count=200000):
+    """
+    Порівнює пакетні операції з циклом одиничних викликів.
+    
+    Args:
+        count (int): Кількість пар у пакеті
+    """
+    import time
+    
+    print("\n" + "=" * 50)
+    print("⚡ Пакетні операції vs цикл одиничних викликів")
+    print("=" * 50)
+    print(f"📊 Розмір пакета: {count:,}")
+    
+    pairs = [(f"key{i}", i) for i in range(count)]
+    keys = [key for key, _ in pairs]
+    
+    def measure(func):
+        start = time.perf_counter()
+        func()
+        return time.perf_counter() - start
+    
+    for storage in STORAGES:
+        print(f"\n🔸 {storage}:")
+        print(f"   {'Операція':<10} {'Цикл (оп/с)':>14} {'Пакет (оп/с)':>14} {'Прискорення':>12}")
+        
+        single = HashTable(8, storage=storage)
+        bulk = HashTable(8, storage=storage)
+        
+        def insert_loop():
+            for key, value in pairs:
+                single.insert(key, value)
+        
+        def get_loop():
+            for key in keys:
+                single.get(key)
+        
+        def delete_loop():
+            for key in keys:
+                single.delete(key)
+        
+        timings = [
+            ("insert", measure(insert_loop), measure(lambda: bulk.insert_many(pairs))),
+            ("get", measure(get_loop), measure(lambda: bulk.get_many(keys))),
+            ("delete", measure(delete_loop), measure(lambda: bulk.delete_many(keys))),
+        ]
+        for name, loop_time, bulk_time in timings:
+            print(f"   {name:<10} {count / loop_time:>14,.0f} {count / bulk_time:>14,.0f} "
+                  f"{loop_time / bulk_time:>11.2f}x")
+
+
+def benchmark_concurrent(operations=200000, thread_counts=(1, 2, 4, 8)):
+    """
+    Порівнює пропускну здатність ConcurrentHashTable з HashTable,
+    захищеною одним спільним замком, при різній кількості потоків.
+    
+    Args:
+        operations (int): Загальна кількість операцій на один запуск
+        thread_counts (tuple): Кількості потоків для порівняння
+    """
+    import random
+    import time
+    from concurrent.futures import ThreadPoolExecutor
+    
+    print("\n" + "=" * 50)
+    print("⚡ Конкурентний доступ: смуги замків vs один замок")
+    print("=" * 50)
+    print(f"📊 Операцій на запуск: {operations:,} (80% читань, 20% записів)")
+    
+    class GlobalLockTable:
+        """HashTable, кожна операція якої виконується під одним замком."""
+        
+        def __init__(self):
+            self.table = HashTable(8)
+            self.lock = threading.Lock()
+        
+        def insert(self, key, value):
+            with self.lock:
+                return self.table.insert(key, value)
+        
+        def get(self, key):
+            with self.lock:
+                return self.table.get(key)
+    
+    def run(table, threads):
+        per_thread = operations // threads
+        
+        def worker(thread_id):
+            rng = random.Random(thread_id)
+            for _ in range(per_thread):
+                key = rng.randint(0, 50000)
+                if rng.random() < 0.2:
+                    table.insert(key, key)
+                else:
+                    table.get(key)
+        
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=threads) as executor:
+            list(executor.map(worker, range(threads)))
+        return per_thread * threads / (time.perf_counter() - start)
+    
+    print(f"\n   {'Потоки':<8} {'Один замок (оп/с)':>18} {'Смуги (оп/с)':>14}")
+    for threads in thread_counts:
+        global_rate = run(GlobalLockTable(), threads)
+        striped_rate = run(ConcurrentHashTable(8), threads)
+        print(f"   {threads:<8} {global_rate:>18,.0f} {striped_rate:>14,.0f}")
+
+
+def benchmark_hash_strategies(count=4096):
+    """
+    Порівнює стратегії хешування за розподілом довжин ланцюжків та
+    швидкістю вставки й пошуку на різних наборах ключів.
+    
+    Args:
+        count (int): Кількість ключів у кожному наборі
+    """
+    import time
+    
+    print("\n" + "=" * 50)
+    print("⚡ Порівняння стратегій хешування")
+    print("=" * 50)
+    
+    key_sets = {
+        "послідовні цілі": list(range(count)),
+        "рядки": [f"user:{i}" for i in range(count)],
+        "кратні 2^20": [i << 20 for i in range(count)],
+    }
+    print(f"📊 Ключів у наборі: {count:,}, таблиця з {count} кошиками без росту")
+    print(f"\n   {'Набір':<17} {'Стратегія':<8} {'Макс.':>6} {'Середня':>8} "
+          f"{'Порожні':>8} {'Оп/с':>12}")
+    
+    for set_name, keys in key_sets.items():
+        for strategy in HASH_STRATEGIES:
+            # Фіксований розмір показує розподіл без впливу рехешування
+            H = HashTable(count, max_load_factor=None, hash_strategy=strategy)
+            start = time.perf_counter()
+            for key in keys:
+                H.insert(key, key)
+            for key in keys:
+                H.get(key)
+            rate = 2 * count / (time.perf_counter() - start)
+            
+            lengths = [len(bucket) for bucket in H.table if bucket]
+            empty = 1 - len(lengths) / H.size
+            print(f"   {set_name:<17} {strategy:<8} {max(lengths):>6} "
+                  f"{sum(lengths) / len(lengths):>8.2f} {empty:>8.1%} {rate:>12,.0f}")
+
+
+def benchmark_snapshot(count=200000, path="hashtable_snapshot.bin"):
+    """
+    Порівнює відновлення таблиці повторною вставкою з відкриттям знімка
+    через mmap: час запуску, час пошуку та резидентну пам'ять.
+    
+    Args:
+        count (int): Кількість елементів (для звіту про 10M - 10_000_000)
+        path (str): Тимчасовий файл знімка
+    """
+    import gc
+    import random
+    
+    print("\n" + "=" * 50)
+    print("💾 Знімки HashTable: повторна вставка vs mmap")
+    print("=" * 50)
+    
+    def resident_mb():
+        # /proc доступний лише в Linux; деінде пам'ять не звітується
+        try:
+            with open("/proc/self/statm") as f:
+                return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 2**20
+        except (OSError, ValueError, AttributeError):
+            return float("nan")
+    
+    pairs = [(f"key{i}", i) for i in range(count)]
+    probes = random.sample([key for key, _ in pairs], min(10000, count))
+    print(f"📊 Елементів: {count:,}, пошуків: {len(probes):,}")
+    
+    gc.collect()
+    memory_before = resident_mb()
+    start = time.perf_counter()
+    H = HashTable(items=pairs)
+    rebuild_time = time.perf_counter() - start
+    rebuild_memory = resident_mb() - memory_before
+    
+    start = time.perf_counter()
+    H.save(path)
+    save_time = time.perf_counter() - start
+    del H
+    gc.collect()
+    
+    memory_before = resident_mb()
+    start = time.perf_counter()
+    snapshot = HashTable.load(path)
+    open_time = time.perf_counter() - start
+    start = time.perf_counter()
+    for key in probes:
+        snapshot.get(key)
+    lookup_time = (time.perf_counter() - start) / len(probes)
+    snapshot_memory = resident_mb() - memory_before
+    snapshot.close()
+    file_size = os.path.getsize(path) / 2**20
+    os.remove(path)
+    
+    print(f"\n   Повторна вставка: {rebuild_time:.3f} сек, +{rebuild_memory:.1f} МБ резидентної пам'яті")
+    print(f"   Збереження знімка: {save_time:.3f} сек, файл {file_size:.1f} МБ")
+    print(f"   Відкриття знімка: {open_time * 1000:.3f} мс")
+    print(f"   Пошук у знімку: {lookup_time * 1e6:.1f} мкс")
+    print(f"   Після пошуків: +{snapshot_memory:.1f} МБ резидентної пам'яті")
 
 
 if __name__ == "__main__":
     test_hashtable()
+    test_counter()
     demo_edge_cases()
+    demo_views()
+    demo_none_values()
+    test_concurrent()
+    test_snapshot()
+    demo_lru_cache()
+    demo_resizing()
+    benchmark_storage()
+    benchmark_bulk()
+    benchmark_hash_strategies()
+    benchmark_concurrent()
+    benchmark_snapshot()
     
     print("\n✅ Тестування завершено!")
     print("\n💡 Ключові особливості реалізації методу delete:")
@@ -304,3 +2789,4 @@ if __name__ == "__main__":
     print("   • Видаляє елемент зі списку та повертає True при успіху")
     print("   • Повертає False, якщо ключ не знайдено")
     print("   • Правильно обробляє колізії та порожні ланцюжки")
+    print("   • Автоматично змінює розмір таблиці за коефіцієнтом заповнення")
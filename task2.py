@@ -3,22 +3,330 @@
 
 Функція повертає кортеж з кількістю ітерацій та "верхньою межею" - 
 найменшим елементом, який є більшим або рівним заданому значенню.
+Функції lower_bound, upper_bound, floor та ceiling повертають індекс і
+значення межі за гарантовані O(log n) порівнянь.
+range_query, count_range та rank відповідають на запити діапазону без копіювання.
+Інтерполяційний, експоненційний та адаптивний пошук мають той самий
+контракт (кількість_ітерацій, верхня_межа).
+Функція search_many виконує пошук для багатьох значень за один виклик.
+StaticSortedIndex та LearnedIndex прискорюють повторні запити до незмінного масиву.
+FingerSearcher прискорює послідовності близьких запитів.
+SortedFloatList підтримує вставки й видалення без пересортування.
+SortedFloatFile дає змогу шукати у файлі, більшому за оперативну пам'ять.
 """
 
-def binary_search_with_upper_bound(arr, target):
+import bisect
+import itertools
+import math
+import mmap
+import os
+import struct
+import sys
+from array import array
+
+try:
+    import numpy as np
+except ImportError:  # NumPy необов'язковий - без нього працює чистий Python
+    np = None
+
+
+# bisect підтримує параметр key лише з Python 3.10
+try:
+    bisect.bisect_left([], 0, key=None)
+    _BISECT_HAS_KEY = True
+except TypeError:
+    _BISECT_HAS_KEY = False
+
+
+def _resolve_bounds(arr, lo, hi):
+    """
+    Перевіряє межі діапазону пошуку.
+    
+    Args:
+        arr: Відсортована послідовність
+        lo (int): Початок діапазону (включно)
+        hi (int): Кінець діапазону (не включно) або None - до кінця масиву
+        
+    Returns:
+        tuple: (lo, hi)
+        
+    Raises:
+        ValueError: Якщо lo < 0, hi > len(arr) або lo > hi
+    """
+    if lo < 0:
+        raise ValueError("lo має бути невід'ємним")
+    if hi is None:
+        hi = len(arr)
+    elif hi > len(arr):
+        raise ValueError("hi не може перевищувати довжину масиву")
+    if lo > hi:
+        raise ValueError("lo не може перевищувати hi")
+    return lo, hi
+
+
+def _bisect(arr, target, lo, hi, key, right):
+    """
+    Двійковий пошук точки вставки target у відсортованому arr[lo:hi].
+    
+    Args:
+        arr: Відсортована (за key) послідовність
+        target: Значення для пошуку
+        lo (int): Початок діапазону
+        hi (int): Кінець діапазону
+        key (callable): Функція ключа або None
+        right (bool): True - перша позиція з елементом > target,
+            False - перша позиція з елементом >= target
+            
+    Returns:
+        int: Точка вставки
+    """
+    if key is None or _BISECT_HAS_KEY:
+        search = bisect.bisect_right if right else bisect.bisect_left
+        if key is None:
+            return search(arr, target, lo, hi)
+        return search(arr, target, lo, hi, key=key)
+    
+    while lo < hi:
+        mid = (lo + hi) // 2
+        value = key(arr[mid])
+        if value < target or (right and value == target):
+            lo = mid + 1
+        else:
+            hi = mid
+    return lo
+
+
+def lower_bound(arr, target, lo=0, hi=None, key=None):
+    """
+    Знаходить перший елемент, не менший за target.
+    
+    Args:
+        arr: Відсортована послідовність
+        target: Значення для пошуку
+        lo (int): Початок діапазону пошуку
+        hi (int): Кінець діапазону пошуку (не включно)
+        key (callable): Функція, що повертає значення для порівняння
+        
+    Returns:
+        tuple: (індекс, елемент) - індекс дорівнює hi, а елемент None,
+            якщо всі елементи менші за target
+    """
+    lo, hi = _resolve_bounds(arr, lo, hi)
+    index = _bisect(arr, target, lo, hi, key, right=False)
+    return (index, arr[index] if index < hi else None)
+
+
+def upper_bound(arr, target, lo=0, hi=None, key=None):
+    """
+    Знаходить перший елемент, строго більший за target.
+    
+    Args:
+        arr: Відсортована послідовність
+        target: Значення для пошуку
+        lo (int): Початок діапазону пошуку
+        hi (int): Кінець діапазону пошуку (не включно)
+        key (callable): Функція, що повертає значення для порівняння
+        
+    Returns:
+        tuple: (індекс, елемент) - індекс дорівнює hi, а елемент None,
+            якщо всі елементи не більші за target
+    """
+    lo, hi = _resolve_bounds(arr, lo, hi)
+    index = _bisect(arr, target, lo, hi, key, right=True)
+    return (index, arr[index] if index < hi else None)
+
+
+def ceiling(arr, target, lo=0, hi=None, key=None):
+    """
+    Знаходить найменший елемент, більший або рівний target.
+    
+    Args:
+        arr: Відсортована послідовність
+        target: Значення для пошуку
+        lo (int): Початок діапазону пошуку
+        hi (int): Кінець діапазону пошуку (не включно)
+        key (callable): Функція, що повертає значення для порівняння
+        
+    Returns:
+        tuple: (індекс, елемент) або (None, None), якщо такого елемента немає
+    """
+    lo, hi = _resolve_bounds(arr, lo, hi)
+    index = _bisect(arr, target, lo, hi, key, right=False)
+    if index == hi:
+        return (None, None)
+    return (index, arr[index])
+
+
+def floor(arr, target, lo=0, hi=None, key=None):
+    """
+    Знаходить найбільший елемент, менший або рівний target.
+    
+    Args:
+        arr: Відсортована послідовність
+        target: Значення для пошуку
+        lo (int): Початок діапазону пошуку
+        hi (int): Кінець діапазону пошуку (не включно)
+        key (callable): Функція, що повертає значення для порівняння
+        
+    Returns:
+        tuple: (індекс, елемент) або (None, None), якщо такого елемента немає
+    """
+    lo, hi = _resolve_bounds(arr, lo, hi)
+    index = _bisect(arr, target, lo, hi, key, right=True) - 1
+    if index < lo:
+        return (None, None)
+    return (index, arr[index])
+
+
+def _check_bound(value):
+    """
+    Відхиляє NaN як межу запиту.
+    
+    Порівняння з NaN завжди хибні, тому двійковий пошук повернув би
+    довільну позицію. Масиви також не повинні містити NaN: їх неможливо
+    впорядкувати (SortedFloatList, StaticSortedIndex та save_sorted_floats
+    відхиляють NaN під час побудови).
+    """
+    if value != value:
+        raise ValueError("NaN не може бути межею запиту")
+
+
+class SortedRange:
+    """
+    Представлення діапазону arr[start:stop] без копіювання даних.
+    
+    Зберігає лише посилання на масив та межі індексів, тому створюється
+    за O(1) незалежно від кількості елементів. Зміни масиву видно через
+    представлення.
+    """
+    
+    def __init__(self, arr, start, stop):
+        self.arr = arr
+        self.start = start
+        self.stop = stop
+    
+    def __len__(self):
+        return self.stop - self.start
+    
+    def __iter__(self):
+        arr = self.arr
+        for index in range(self.start, self.stop):
+            yield arr[index]
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step != 1:
+                raise ValueError("представлення підтримує лише зрізи з кроком 1")
+            return SortedRange(self.arr, self.start + start, self.start + max(start, stop))
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("індекс поза межами діапазону")
+        return self.arr[self.start + index]
+    
+    def __repr__(self):
+        return f"SortedRange(start={self.start}, stop={self.stop})"
+    
+    def tolist(self):
+        """Копіює елементи діапазону в новий список."""
+        return list(self)
+
+
+def range_query(arr, lo, hi):
+    """
+    Знаходить усі елементи з напівінтервалу [lo, hi).
+    
+    Args:
+        arr: Відсортована послідовність без NaN
+        lo (float): Нижня межа (включно)
+        hi (float): Верхня межа (не включно)
+        
+    Returns:
+        SortedRange: Представлення елементів без копіювання; порожнє, якщо lo >= hi
+        
+    Raises:
+        ValueError: Якщо lo або hi - NaN
+    """
+    _check_bound(lo)
+    _check_bound(hi)
+    start = bisect.bisect_left(arr, lo)
+    stop = bisect.bisect_left(arr, hi, start)
+    return SortedRange(arr, start, stop)
+
+
+def count_range(arr, lo, hi):
+    """
+    Підраховує елементи з напівінтервалу [lo, hi) двома двійковими пошуками.
+    
+    Args:
+        arr: Відсортована послідовність без NaN
+        lo (float): Нижня межа (включно)
+        hi (float): Верхня межа (не включно)
+        
+    Returns:
+        int: Кількість елементів; 0, якщо lo >= hi
+        
+    Raises:
+        ValueError: Якщо lo або hi - NaN
+    """
+    return len(range_query(arr, lo, hi))
+
+
+def rank(arr, x):
+    """
+    Підраховує елементи, не більші за x.
+    
+    Args:
+        arr: Відсортована послідовність без NaN
+        x (float): Значення
+        
+    Returns:
+        int: Кількість елементів <= x
+        
+    Raises:
+        ValueError: Якщо x - NaN
+    """
+    _check_bound(x)
+    return bisect.bisect_right(arr, x)
+
+
+class SearchEvent:
+    """Крок двійкового пошуку, що передається трасувальнику."""
+    
+    __slots__ = ("iteration", "left", "right", "mid", "value", "comparison")
+    
+    def __init__(self, iteration, left, right, mid, value, comparison):
+        self.iteration = iteration
+        self.left = left
+        self.right = right
+        self.mid = mid
+        self.value = value
+        # '==', '<' або '>' - результат порівняння arr[mid] з target
+        self.comparison = comparison
+    
+    def __repr__(self):
+        return (f"SearchEvent(iteration={self.iteration}, left={self.left}, right={self.right}, "
+                f"mid={self.mid}, value={self.value!r}, comparison={self.comparison!r})")
+
+
+def binary_search_with_upper_bound(arr, target, tracer=None):
     """
     Виконує двійковий пошук з поверненням кількості ітерацій та верхньої межі.
     
     Args:
-        arr (list): Відсортований масив дробових чисел
+        arr: Відсортований масив дробових чисел - список або послідовність
+            з протоколом буфера (array('d'), memoryview, SortedFloatFile.values)
         target (float): Значення для пошуку
+        tracer (callable): Викликається з SearchEvent на кожній ітерації;
+            None - без трасування (коштує одну перевірку на ітерацію)
         
     Returns:
         tuple: (кількість_ітерацій, верхня_межа)
             - кількість_ітерацій: кількість ітерацій, потрібних для пошуку
             - верхня_межа: найменший елемент >= target, або None якщо такого немає
     """
-    if not arr:
+    if len(arr) == 0:
         return (0, None)
     
     left = 0
@@ -29,154 +337,1522 @@ def binary_search_with_upper_bound(arr, target):
     while left <= right:
         iterations += 1
         mid = (left + right) // 2
+        value = arr[mid]
         
-        if arr[mid] == target:
+        if value == target:
             # Знайшли точне значення - воно і є верхньою межею
-            return (iterations, arr[mid])
-        elif arr[mid] < target:
+            if tracer is not None:
+                tracer(SearchEvent(iterations, left, right, mid, value, "=="))
+            return (iterations, value)
+        elif value < target:
+            if tracer is not None:
+                tracer(SearchEvent(iterations, left, right, mid, value, "<"))
             left = mid + 1
         else:
             # arr[mid] > target - це потенційна верхня межа
-            upper_bound = arr[mid]
+            if tracer is not None:
+                tracer(SearchEvent(iterations, left, right, mid, value, ">"))
+            upper_bound = value
             right = mid - 1
     
-    # Якщо не знайшли точне значення, але знайшли верхню межу
-    if upper_bound is not None:
-        return (iterations, upper_bound)
+    # Якщо під час пошуку жоден елемент не виявився більшим за target,
+    # пошук завершився праворуч від останнього елемента: всі елементи
+    # менші за target і верхньої межі немає (лінійна перевірка не потрібна)
+    return (iterations, upper_bound)
+
+
+# Скільки кроків інтерполяції поспіль можуть не скоротити діапазон удвічі,
+# перш ніж адаптивний пошук зробить крок двійкового
+_ADAPTIVE_MAX_MISSES = 2
+
+
+def _interpolate(arr, lo, hi, target):
+    """
+    Оцінює позицію target у arr[lo..hi] лінійною інтерполяцією.
     
-    # Якщо верхня межа не знайдена, перевіряємо, чи є елементи більші за target
-    for element in arr:
-        if element >= target:
-            return (iterations, element)
+    Викликається, коли arr[lo] < target <= arr[hi] і hi - lo >= 2.
     
-    # Всі елементи менші за target
-    return (iterations, None)
+    Returns:
+        int: Позиція в межах [lo + 1, hi - 1]
+    """
+    low, high = arr[lo], arr[hi]
+    fraction = (target - low) / (high - low)
+    if fraction != fraction:
+        # Нескінченні значення на краях дають NaN - беремо середину
+        return (lo + hi) // 2
+    pos = lo + int(fraction * (hi - lo))
+    return min(max(pos, lo + 1), hi - 1)
 
 
-def binary_search_detailed(arr, target):
+def _upper_bound_search(arr, target, adaptive):
     """
-    Детальна версія двійкового пошуку з логуванням кроків.
+    Спільна частина інтерполяційного та адаптивного пошуку.
+    
+    Підтримує діапазон [lo, hi], у якому arr[lo] < target <= arr[hi], тобто
+    верхня межа лежить у (lo, hi]. В адаптивному режимі кроки інтерполяції,
+    що кілька разів поспіль не скоротили діапазон хоча б удвічі, означають,
+    що дані на цьому діапазоні нерівномірні, і наступний крок виконується
+    діленням навпіл.
     
     Args:
         arr (list): Відсортований масив
         target (float): Значення для пошуку
+        adaptive (bool): Чи переходити на двійковий пошук при деградації
         
     Returns:
-        tuple: (кількість_ітерацій, верхня_межа, лог_кроків)
+        tuple: (кількість_ітерацій, верхня_межа)
     """
-    if not arr:
-        return (0, None, ["Масив порожній"])
+    if len(arr) == 0:
+        return (0, None)
     
-    left = 0
-    right = len(arr) - 1
-    iterations = 0
-    upper_bound = None
-    log = []
+    lo, hi = 0, len(arr) - 1
+    iterations = 1
+    if arr[lo] >= target:
+        return (iterations, arr[lo])
+    if arr[hi] < target:
+        return (iterations, None)
     
-    log.append(f"Початковий масив: {arr}")
-    log.append(f"Шукаємо: {target}")
+    # Кількість поспіль кроків інтерполяції, що не скоротили діапазон удвічі
+    misses = 0
+    while hi - lo > 1:
+        iterations += 1
+        width = hi - lo
+        bisecting = misses == _ADAPTIVE_MAX_MISSES
+        if bisecting:
+            pos = (lo + hi) // 2
+            misses = 0
+        else:
+            pos = _interpolate(arr, lo, hi, target)
+        if arr[pos] < target:
+            lo = pos
+        else:
+            hi = pos
+        if adaptive and not bisecting:
+            misses = misses + 1 if 2 * (hi - lo) > width else 0
+    return (iterations, arr[hi])
+
+
+def interpolation_search_with_upper_bound(arr, target):
+    """
+    Інтерполяційний пошук верхньої межі.
+    
+    Для рівномірно розподілених даних позиція target оцінюється за
+    значеннями на краях діапазону, що дає в середньому O(log log n)
+    ітерацій. На нерівномірних даних кількість ітерацій може сягати O(n).
+    
+    Args:
+        arr (list): Відсортований масив дробових чисел
+        target (float): Значення для пошуку
+        
+    Returns:
+        tuple: (кількість_ітерацій, верхня_межа) - як у binary_search_with_upper_bound
+    """
+    return _upper_bound_search(arr, target, adaptive=False)
+
+
+def adaptive_search_with_upper_bound(arr, target):
+    """
+    Інтерполяційний пошук з переходом на двійковий при деградації.
+    
+    Кожна проба інтерполяції перевіряє розподіл на поточному діапазоні.
+    Якщо дві проби поспіль не скоротили діапазон хоча б удвічі, наступна
+    ітерація ділить діапазон навпіл, тож навіть на нерівномірних даних
+    пошук займає не більше 3·log2(n) ітерацій.
+    
+    Args:
+        arr (list): Відсортований масив дробових чисел
+        target (float): Значення для пошуку
+        
+    Returns:
+        tuple: (кількість_ітерацій, верхня_межа) - як у binary_search_with_upper_bound
+    """
+    return _upper_bound_search(arr, target, adaptive=True)
+
+
+def exponential_search_with_upper_bound(arr, target):
+    """
+    Експоненційний (галопуючий) пошук верхньої межі.
+    
+    Спочатку межа діапазону подвоюється (1, 2, 4, ...), доки не стане
+    не меншою за target, після чого діапазон уточнюється двійковим
+    пошуком. Займає O(log i) ітерацій, де i - позиція результату, тому
+    вигідний, коли результат близько до початку масиву.
+    
+    Args:
+        arr (list): Відсортований масив дробових чисел
+        target (float): Значення для пошуку
+        
+    Returns:
+        tuple: (кількість_ітерацій, верхня_межа) - як у binary_search_with_upper_bound
+    """
+    n = len(arr)
+    if not n:
+        return (0, None)
+    
+    iterations = 1
+    if arr[0] >= target:
+        return (iterations, arr[0])
+    
+    bound = 1
+    while bound < n and arr[bound] < target:
+        iterations += 1
+        bound *= 2
     
+    # arr[bound // 2] < target, а arr[bound] >= target (якщо bound < n)
+    lo, hi = bound // 2 + 1, min(bound, n)
+    while lo < hi:
+        iterations += 1
+        mid = (lo + hi) // 2
+        if arr[mid] < target:
+            lo = mid + 1
+        else:
+            hi = mid
+    return (iterations, arr[lo] if lo < n else None)
+
+
+SEARCH_MODES = {
+    "binary": binary_search_with_upper_bound,
+    "interpolation": interpolation_search_with_upper_bound,
+    "exponential": exponential_search_with_upper_bound,
+    "adaptive": adaptive_search_with_upper_bound,
+}
+
+
+def _as_float64_buffer(arr):
+    """
+    Повертає масив NumPy, що спільно використовує пам'ять arr, або None.
+    
+    Перетворення звичайного списку коштувало б O(n) на кожен виклик,
+    тому векторизований шлях використовується лише для масивів NumPy
+    та буферів float64 (array('d'), memoryview), які не потребують копіювання.
+    """
+    if np is None:
+        return None
+    if isinstance(arr, np.ndarray):
+        return arr
+    try:
+        view = memoryview(arr)
+    except TypeError:
+        return None
+    if view.format != 'd' or view.ndim != 1:
+        return None
+    return np.frombuffer(view, dtype=np.float64)
+
+
+def _search_iterations(n, left_index, right_index):
+    """
+    Відтворює кількість ітерацій binary_search_with_upper_bound за
+    межами рівних елементів, не порівнюючи самі елементи.
+    
+    Елементи з індексами < left_index менші за ціль, з індексами
+    >= right_index - більші, решта дорівнюють цілі, тож шлях пошуку
+    повністю визначається цими двома індексами.
+    
+    Args:
+        n (int): Довжина масиву
+        left_index (int): Перша позиція з елементом >= цілі
+        right_index (int): Перша позиція з елементом > цілі
+        
+    Returns:
+        int: Кількість ітерацій
+    """
+    left = 0
+    right = n - 1
+    iterations = 0
     while left <= right:
         iterations += 1
         mid = (left + right) // 2
+        if mid < left_index:
+            left = mid + 1
+        elif mid >= right_index:
+            right = mid - 1
+        else:
+            break
+    return iterations
+
+
+def search_many(arr, targets):
+    """
+    Знаходить верхні межі для багатьох значень в одному масиві.
+    
+    Для масивів NumPy та буферів float64 усі цілі обробляються
+    векторизованими викликами numpy.searchsorted, а шляхи пошуку для
+    підрахунку ітерацій проходяться одночасно. Інакше межа знаходиться
+    модулем bisect (реалізований на C), а кількість ітерацій - спуском
+    лише за індексами, тож виграш над циклом викликів
+    binary_search_with_upper_bound помірний.
+    
+    Args:
+        arr: Відсортований масив дробових чисел
+        targets: Значення для пошуку
+        
+    Returns:
+        list: Ті самі кортежі (кількість_ітерацій, верхня_межа), що й
+            binary_search_with_upper_bound, у порядку targets. Кількість
+            ітерацій обчислюється за точками вставки без повторних
+            порівнянь елементів
+    """
+    targets = list(targets)
+    n = len(arr)
+    if not n:
+        return [(0, None)] * len(targets)
+    
+    values = _as_float64_buffer(arr)
+    if values is not None:
+        targets = np.asarray(targets, dtype=np.float64)
+        left_index = np.searchsorted(values, targets, side='left')
+        # searchsorted ставить NaN у кінець, а порівняння з NaN у циклі
+        # завжди хибні й ведуть пошук ліворуч - до позиції 0
+        left_index[np.isnan(targets)] = 0
+        # Рівні елементи шукаємо лише там, де arr[left_index] == target,
+        # тож для NaN, як і в циклі, right_index == left_index
+        clipped = np.minimum(left_index, n - 1)
+        equal = (left_index < n) & (values[clipped] == targets)
+        right_index = np.where(equal, np.searchsorted(values, targets, side='right'), left_index)
         
-        log.append(f"Ітерація {iterations}: left={left}, right={right}, mid={mid}")
-        log.append(f"  arr[{mid}] = {arr[mid]}")
+        # Усі пошуки просуваються одночасно, не довше за глибину дерева
+        left = np.zeros(len(targets), dtype=np.int64)
+        right = np.full(len(targets), n - 1, dtype=np.int64)
+        iterations = np.zeros(len(targets), dtype=np.int64)
+        active = np.ones(len(targets), dtype=bool)
+        for _ in range(n.bit_length()):
+            iterations += active
+            mid = (left + right) // 2
+            go_right = active & (mid < left_index)
+            go_left = active & (mid >= right_index)
+            left = np.where(go_right, mid + 1, left)
+            right = np.where(go_left, mid - 1, right)
+            active = (go_right | go_left) & (left <= right)
         
-        if arr[mid] == target:
-            log.append(f"  Знайдено точне значення!")
-            return (iterations, arr[mid], log)
-        elif arr[mid] < target:
-            log.append(f"  {arr[mid]} < {target}, рухаємося вправо")
-            left = mid + 1
+        return [(count, float(values[i]) if i < n else None)
+                for count, i in zip(iterations.tolist(), left_index.tolist())]
+    
+    search_left = bisect.bisect_left
+    search_right = bisect.bisect_right
+    results = []
+    append = results.append
+    for target in targets:
+        i = search_left(arr, target)
+        if i < n and arr[i] == target:
+            append((_search_iterations(n, i, search_right(arr, target, i)), arr[i]))
         else:
-            log.append(f"  {arr[mid]} > {target}, рухаємося вліво")
-            upper_bound = arr[mid]
-            log.append(f"  Нова верхня межа: {upper_bound}")
-            right = mid - 1
+            append((_search_iterations(n, i, i), arr[i] if i < n else None))
+    return results
+
+
+class StaticSortedIndex:
+    """
+    Незмінний індекс відсортованого масиву в розкладці Ейтцінгера.
+    
+    Елементи зберігаються в компактному array('d') у порядку обходу
+    неявного двійкового дерева в ширину: корінь у позиції 1, нащадки
+    вузла k - у позиціях 2k та 2k + 1. Перші рівні дерева, які
+    відвідує кожен запит, лежать поруч у пам'яті, а спуск не потребує
+    обчислення меж діапазону.
+    
+    Дерево доповнюється до повного (2^h - 1 вузлів) копіями максимального
+    елемента: так кожен рівень будується одним зрізом з кроком, а пошук
+    завжди виконує рівно h ітерацій.
+    """
+    
+    def __init__(self, sorted_values):
+        """
+        Будує індекс з відсортованого масиву.
+        
+        Args:
+            sorted_values: Відсортовані за неспаданням дробові числа
+            
+        Raises:
+            ValueError: Якщо масив не відсортований або містить NaN
+        """
+        source = array('d', sorted_values)
+        # NaN не дорівнює сам собі й порушує порівняння з будь-яким сусідом
+        ordered = all(a <= b for a, b in zip(source, itertools.islice(source, 1, None)))
+        if not ordered or (len(source) == 1 and source[0] != source[0]):
+            raise ValueError("масив має бути відсортований за неспаданням і не містити NaN")
+        
+        self._size = len(source)
+        height = self._size.bit_length()
+        capacity = (1 << height) - 1
+        if capacity > self._size:
+            source.extend(array('d', [source[-1]]) * (capacity - self._size))
+        
+        # Позиція 0 не використовується, щоб нащадки вузла k були 2k та 2k + 1
+        tree = array('d', [0.0]) * (capacity + 1)
+        for depth in range(height):
+            # Вузли рівня depth - це кожен 2^(height - depth)-й елемент
+            # відсортованого масиву, починаючи з 2^(height - depth - 1) - 1
+            step = 1 << (height - depth)
+            tree[1 << depth:2 << depth] = source[(step >> 1) - 1::step]
+        self._tree = tree
+        self._height = height
+    
+    def __len__(self):
+        return self._size
+    
+    def search(self, target):
+        """
+        Знаходить верхню межу так само, як binary_search_with_upper_bound.
+        
+        Args:
+            target (float): Значення для пошуку
+            
+        Returns:
+            tuple: (кількість_ітерацій, верхня_межа)
+                - кількість_ітерацій: висота дерева, тобто ceil(log2(n + 1))
+                - верхня_межа: найменший елемент >= target, або None якщо такого немає
+        """
+        tree = self._tree
+        end = len(tree)
+        k = 1
+        while k < end:
+            # Праворуч, якщо вузол менший за target, інакше ліворуч
+            k = 2 * k + (tree[k] < target)
+        # Остання позиція, де пошук повернув ліворуч, - це k без
+        # кінцевих одиничних бітів (поворотів праворуч) та ще одного біта
+        k >>= (~k & (k + 1)).bit_length()
+        return (self._height, tree[k] if k else None)
+    
+    @property
+    def nbytes(self):
+        """Розмір буфера дерева в байтах."""
+        return self._tree.itemsize * len(self._tree)
+
+
+class LearnedIndex:
+    """
+    Навчений кусково-лінійний індекс відсортованого масиву.
+    
+    Масив ділиться на сегменти, у кожному з яких позиція першого входження
+    значення x передбачається лінійною моделлю start + slope * (x - key)
+    з похибкою не більше error. Пошук знаходить сегмент двійковим пошуком
+    серед ключів сегментів (їх зазвичай на порядки менше за елементи) і
+    уточнює позицію в околі передбачення шириною 2 * error.
+    
+    Індекс зберігає посилання на масив, а не копію, тому масив не можна
+    змінювати після побудови.
+    """
+    
+    def __init__(self, arr, error=32):
+        """
+        Будує сегменти одним проходом алгоритмом звуження конуса.
+        
+        Для кожного сегмента підтримується діапазон нахилів [low, high], за
+        яких усі точки сегмента передбачаються з похибкою не більше error.
+        Кожна нова точка звужує діапазон; коли він стає порожнім, точка
+        починає новий сегмент.
+        
+        Args:
+            arr: Відсортована послідовність дробових чисел без NaN
+            error (int): Гарантована похибка передбачення позиції
+            
+        Raises:
+            ValueError: Якщо масив не відсортований, містить NaN або error < 1
+        """
+        if error < 1:
+            raise ValueError("error має бути не менше 1")
+        self._arr = arr
+        self._size = len(arr)
+        self.error = error
+        
+        # Моделюються лише перші входження значень: для дублікатів
+        # позиція першого з них і є відповіддю на запит
+        keys = array('d')
+        positions = array('q')
+        previous = None
+        for index, value in enumerate(arr):
+            if value != value or (previous is not None and value < previous):
+                raise ValueError("масив має бути відсортований за неспаданням і не містити NaN")
+            if value != previous:
+                keys.append(value)
+                positions.append(index)
+                previous = value
+        
+        self._keys = array('d')
+        self._starts = array('q')
+        self._slopes = array('d')
+        count = len(keys)
+        i = 0
+        while i < count:
+            key, start = keys[i], positions[i]
+            low, high = 0.0, math.inf
+            j = i + 1
+            while j < count:
+                dx = keys[j] - key
+                if not math.isfinite(dx):
+                    # Нескінченні значення утворюють окремі сегменти
+                    break
+                dy = positions[j] - start
+                new_low = max(low, (dy - error) / dx)
+                new_high = min(high, (dy + error) / dx)
+                if new_low > new_high:
+                    break
+                low, high = new_low, new_high
+                j += 1
+            self._keys.append(key)
+            self._starts.append(start)
+            self._slopes.append((low + high) / 2 if j > i + 1 else 0.0)
+            i = j
+    
+    def __len__(self):
+        return self._size
+    
+    @property
+    def segments(self):
+        """Кількість лінійних сегментів моделі."""
+        return len(self._keys)
+    
+    @property
+    def nbytes(self):
+        """Розмір моделі (ключі, початки та нахили сегментів) у байтах."""
+        return sum(part.itemsize * len(part) for part in (self._keys, self._starts, self._slopes))
+    
+    def search(self, target):
+        """
+        Знаходить верхню межу так само, як binary_search_with_upper_bound.
+        
+        Args:
+            target (float): Значення для пошуку
+            
+        Returns:
+            tuple: (кількість_ітерацій, верхня_межа)
+                - кількість_ітерацій: глибина двійкового пошуку серед
+                  сегментів плюс глибина пошуку в околі передбачення
+                - верхня_межа: найменший елемент >= target, або None якщо такого немає
+                
+        Raises:
+            ValueError: Якщо target - NaN
+        """
+        if target != target:
+            _check_bound(target)
+        arr = self._arr
+        n = self._size
+        if not n:
+            return (0, None)
+        # Цілі поза діапазоном масиву не потребують моделі
+        if target <= arr[0]:
+            return (1, arr[0])
+        if target > arr[n - 1]:
+            return (1, None)
+        
+        keys = self._keys
+        segments = len(keys)
+        segment = bisect.bisect_right(keys, target) - 1
+        iterations = segments.bit_length()
+        start = self._starts[segment]
+        key = keys[segment]
+        if key == target:
+            return (iterations, arr[start])
+        
+        # Відповідь лежить між початком цього та наступного сегмента
+        end = self._starts[segment + 1] if segment + 1 < segments else n
+        slope = self._slopes[segment]
+        predicted = start + slope * (target - key) if slope else start
+        predicted = int(min(max(predicted, start), end))
+        error = self.error
+        lo = max(start, predicted - error - 1)
+        hi = min(end, predicted + error + 2)
+        iterations += (hi - lo).bit_length()
+        index = bisect.bisect_left(arr, target, lo, hi)
+        if index == hi and hi < end:
+            # Довгі серії дублікатів можуть вийти за межі похибки, яка
+            # гарантована лише для перших входжень значень
+            iterations += (end - hi).bit_length()
+            index = bisect.bisect_left(arr, target, hi, end)
+        elif index == lo and lo > start and arr[lo - 1] >= target:
+            iterations += (lo - start).bit_length()
+            index = bisect.bisect_left(arr, target, start, lo)
+        return (iterations, arr[index] if index < n else None)
+
+
+class FingerSearcher:
+    """
+    Пошук верхньої межі з пам'яттю про позицію попереднього результату.
+    
+    Кожен запит галопує від попередньої позиції (пальця) кроками 1, 2,
+    4, ... у бік target і уточнює результат двійковим пошуком в останньому
+    кроці. Якщо результат змістився на d позицій, пошук займає O(log d)
+    замість O(log n), тому послідовності близьких цілей (наприклад,
+    часовий ряд цін) обробляються значно швидше.
+    
+    Масив не можна змінювати між запитами - позиція пальця відноситься
+    до його поточного вмісту.
+    """
+    
+    def __init__(self, arr):
+        """
+        Args:
+            arr: Відсортована послідовність дробових чисел
+        """
+        self._arr = arr
+        self.position = 0
+    
+    def search(self, target):
+        """
+        Знаходить верхню межу так само, як binary_search_with_upper_bound.
+        
+        Args:
+            target (float): Значення для пошуку
+            
+        Returns:
+            tuple: (кількість_ітерацій, верхня_межа)
+                - кількість_ітерацій: кроки галопування плюс глибина
+                  двійкового пошуку в останньому кроці
+                - верхня_межа: найменший елемент >= target, або None якщо такого немає
+        """
+        arr = self._arr
+        n = len(arr)
+        if not n:
+            return (0, None)
+        
+        finger = min(self.position, n - 1)
+        iterations = 1
+        step = 1
+        if arr[finger] >= target:
+            # Результат не правіше за палець: галопуємо ліворуч, доки не
+            # знайдемо елемент, менший за target
+            hi = finger
+            lo = hi - step
+            while lo >= 0 and arr[lo] >= target:
+                iterations += 1
+                hi = lo
+                step *= 2
+                lo = hi - step
+            lo = max(lo + 1, 0)
+        else:
+            # Результат правіше за палець: галопуємо праворуч, доки не
+            # знайдемо елемент, не менший за target
+            lo = finger
+            hi = lo + step
+            while hi < n and arr[hi] < target:
+                iterations += 1
+                lo = hi
+                step *= 2
+                hi = lo + step
+            lo += 1
+            hi = min(hi, n)
+        
+        # Результат лежить у [lo, hi]
+        iterations += (hi - lo).bit_length()
+        index = bisect.bisect_left(arr, target, lo, hi)
+        self.position = index
+        return (iterations, arr[index] if index < n else None)
+
+
+class SortedFloatList:
+    """
+    Змінюваний відсортований список дробових чисел.
+    
+    Елементи зберігаються в послідовності відсортованих підсписків
+    довжиною близько _LOAD, а окремий список _maxes містить максимум
+    кожного підсписку. Пошук виконує два двійкові пошуки (у _maxes і в
+    одному підсписку), а вставка й видалення зсувають лише елементи
+    одного підсписку замість усього масиву.
+    """
+    
+    # Бажана довжина підсписку: підсписок довший за 2 * _LOAD ділиться
+    # навпіл, коротший за _LOAD // 2 зливається з сусіднім
+    _LOAD = 1000
+    
+    def __init__(self, values=()):
+        """
+        Створює список і завантажує в нього values.
+        
+        Args:
+            values: Початкові значення в будь-якому порядку
+        """
+        self._lists = []
+        self._maxes = []
+        self._len = 0
+        self.update(values)
+    
+    def __len__(self):
+        return self._len
+    
+    def __iter__(self):
+        return itertools.chain.from_iterable(self._lists)
+    
+    def __contains__(self, value):
+        pos = bisect.bisect_left(self._maxes, value)
+        if pos == len(self._maxes):
+            return False
+        sublist = self._lists[pos]
+        return sublist[bisect.bisect_left(sublist, value)] == value
+    
+    def __repr__(self):
+        return f"SortedFloatList({list(self)})"
+    
+    @staticmethod
+    def _check(value):
+        """Відхиляє NaN, який не можна впорядкувати відносно інших чисел."""
+        if value != value:
+            raise ValueError("NaN не можна додати до відсортованого списку")
+    
+    def _load(self, values):
+        """Замінює вміст відсортованими values, розбитими на підсписки."""
+        load = self._LOAD
+        self._lists = [values[i:i + load] for i in range(0, len(values), load)]
+        self._maxes = [sublist[-1] for sublist in self._lists]
+        self._len = len(values)
+    
+    def update(self, values):
+        """
+        Додає багато значень одразу.
+        
+        Якщо нових значень небагато порівняно з розміром списку, кожне
+        вставляється окремо. Інакше весь вміст перебудовується одним
+        сортуванням: Timsort зливає вже відсортовану частину з новими
+        значеннями за лінійний час від її довжини.
+        
+        Args:
+            values: Значення в будь-якому порядку
+            
+        Raises:
+            ValueError: Якщо серед значень є NaN
+        """
+        values = list(values)
+        for value in values:
+            self._check(value)
+        if not values:
+            return
+        if len(values) * 8 < self._len:
+            for value in values:
+                self.add(value)
+            return
+        values.sort()
+        if self._len:
+            values = sorted(itertools.chain(self, values))
+        self._load(values)
+    
+    def add(self, value):
+        """
+        Додає значення, зберігаючи порядок.
+        
+        Args:
+            value (float): Значення для додавання
+            
+        Raises:
+            ValueError: Якщо value - NaN
+        """
+        self._check(value)
+        maxes = self._maxes
+        if not maxes:
+            self._lists.append([value])
+            maxes.append(value)
+            self._len = 1
+            return
+        
+        pos = bisect.bisect_right(maxes, value)
+        if pos == len(maxes):
+            # Значення більше за всі наявні - дописуємо в останній підсписок
+            pos -= 1
+            self._lists[pos].append(value)
+            maxes[pos] = value
+        else:
+            bisect.insort_right(self._lists[pos], value)
+        self._len += 1
+        
+        sublist = self._lists[pos]
+        if len(sublist) > 2 * self._LOAD:
+            half = len(sublist) // 2
+            self._lists.insert(pos + 1, sublist[half:])
+            del sublist[half:]
+            maxes.insert(pos, sublist[-1])
+    
+    def remove(self, value):
+        """
+        Видаляє одне входження значення.
+        
+        Args:
+            value (float): Значення для видалення
+            
+        Raises:
+            ValueError: Якщо значення немає в списку
+        """
+        maxes = self._maxes
+        pos = bisect.bisect_left(maxes, value)
+        if pos < len(maxes):
+            sublist = self._lists[pos]
+            index = bisect.bisect_left(sublist, value)
+            if sublist[index] == value:
+                del sublist[index]
+                self._len -= 1
+                self._shrink(pos)
+                return
+        raise ValueError(f"{value!r} немає в списку")
+    
+    def discard(self, value):
+        """Видаляє одне входження значення, якщо воно є."""
+        try:
+            self.remove(value)
+        except ValueError:
+            pass
+    
+    def _shrink(self, pos):
+        """Оновлює підсписок pos після видалення та зливає замалий підсписок."""
+        lists = self._lists
+        maxes = self._maxes
+        sublist = lists[pos]
+        if not sublist:
+            del lists[pos]
+            del maxes[pos]
+            return
+        maxes[pos] = sublist[-1]
+        if len(sublist) < self._LOAD // 2 and len(lists) > 1:
+            # Зливаємо з лівим сусідом (або правим для першого підсписку)
+            if pos == 0:
+                pos = 1
+            lists[pos - 1].extend(lists[pos])
+            maxes[pos - 1] = lists[pos - 1][-1]
+            del lists[pos]
+            del maxes[pos]
+            # Злитий підсписок міг стати задовгим
+            sublist = lists[pos - 1]
+            if len(sublist) > 2 * self._LOAD:
+                half = len(sublist) // 2
+                lists.insert(pos, sublist[half:])
+                del sublist[half:]
+                maxes.insert(pos - 1, sublist[-1])
+    
+    def search(self, target):
+        """
+        Знаходить верхню межу так само, як binary_search_with_upper_bound.
+        
+        Args:
+            target (float): Значення для пошуку
+            
+        Returns:
+            tuple: (кількість_ітерацій, верхня_межа)
+                - кількість_ітерацій: сумарна глибина двійкового пошуку
+                  в _maxes та в підсписку
+                - верхня_межа: найменший елемент >= target, або None якщо такого немає
+        """
+        maxes = self._maxes
+        iterations = len(maxes).bit_length()
+        pos = bisect.bisect_left(maxes, target)
+        if pos == len(maxes):
+            return (iterations, None)
+        sublist = self._lists[pos]
+        iterations += len(sublist).bit_length()
+        return (iterations, sublist[bisect.bisect_left(sublist, target)])
+
+
+_SORTED_FILE_MAGIC = b"SRTF64LE"
+_SORTED_FILE_HEADER = struct.Struct("<8sIIQ")  # magic, версія, резерв, кількість
+_SORTED_FILE_VERSION = 1
+# Значення записуються частинами, щоб не тримати в пам'яті весь набір
+_SORTED_FILE_CHUNK = 1 << 16
+
+
+def save_sorted_floats(path, values):
+    """
+    Записує відсортовані дробові числа у файл для відкриття через mmap.
+    
+    Файл складається з 24-байтового заголовка та значень float64 у порядку
+    little-endian без жодного перетворення, тож SortedFloatFile віддає їх
+    пошуковим функціям напряму зі сторінкового кешу. Значення читаються
+    й записуються частинами, тому values може бути генератором, більшим
+    за оперативну пам'ять.
+    
+    Args:
+        path (str): Шлях до файлу
+        values: Відсортовані за неспаданням дробові числа
+        
+    Returns:
+        int: Кількість записаних значень
+        
+    Raises:
+        ValueError: Якщо значення не відсортовані або містять NaN
+    """
+    iterator = iter(values)
+    count = 0
+    previous = None
+    with open(path, "wb") as f:
+        # Кількість стає відомою лише в кінці - заголовок перезаписується
+        f.write(_SORTED_FILE_HEADER.pack(_SORTED_FILE_MAGIC, _SORTED_FILE_VERSION, 0, 0))
+        while True:
+            chunk = array('d', itertools.islice(iterator, _SORTED_FILE_CHUNK))
+            if not chunk:
+                break
+            ordered = all(a <= b for a, b in zip(chunk, itertools.islice(chunk, 1, None)))
+            if not ordered or chunk[0] != chunk[0] or (previous is not None and previous > chunk[0]):
+                raise ValueError("значення мають бути відсортовані за неспаданням і не містити NaN")
+            previous = chunk[-1]
+            count += len(chunk)
+            if sys.byteorder != "little":
+                chunk.byteswap()
+            chunk.tofile(f)
+        f.seek(0)
+        f.write(_SORTED_FILE_HEADER.pack(_SORTED_FILE_MAGIC, _SORTED_FILE_VERSION, 0, count))
+    return count
+
+
+class SortedFloatFile:
+    """
+    Відсортований файл float64, відкритий через mmap лише для читання.
+    
+    Атрибут values - це memoryview формату 'd' над відображеним файлом,
+    який можна передати будь-якій пошуковій функції цього модуля замість
+    списку. Пошук читає лише сторінки, яких торкаються його проби, тому
+    набір даних може бути більшим за оперативну пам'ять.
+    """
+    
+    def __init__(self, path):
+        """
+        Відкриває файл, створений save_sorted_floats.
+        
+        Args:
+            path (str): Шлях до файлу
+            
+        Raises:
+            ValueError: Якщо файл має інший формат або платформа не little-endian
+        """
+        if sys.byteorder != "little":
+            raise ValueError("файл можна відобразити без перетворення лише на little-endian платформі")
+        self.path = path
+        self._file = open(path, "rb")
+        try:
+            self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Порожній файл неможливо відобразити в пам'ять
+            self._file.close()
+            raise ValueError(f"'{path}' не є файлом відсортованих чисел")
+        
+        header_size = _SORTED_FILE_HEADER.size
+        if len(self._mmap) < header_size:
+            self._close_mapping()
+            raise ValueError(f"'{path}' не є файлом відсортованих чисел")
+        magic, version, _, count = _SORTED_FILE_HEADER.unpack_from(self._mmap, 0)
+        if (magic != _SORTED_FILE_MAGIC or version != _SORTED_FILE_VERSION
+                or len(self._mmap) != header_size + count * 8):
+            self._close_mapping()
+            raise ValueError(f"'{path}' не є файлом відсортованих чисел версії {_SORTED_FILE_VERSION}")
+        
+        self._raw = memoryview(self._mmap)
+        self.values = self._raw[header_size:].cast('d')
+    
+    def _close_mapping(self):
+        self._mmap.close()
+        self._file.close()
+    
+    def close(self):
+        """
+        Звільняє values та закриває відображення і файл.
+        
+        Після закриття звернення до values викликає ValueError.
+        """
+        self.values.release()
+        self._raw.release()
+        self._close_mapping()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
+    
+    def __len__(self):
+        return len(self.values)
+    
+    def search(self, target):
+        """
+        Знаходить верхню межу у файлі через binary_search_with_upper_bound.
+        
+        Args:
+            target (float): Значення для пошуку
+            
+        Returns:
+            tuple: (кількість_ітерацій, верхня_межа)
+        """
+        return binary_search_with_upper_bound(self.values, target)
+
+
+def binary_search_detailed(arr, target):
+    """
+    Детальна версія двійкового пошуку з логуванням кроків.
+    
+    Виконує binary_search_with_upper_bound з трасувальником, що
+    перетворює кожну подію SearchEvent на рядки логу.
+    
+    Args:
+        arr (list): Відсортований масив
+        target (float): Значення для пошуку
+        
+    Returns:
+        tuple: (кількість_ітерацій, верхня_межа, лог_кроків)
+    """
+    if not len(arr):
+        return (0, None, ["Масив порожній"])
+    
+    # Розмір замість самого масиву: виведення всіх елементів коштувало б O(n)
+    log = [f"Масив з {len(arr)} елементів", f"Шукаємо: {target}"]
+    
+    def tracer(event):
+        log.append(f"Ітерація {event.iteration}: left={event.left}, right={event.right}, mid={event.mid}")
+        log.append(f"  arr[{event.mid}] = {event.value}")
+        if event.comparison == "==":
+            log.append("  Знайдено точне значення!")
+        elif event.comparison == "<":
+            log.append(f"  {event.value} < {target}, рухаємося вправо")
+        else:
+            log.append(f"  {event.value} > {target}, рухаємося вліво")
+            log.append(f"  Нова верхня межа: {event.value}")
+    
+    iterations, upper_bound = binary_search_with_upper_bound(arr, target, tracer=tracer)
+    
+    if upper_bound is None:
+        log.append("Верхня межа не знайдена - всі елементи менші за target")
+    elif upper_bound != target:
+        # Рівне target значення пошук завжди знаходить точним збігом
+        log.append(f"Верхня межа знайдена: {upper_bound}")
+    return (iterations, upper_bound, log)
+
+
+def test_binary_search():
+    """
+    Тестує функцію двійкового пошуку на різних випадках.
+    """
+    print("🔍 Тестування двійкового пошуку з верхньою межею")
+    print("=" * 60)
+    
+    # Тестові масиви
+    test_arrays = [
+        [1.1, 2.3, 3.5, 4.7, 5.9, 7.1, 8.3, 9.5],
+        [0.5, 1.0, 1.5, 2.0, 2.5, 3.0, 3.5, 4.0, 4.5, 5.0],
+        [10.0, 20.0, 30.0, 40.0, 50.0],
+        [3.14159, 2.71828, 1.41421, 0.57722],  # Несортований для демонстрації
+        []  # Порожній масив
+    ]
+    
+    # Сортуємо несортований масив
+    test_arrays[3] = sorted(test_arrays[3])
+    
+    test_cases = [
+        # (масив_індекс, значення_для_пошуку, опис)
+        (0, 3.5, "точне значення в середині"),
+        (0, 3.6, "значення між елементами"),
+        (0, 0.5, "значення менше мінімального"),
+        (0, 10.0, "значення більше максимального"),
+        (0, 1.1, "точне значення на початку"),
+        (0, 9.5, "точне значення в кінці"),
+        (1, 2.25, "значення між елементами"),
+        (1, 5.5, "значення більше максимального"),
+        (2, 25.0, "значення між елементами"),
+        (2, 5.0, "значення менше мінімального"),
+        (3, 1.5, "значення в відсортованому масиві"),
+        (4, 1.0, "пошук в порожньому масиві"),
+    ]
+    
+    for i, (arr_idx, target, description) in enumerate(test_cases, 1):
+        print(f"\n📋 Тест {i}: {description}")
+        
+        if arr_idx < len(test_arrays):
+            arr = test_arrays[arr_idx]
+            print(f"   Масив: {arr}")
+            print(f"   Шукаємо: {target}")
+            
+            iterations, upper_bound = binary_search_with_upper_bound(arr, target)
+            
+            print(f"   ✅ Результат: ({iterations} ітерацій, верхня межа: {upper_bound})")
+            
+            # Перевірка правильності
+            if upper_bound is not None:
+                # Перевіряємо, що upper_bound >= target
+                if upper_bound >= target:
+                    print(f"   ✓ Верхня межа коректна: {upper_bound} >= {target}")
+                else:
+                    print(f"   ✗ Помилка: {upper_bound} < {target}")
+                
+                # Перевіряємо, що це найменший такий елемент
+                smaller_elements = [x for x in arr if x >= target and x < upper_bound]
+                if not smaller_elements:
+                    print(f"   ✓ Це найменший елемент >= {target}")
+                else:
+                    print(f"   ✗ Знайдено менші елементи: {smaller_elements}")
+            else:
+                # Перевіряємо, що дійсно немає елементів >= target
+                valid_elements = [x for x in arr if x >= target]
+                if not valid_elements:
+                    print(f"   ✓ Коректно: немає елементів >= {target}")
+                else:
+                    print(f"   ✗ Помилка: знайдено елементи >= {target}: {valid_elements}")
+
+
+def test_search_many():
+    """
+    Перевіряє, що search_many повертає ті самі кортежі
+    (кількість_ітерацій, верхня_межа), що й binary_search_with_upper_bound,
+    зокрема для масивів з повторами та для NaN і нескінченностей.
+    """
+    import random
+    
+    print("\n" + "=" * 60)
+    print("⚡ Тестування search_many")
+    print("=" * 60)
+    
+    arr = [1.1, 2.3, 3.5, 4.7, 5.9, 7.2, 8.4, 9.5]
+    print(f"   search_many({arr}, [3.6, 3.5, 10.0]) = {search_many(arr, [3.6, 3.5, 10.0])}")
+    
+    random.seed(12)
+    errors = 0
+    checks = 0
+    for _ in range(500):
+        # Цілі значення дають повтори, дробові - різні елементи
+        arr = sorted(random.choice([float(random.randint(0, 10)), random.uniform(0, 10)])
+                     for _ in range(random.randint(0, 40)))
+        targets = [random.uniform(-1, 11) for _ in range(5)]
+        targets += random.sample(arr, min(5, len(arr)))
+        targets += [float('nan'), float('inf'), float('-inf')]
+        expected = [binary_search_with_upper_bound(arr, target) for target in targets]
+        for data in (arr, array('d', arr)):
+            checks += 1
+            if search_many(data, targets) != expected:
+                errors += 1
+    
+    mark = "✓" if errors == 0 else "✗"
+    print(f"   {mark} Перевірено {checks} наборів цілей, помилок: {errors}")
+
+
+def test_tracing():
+    """
+    Перевіряє, що трасувальник не змінює результату пошуку та отримує
+    по одній події на кожну ітерацію.
+    """
+    import random
+    
+    print("\n" + "=" * 60)
+    print("🧾 Тестування трасування пошуку")
+    print("=" * 60)
+    
+    random.seed(29)
+    errors = 0
+    checks = 0
+    for size in range(0, 40):
+        arr = sorted(random.choice([random.uniform(0, 10), 5.0]) for _ in range(size))
+        for target in [random.uniform(-1, 11) for _ in range(20)] + arr[:3]:
+            checks += 1
+            events = []
+            result = binary_search_with_upper_bound(arr, target, tracer=events.append)
+            if result != binary_search_with_upper_bound(arr, target) or len(events) != result[0]:
+                errors += 1
+            elif any(event.value != arr[event.mid] or not event.left <= event.mid <= event.right
+                     for event in events):
+                errors += 1
+            if binary_search_detailed(arr, target)[:2] != result:
+                errors += 1
+    
+    mark = "✓" if errors == 0 else "✗"
+    print(f"   {mark} Перевірено {checks} випадків, помилок: {errors}")
+
+
+def test_bounds():
+    """
+    Перевіряє lower_bound, upper_bound, floor та ceiling повним перебором
+    на масивах з дублікатами, з key та обмеженим діапазоном.
+    """
+    import random
+    
+    print("\n" + "=" * 60)
+    print("📐 Тестування lower_bound / upper_bound / floor / ceiling")
+    print("=" * 60)
+    
+    def expected(arr, target, lo, hi, key):
+        # Еталон: лінійний перебір діапазону
+        values = [key(x) for x in arr[lo:hi]]
+        lower = lo + sum(1 for v in values if v < target)
+        upper = lo + sum(1 for v in values if v <= target)
+        element = lambda i: arr[i] if i < hi else None
+        return {
+            "lower_bound": (lower, element(lower)),
+            "upper_bound": (upper, element(upper)),
+            "ceiling": (lower, arr[lower]) if lower < hi else (None, None),
+            "floor": (upper - 1, arr[upper - 1]) if upper > lo else (None, None),
+        }
+    
+    functions = {
+        "lower_bound": lower_bound,
+        "upper_bound": upper_bound,
+        "ceiling": ceiling,
+        "floor": floor,
+    }
+    
+    random.seed(7)
+    errors = 0
+    checks = 0
+    for _ in range(300):
+        # Невеликий діапазон значень дає багато дублікатів
+        arr = sorted(random.choice([0.5, 1.0, 1.5, 2.0, 2.5]) for _ in range(random.randint(0, 12)))
+        lo = random.randint(0, len(arr))
+        hi = random.randint(lo, len(arr))
+        target = random.choice([-1.0, 0.5, 1.0, 1.25, 2.5, 3.0])
+        for use_key in (False, True):
+            key = (lambda x: -x) if use_key else None
+            data = arr[::-1] if use_key else arr
+            goal = -target if use_key else target
+            reference = expected(data, goal, lo, hi, key or (lambda x: x))
+            for name, func in functions.items():
+                checks += 1
+                if func(data, goal, lo, hi, key=key) != reference[name]:
+                    errors += 1
+    
+    # Діапазони поза масивом відхиляються однаково всіма функціями
+    arr = [1.0, 2.0, 3.0]
+    for lo, hi in [(-1, None), (0, 4), (0, 100), (2, 1), (4, None)]:
+        for name, func in functions.items():
+            checks += 1
+            try:
+                func(arr, 3.5, lo, hi)
+                errors += 1
+            except ValueError:
+                pass
+    
+    for arr, target in [([1.0, 2.0, 2.0, 2.0, 3.0], 2.0), ([1.0, 2.0, 3.0], 10.0)]:
+        print(f"   Масив: {arr}, шукаємо: {target}")
+        for name, func in functions.items():
+            print(f"     {name}: {func(arr, target)}")
+    
+    mark = "✓" if errors == 0 else "✗"
+    print(f"   {mark} Перевірено {checks} випадків, помилок: {errors}")
+
+
+def test_range_queries():
+    """
+    Перевіряє range_query, count_range та rank повним перебором на
+    масивах з дублікатами, -0.0 та нескінченностями, а також відхилення NaN.
+    """
+    import random
+    
+    print("\n" + "=" * 60)
+    print("📏 Тестування range_query / count_range / rank")
+    print("=" * 60)
+    
+    arr = [1.0, 2.0, 2.0, 2.0, 3.0, 4.5]
+    view = range_query(arr, 2.0, 4.0)
+    print(f"   Масив: {arr}")
+    print(f"     range_query(2.0, 4.0) = {view} -> {view.tolist()}")
+    print(f"     count_range(2.0, 4.0) = {count_range(arr, 2.0, 4.0)}, rank(2.0) = {rank(arr, 2.0)}")
+    
+    random.seed(23)
+    inf = float('inf')
+    # -0.0 та 0.0 рівні між собою, тому можуть стояти в масиві в будь-якому порядку
+    pool = [-inf, -1.5, -0.0, 0.0, 0.5, 2.0, inf]
+    errors = 0
+    checks = 0
+    for _ in range(2000):
+        arr = sorted(random.choice(pool) for _ in range(random.randint(0, 15)))
+        lo, hi = random.choice(pool), random.choice(pool)
+        checks += 1
+        expected = [x for x in arr if lo <= x < hi]
+        if (range_query(arr, lo, hi).tolist() != expected
+                or count_range(arr, lo, hi) != len(expected)
+                or rank(arr, lo) != sum(1 for x in arr if x <= lo)):
+            errors += 1
+    
+    # Представлення не копіює дані: зміна масиву видна через нього
+    arr = [1.0, 2.0, 3.0]
+    view = range_query(arr, 2.0, 4.0)
+    arr[2] = 3.5
+    if view.tolist() != [2.0, 3.5]:
+        errors += 1
+    
+    nan = float('nan')
+    for call in (lambda: range_query(arr, nan, 1.0), lambda: count_range(arr, 0.0, nan),
+                 lambda: rank(arr, nan)):
+        try:
+            call()
+            errors += 1
+        except ValueError:
+            pass
+    print("   NaN як межа запиту відхиляється (ValueError)")
+    
+    mark = "✓" if errors == 0 else "✗"
+    print(f"   {mark} Перевірено {checks} випадків, помилок: {errors}")
+
+
+def test_search_modes():
+    """
+    Перевіряє, що всі режими з SEARCH_MODES повертають ту саму верхню межу,
+    що й binary_search_with_upper_bound, на рівномірних, нерівномірних
+    даних та масивах з дублікатами і нескінченностями.
+    """
+    import random
+    
+    print("\n" + "=" * 60)
+    print("🧭 Тестування режимів пошуку")
+    print("=" * 60)
+    
+    arr = [1.1, 2.3, 3.5, 4.7, 5.9, 7.1, 8.3, 9.5]
+    print(f"   Масив: {arr}, шукаємо: 3.6")
+    for name, func in SEARCH_MODES.items():
+        print(f"     {name:<14} {func(arr, 3.6)}")
+    
+    random.seed(21)
+    inf = float('inf')
+    generators = [
+        lambda: random.uniform(0, 10),
+        lambda: random.expovariate(1),
+        lambda: random.choice([1.0, 2.0, 3.0]),
+        lambda: random.choice([random.uniform(0, 10), inf, -inf]),
+    ]
+    errors = 0
+    checks = 0
+    for generate in generators:
+        for size in list(range(12)) + [100, 1000]:
+            arr = sorted(generate() for _ in range(size))
+            targets = [random.uniform(-1, 11) for _ in range(30)] + arr[:10] + [inf, -inf]
+            for target in targets:
+                expected = binary_search_with_upper_bound(arr, target)[1]
+                for func in SEARCH_MODES.values():
+                    checks += 1
+                    if func(arr, target)[1] != expected:
+                        errors += 1
+    
+    mark = "✓" if errors == 0 else "✗"
+    print(f"   {mark} Перевірено {checks} випадків, помилок: {errors}")
+
+
+def test_static_index():
+    """
+    Порівнює StaticSortedIndex з binary_search_with_upper_bound на
+    випадкових масивах різної довжини, зокрема з дублікатами.
+    """
+    import random
+    
+    print("\n" + "=" * 60)
+    print("🌲 Тестування StaticSortedIndex (розкладка Ейтцінгера)")
+    print("=" * 60)
+    
+    arr = [1.1, 2.3, 3.5, 4.7, 5.9, 7.1, 8.3, 9.5]
+    index = StaticSortedIndex(arr)
+    print(f"   Масив: {arr}")
+    print(f"   Дерево: {list(index._tree[1:])}")
+    for target in (3.6, 0.5, 9.5, 10.0):
+        print(f"     search({target}) = {index.search(target)}")
+    
+    random.seed(13)
+    errors = 0
+    checks = 0
+    for size in list(range(20)) + [100, 1000]:
+        arr = sorted(random.choice([random.uniform(0, 10), 5.0]) for _ in range(size))
+        index = StaticSortedIndex(arr)
+        targets = [random.uniform(-1, 11) for _ in range(50)] + arr
+        for target in targets:
+            checks += 1
+            expected = binary_search_with_upper_bound(arr, target)[1]
+            if index.search(target)[1] != expected:
+                errors += 1
+    
+    try:
+        StaticSortedIndex([2.0, 1.0])
+        print("   ✗ Невідсортований масив прийнято")
+        errors += 1
+    except ValueError:
+        print("   ✓ Невідсортований масив відхилено")
+    
+    mark = "✓" if errors == 0 else "✗"
+    print(f"   {mark} Перевірено {checks} випадків, помилок: {errors}")
+
+
+def test_learned_index():
+    """
+    Порівнює LearnedIndex з binary_search_with_upper_bound на рівномірних,
+    нерівномірних даних, дублікатах і нескінченностях та перевіряє
+    гарантовану похибку передбачення для кожного сегмента.
+    """
+    import random
+    
+    print("\n" + "=" * 60)
+    print("🧠 Тестування LearnedIndex")
+    print("=" * 60)
+    
+    random.seed(31)
+    inf = float('inf')
+    generators = [
+        lambda: random.uniform(0, 10),
+        lambda: random.lognormvariate(0, 2),
+        lambda: random.choice([1.0, 2.0, 2.0, 2.0, 3.0, random.uniform(0, 10)]),
+        lambda: random.choice([random.uniform(0, 10), inf, -inf, -0.0]),
+    ]
+    errors = 0
+    checks = 0
+    for generate in generators:
+        for size in (0, 1, 2, 10, 100, 5000):
+            arr = sorted(generate() for _ in range(size))
+            for error in (1, 4, 32):
+                index = LearnedIndex(arr, error=error)
+                # Похибка гарантована для перших входжень значень
+                for segment in range(index.segments):
+                    start = index._starts[segment]
+                    end = index._starts[segment + 1] if segment + 1 < index.segments else size
+                    for i in range(start, end):
+                        if i == start or arr[i] != arr[i - 1]:
+                            offset = arr[i] - index._keys[segment]
+                            predicted = start + index._slopes[segment] * offset if i > start else start
+                            if abs(predicted - i) > error + 1e-6:
+                                errors += 1
+                targets = [random.uniform(-1, 11) for _ in range(30)] + arr[:5] + [inf, -inf]
+                for target in targets:
+                    checks += 1
+                    if index.search(target)[1] != binary_search_with_upper_bound(arr, target)[1]:
+                        errors += 1
+    
+    arr = sorted(random.uniform(0, 1000) for _ in range(100000))
+    index = LearnedIndex(arr)
+    print(f"   100,000 рівномірних чисел: {index.segments} сегментів, {index.nbytes:,} байт моделі")
+    print(f"     search(500.0) = {index.search(500.0)}, search(2000.0) = {index.search(2000.0)}")
+    
+    mark = "✓" if errors == 0 else "✗"
+    print(f"   {mark} Перевірено {checks} випадків, помилок: {errors}")
+
+
+def test_finger_search():
+    """
+    Порівнює FingerSearcher з binary_search_with_upper_bound на
+    послідовностях близьких і випадкових цілей.
+    """
+    import random
     
-    if upper_bound is not None:
-        log.append(f"Верхня межа знайдена: {upper_bound}")
-        return (iterations, upper_bound, log)
+    print("\n" + "=" * 60)
+    print("👆 Тестування FingerSearcher")
+    print("=" * 60)
+    
+    arr = [1.1, 2.3, 3.5, 4.7, 5.9, 7.1, 8.3, 9.5]
+    searcher = FingerSearcher(arr)
+    print(f"   Масив: {arr}")
+    for target in (3.6, 4.0, 4.8, 0.5, 10.0):
+        print(f"     search({target}) = {searcher.search(target)}, палець: {searcher.position}")
     
-    # Якщо верхня межа не знайдена під час пошуку, шукаємо мінімальний елемент >= target
-    for element in arr:
-        if element >= target:
-            log.append(f"Верхня межа (лінійний пошук): {element}")
-            return (iterations, element, log)
+    random.seed(37)
+    inf = float('inf')
+    errors = 0
+    checks = 0
+    for size in list(range(12)) + [100, 1000]:
+        arr = sorted(random.choice([random.uniform(0, 10), 5.0, inf, -inf]) for _ in range(size))
+        searcher = FingerSearcher(arr)
+        target = 5.0
+        for _ in range(100):
+            # Випадкове блукання з рідкісними далекими стрибками
+            target = random.uniform(-1, 11) if random.random() < 0.1 else target + random.gauss(0, 0.1)
+            checks += 1
+            if searcher.search(target)[1] != binary_search_with_upper_bound(arr, target)[1]:
+                errors += 1
     
-    log.append("Верхня межа не знайдена - всі елементи менші за target")
-    return (iterations, None, log)
+    mark = "✓" if errors == 0 else "✗"
+    print(f"   {mark} Перевірено {checks} випадків, помилок: {errors}")
 
 
-def test_binary_search():
+def test_sorted_list():
     """
-    Тестує функцію двійкового пошуку на різних випадках.
+    Порівнює SortedFloatList зі звичайним відсортованим списком після
+    випадкової послідовності вставок, видалень і пакетних додавань.
     """
-    print("🔍 Тестування двійкового пошуку з верхньою межею")
+    import random
+    
+    print("\n" + "=" * 60)
+    print("📚 Тестування SortedFloatList")
     print("=" * 60)
     
-    # Тестові масиви
-    test_arrays = [
-        [1.1, 2.3, 3.5, 4.7, 5.9, 7.1, 8.3, 9.5],
-        [0.5, 1.0, 1.5, 2.0, 2.5, 3.0, 3.5, 4.0, 4.5, 5.0],
-        [10.0, 20.0, 30.0, 40.0, 50.0],
-        [3.14159, 2.71828, 1.41421, 0.57722],  # Несортований для демонстрації
-        []  # Порожній масив
-    ]
+    container = SortedFloatList([5.9, 1.1, 3.5, 9.5])
+    container.add(4.7)
+    container.remove(9.5)
+    print(f"   {container}")
+    print(f"     search(3.6) = {container.search(3.6)}, search(10.0) = {container.search(10.0)}")
     
-    # Сортуємо несортований масив
-    test_arrays[3] = sorted(test_arrays[3])
+    random.seed(17)
+    container = SortedFloatList()
+    # Малий розмір підсписку змушує часто ділити й зливати підсписки
+    container._LOAD = 8
+    reference = []
+    errors = 0
+    for _ in range(3000):
+        action = random.random()
+        if action < 0.5:
+            value = random.choice([random.uniform(0, 10), 5.0])
+            container.add(value)
+            bisect.insort(reference, value)
+        elif action < 0.8 and reference:
+            value = random.choice(reference)
+            container.remove(value)
+            reference.remove(value)
+        elif action < 0.85:
+            values = [random.uniform(0, 10) for _ in range(random.randint(0, 40))]
+            container.update(values)
+            reference = sorted(reference + values)
+        else:
+            target = random.uniform(-1, 11)
+            if container.search(target)[1] != binary_search_with_upper_bound(reference, target)[1]:
+                errors += 1
+        if list(container) != reference:
+            errors += 1
     
-    test_cases = [
-        # (масив_індекс, значення_для_пошуку, опис)
-        (0, 3.5, "точне значення в середині"),
-        (0, 3.6, "значення між елементами"),
-        (0, 0.5, "значення менше мінімального"),
-        (0, 10.0, "значення більше максимального"),
-        (0, 1.1, "точне значення на початку"),
-        (0, 9.5, "точне значення в кінці"),
-        (1, 2.25, "значення між елементами"),
-        (1, 5.5, "значення більше максимального"),
-        (2, 25.0, "значення між елементами"),
-        (2, 5.0, "значення менше мінімального"),
-        (3, 1.5, "значення в відсортованому масиві"),
-        (4, 1.0, "пошук в порожньому масиві"),
-    ]
+    for bad_call in (lambda: container.remove(-1.0), lambda: container.add(float('nan'))):
+        try:
+            bad_call()
+            errors += 1
+        except ValueError:
+            pass
     
-    for i, (arr_idx, target, description) in enumerate(test_cases, 1):
-        print(f"\n📋 Тест {i}: {description}")
+    mark = "✓" if errors == 0 else "✗"
+    print(f"   {mark} Виконано 3000 операцій, розбіжностей: {errors}")
+
+
+def test_sorted_file(path="sorted_floats_test.bin"):
+    """
+    Перевіряє запис і відкриття файлу відсортованих чисел та пошук
+    функціями модуля безпосередньо у відображеному файлі.
+    
+    Args:
+        path (str): Тимчасовий файл
+    """
+    import random
+    
+    print("\n" + "=" * 60)
+    print("💾 Тестування SortedFloatFile (mmap)")
+    print("=" * 60)
+    
+    random.seed(19)
+    arr = sorted(random.uniform(0, 100) for _ in range(100000))
+    errors = 0
+    try:
+        count = save_sorted_floats(path, arr)
+        with SortedFloatFile(path) as sorted_file:
+            values = sorted_file.values
+            print(f"   Записано {count:,} чисел, у файлі: {len(sorted_file):,}")
+            for target in [random.uniform(-1, 101) for _ in range(500)]:
+                expected = binary_search_with_upper_bound(arr, target)[1]
+                for func in SEARCH_MODES.values():
+                    if func(values, target)[1] != expected:
+                        errors += 1
+                if lower_bound(values, target)[1] != expected:
+                    errors += 1
+            if [r[1] for r in search_many(values, [50.0, 200.0])] != [lower_bound(arr, 50.0)[1], None]:
+                errors += 1
         
-        if arr_idx < len(test_arrays):
-            arr = test_arrays[arr_idx]
-            print(f"   Масив: {arr}")
-            print(f"   Шукаємо: {target}")
-            
-            iterations, upper_bound = binary_search_with_upper_bound(arr, target)
-            
-            print(f"   ✅ Результат: ({iterations} ітерацій, верхня межа: {upper_bound})")
-            
-            # Перевірка правильності
-            if upper_bound is not None:
-                # Перевіряємо, що upper_bound >= target
-                if upper_bound >= target:
-                    print(f"   ✓ Верхня межа коректна: {upper_bound} >= {target}")
-                else:
-                    print(f"   ✗ Помилка: {upper_bound} < {target}")
-                
-                # Перевіряємо, що це найменший такий елемент
-                smaller_elements = [x for x in arr if x >= target and x < upper_bound]
-                if not smaller_elements:
-                    print(f"   ✓ Це найменший елемент >= {target}")
-                else:
-                    print(f"   ✗ Знайдено менші елементи: {smaller_elements}")
-            else:
-                # Перевіряємо, що дійсно немає елементів >= target
-                valid_elements = [x for x in arr if x >= target]
-                if not valid_elements:
-                    print(f"   ✓ Коректно: немає елементів >= {target}")
-                else:
-                    print(f"   ✗ Помилка: знайдено елементи >= {target}: {valid_elements}")
+        # Масиви NumPy (зокрема порожній) мають проходити ті самі функції
+        if np is not None:
+            for data in (np.array(arr[:1000]), np.array([], dtype=np.float64)):
+                reference = list(data)
+                for target in (-1.0, 0.5, 50.0, 101.0):
+                    expected = binary_search_with_upper_bound(reference, target)
+                    for func in SEARCH_MODES.values():
+                        if func(data, target)[1] != expected[1]:
+                            errors += 1
+                    if binary_search_with_upper_bound(data, target) != expected:
+                        errors += 1
+            print("   ✓ Перевірено пошук у масивах NumPy")
+        
+        try:
+            save_sorted_floats(path, [2.0, 1.0])
+            print("   ✗ Невідсортовані значення записано")
+            errors += 1
+        except ValueError:
+            print("   ✓ Невідсортовані значення відхилено")
+    finally:
+        if os.path.exists(path):
+            os.remove(path)
+    
+    mark = "✓" if errors == 0 else "✗"
+    print(f"   {mark} Пошук у файлі збігається зі списком, помилок: {errors}")
 
 
 def demo_detailed_search():
@@ -202,6 +1878,12 @@ def demo_detailed_search():
         print(f"\n   📊 Підсумок:")
         print(f"   • Ітерацій: {iterations}")
         print(f"   • Верхня межа: {upper_bound}")
+    
+    print("\n🧾 Структуровані події для 3.6 (tracer=events.append):")
+    events = []
+    binary_search_with_upper_bound(arr, 3.6, tracer=events.append)
+    for event in events:
+        print(f"   {event}")
 
 
 def benchmark_search():
@@ -274,14 +1956,608 @@ def benchmark_search():
     print(f"   ⚡ Прискорення: {speedup:.1f}x")
 
 
+def benchmark_tracing(size=1000000, queries=20000, rounds=5):
+    """
+    Показує, що binary_search_with_upper_bound без трасувальника працює
+    так само швидко, як реалізація без підтримки трасування.
+    
+    Args:
+        size (int): Розмір масиву
+        queries (int): Кількість запитів у раунді
+        rounds (int): Кількість раундів; звітується найкращий
+    """
+    import time
+    import random
+    
+    print("\n" + "=" * 60)
+    print("🧾 Вартість трасування двійкового пошуку")
+    print("=" * 60)
+    
+    # Реалізація до появи параметра tracer - еталон швидкості
+    def untraced(arr, target):
+        if not arr:
+            return (0, None)
+        left = 0
+        right = len(arr) - 1
+        iterations = 0
+        upper_bound = None
+        while left <= right:
+            iterations += 1
+            mid = (left + right) // 2
+            if arr[mid] == target:
+                return (iterations, arr[mid])
+            elif arr[mid] < target:
+                left = mid + 1
+            else:
+                upper_bound = arr[mid]
+                right = mid - 1
+        return (iterations, upper_bound)
+    
+    arr = sorted(random.uniform(0, 1000) for _ in range(size))
+    targets = [random.uniform(0, 1000) for _ in range(queries)]
+    
+    def traced(arr, target):
+        events = []
+        return binary_search_with_upper_bound(arr, target, tracer=events.append)
+    
+    variants = [
+        ("без підтримки трасування", untraced),
+        ("tracer=None", binary_search_with_upper_bound),
+        ("tracer=events.append", traced),
+    ]
+    
+    best = {name: float('inf') for name, _ in variants}
+    # Раунди чергують варіанти, щоб шум планувальника впливав на всіх однаково
+    for _ in range(rounds):
+        for name, func in variants:
+            start = time.perf_counter()
+            for target in targets:
+                func(arr, target)
+            best[name] = min(best[name], (time.perf_counter() - start) / queries)
+    
+    baseline = best["без підтримки трасування"]
+    print(f"📊 Масив з {size:,} елементів, {queries:,} запитів, найкращий з {rounds} раундів")
+    print(f"\n   {'Варіант':<28} {'мкс/запит':>10} {'Відносно еталона':>17}")
+    for name, _ in variants:
+        print(f"   {name:<28} {best[name] * 1e6:>10.2f} {best[name] / baseline:>16.2f}x")
+
+
+def benchmark_bounds(size=1000000):
+    """
+    Порівнює пошук верхньої межі для цілей поза межами масиву та на
+    масивах з великою кількістю дублікатів.
+    
+    Args:
+        size (int): Розмір масивів
+    """
+    import time
+    import random
+    
+    print("\n" + "=" * 60)
+    print("⚡ Пошук меж: цілі поза діапазоном та дублікати")
+    print("=" * 60)
+    
+    # Попередня реалізація, що для цілі більшої за максимум виконувала
+    # додатковий лінійний прохід масивом
+    def legacy_upper_bound(arr, target):
+        iterations, upper_bound_value = binary_search_with_upper_bound(arr, target)
+        if upper_bound_value is None:
+            for element in arr:
+                if element >= target:
+                    return (iterations, element)
+        return (iterations, upper_bound_value)
+    
+    arr = sorted(random.uniform(0, 1000) for _ in range(size))
+    duplicates = sorted(random.choice([1.0, 2.0, 3.0]) for _ in range(size))
+    queries = 1000
+    
+    cases = [
+        ("більше максимуму", arr, [1000 + random.random() for _ in range(queries)]),
+        ("менше мінімуму", arr, [-random.random() for _ in range(queries)]),
+        ("випадкові", arr, [random.uniform(0, 1000) for _ in range(queries)]),
+        ("дублікати", duplicates, [random.choice([1.0, 2.0, 2.5, 3.0]) for _ in range(queries)]),
+    ]
+    
+    variants = [
+        ("стара версія", legacy_upper_bound),
+        ("binary_search_with_upper_bound", binary_search_with_upper_bound),
+        ("lower_bound", lower_bound),
+    ]
+    
+    print(f"📊 Масив з {size:,} елементів, {queries} запитів на випадок")
+    print(f"\n   {'Випадок':<18} {'Варіант':<32} {'мкс/запит':>10}")
+    for case_name, data, targets in cases:
+        # Стара версія на цілях поза діапазоном дуже повільна, тому для неї
+        # вимірюємо лише частину запитів
+        for name, func in variants:
+            sample = targets[:20] if func is legacy_upper_bound else targets
+            start = time.perf_counter()
+            for target in sample:
+                func(data, target)
+            elapsed = (time.perf_counter() - start) / len(sample)
+            print(f"   {case_name:<18} {name:<32} {elapsed * 1e6:>10.2f}")
+
+
+def benchmark_range_query(size=1000000, queries=1000):
+    """
+    Порівнює count_range та range_query з підрахунком через зріз списку,
+    що копіює всі елементи діапазону.
+    
+    Args:
+        size (int): Розмір масиву
+        queries (int): Кількість запитів
+    """
+    import time
+    import random
+    
+    print("\n" + "=" * 60)
+    print("📏 Запити діапазону: зріз списку vs range_query / count_range")
+    print("=" * 60)
+    
+    arr = sorted(random.uniform(0, 1000) for _ in range(size))
+    ranges = [sorted((random.uniform(0, 1000), random.uniform(0, 1000))) for _ in range(queries)]
+    
+    def sliced(lo, hi):
+        start = bisect.bisect_left(arr, lo)
+        return len(arr[start:bisect.bisect_left(arr, hi)])
+    
+    variants = [
+        ("зріз списку", sliced),
+        ("range_query", lambda lo, hi: len(range_query(arr, lo, hi))),
+        ("count_range", lambda lo, hi: count_range(arr, lo, hi)),
+    ]
+    
+    print(f"📊 Масив з {size:,} елементів, {queries:,} випадкових діапазонів")
+    print(f"\n   {'Варіант':<14} {'мкс/запит':>10}")
+    expected = None
+    for name, func in variants:
+        start = time.perf_counter()
+        counts = [func(lo, hi) for lo, hi in ranges]
+        elapsed = (time.perf_counter() - start) / queries
+        if expected is None:
+            expected = counts
+        mark = "" if counts == expected else "  ✗ результати відрізняються"
+        print(f"   {name:<14} {elapsed * 1e6:>10.2f}{mark}")
+
+
+def benchmark_search_modes(size=1000000, queries=2000):
+    """
+    Порівнює середню кількість ітерацій та час запиту для кожного режиму
+    пошуку на рівномірних і експоненційно розподілених даних.
+    
+    Args:
+        size (int): Розмір масиву
+        queries (int): Кількість запитів на набір даних
+    """
+    import time
+    import random
+    
+    print("\n" + "=" * 60)
+    print("🧭 Режими пошуку: двійковий, інтерполяційний, експоненційний, адаптивний")
+    print("=" * 60)
+    
+    datasets = [
+        ("рівномірний", sorted(random.uniform(0, 1000) for _ in range(size))),
+        ("експоненційний", sorted(random.expovariate(1) for _ in range(size))),
+    ]
+    
+    print(f"📊 Масив з {size:,} елементів, {queries:,} запитів на набір")
+    print(f"\n   {'Розподіл':<16} {'Режим':<14} {'Ітерацій (сер.)':>16} {'Макс.':>6} {'мкс/запит':>10}")
+    for data_name, arr in datasets:
+        # Половина цілей - елементи масиву, половина - значення між ними
+        targets = [random.choice(arr) if i % 2 else random.uniform(arr[0], arr[-1])
+                   for i in range(queries)]
+        expected = [binary_search_with_upper_bound(arr, t)[1] for t in targets]
+        for name, func in SEARCH_MODES.items():
+            elapsed = float('inf')
+            for _ in range(3):
+                start = time.perf_counter()
+                results = [func(arr, t) for t in targets]
+                elapsed = min(elapsed, (time.perf_counter() - start) / queries)
+            iterations = [r[0] for r in results]
+            mark = "" if [r[1] for r in results] == expected else "  ✗ результати відрізняються"
+            print(f"   {data_name:<16} {name:<14} {sum(iterations) / queries:>16.1f} "
+                  f"{max(iterations):>6} {elapsed * 1e6:>10.2f}{mark}")
+
+
+def benchmark_search_many(size=1000000):
+    """
+    Порівнює пакетний search_many з циклом викликів
+    binary_search_with_upper_bound для тих самих цілей.
+    
+    Args:
+        size (int): Розмір масиву
+    """
+    import time
+    import random
+    
+    print("\n" + "=" * 60)
+    print("⚡ Пакетний пошук search_many")
+    print("=" * 60)
+    
+    arr = sorted(random.uniform(0, 1000) for _ in range(size))
+    print(f"📊 Масив з {size:,} елементів")
+    print(f"\n   {'Цілі':<28} {'Цикл (зап/с)':>14} {'search_many (зап/с)':>20} {'Прискорення':>12}")
+    
+    cases = []
+    for count in (100, 10000):
+        targets = [random.uniform(0, 1000) for _ in range(count)]
+        cases.append((f"{count:,} відсортованих", arr, sorted(targets)))
+        cases.append((f"{count:,} невідсортованих", arr, targets))
+    if np is not None:
+        cases.append(("10,000 невідсорт., array('d')", array('d', arr), targets))
+    
+    def best_time(func, repeats=5):
+        # Найкращий з кількох запусків менш чутливий до шуму планувальника
+        best = float('inf')
+        for _ in range(repeats):
+            start = time.perf_counter()
+            result = func()
+            best = min(best, time.perf_counter() - start)
+        return best, result
+    
+    for name, data, targets in cases:
+        loop_time, expected = best_time(
+            lambda: [binary_search_with_upper_bound(data, t) for t in targets])
+        batch_time, results = best_time(lambda: search_many(data, targets))
+        
+        mark = "" if results == expected else "  ✗ результати відрізняються"
+        print(f"   {name:<28} {len(targets) / loop_time:>14,.0f} "
+              f"{len(targets) / batch_time:>20,.0f} {loop_time / batch_time:>11.1f}x{mark}")
+
+
+def benchmark_learned_index(sizes=(100000, 1000000), queries=20000, error=32):
+    """
+    Порівнює час побудови, розмір моделі та затримку запитів LearnedIndex
+    з binary_search_with_upper_bound та lower_bound (bisect на C).
+    
+    Args:
+        sizes (tuple): Розміри масивів
+        queries (int): Кількість запитів
+        error (int): Похибка моделі
+    """
+    import time
+    import random
+    
+    print("\n" + "=" * 60)
+    print("🧠 LearnedIndex vs двійковий пошук")
+    print("=" * 60)
+    print(f"📊 {queries:,} запитів, похибка моделі {error}, час - мкс/запит (найкращий з 3)")
+    print(f"\n   {'Дані':<22} {'Побудова (с)':>13} {'Сегментів':>10} {'Модель (КБ)':>12} "
+          f"{'Функція':>8} {'Індекс':>7} {'bisect':>7}")
+    
+    for size in sizes:
+        datasets = [
+            ("рівномірні", lambda: random.uniform(0, 1000)),
+            ("логнормальні", lambda: random.lognormvariate(0, 2)),
+        ]
+        for data_name, generate in datasets:
+            arr = sorted(generate() for _ in range(size))
+            # Цілі поруч зі значеннями масиву, кожна десята - поза його діапазоном
+            targets = [random.choice(arr) * random.uniform(0.999, 1.001) if i % 10
+                       else random.choice([arr[0] - 1, arr[-1] + 1]) for i in range(queries)]
+            
+            start = time.perf_counter()
+            index = LearnedIndex(arr, error=error)
+            build_time = time.perf_counter() - start
+            
+            variants = [
+                lambda t: binary_search_with_upper_bound(arr, t),
+                index.search,
+                lambda t: lower_bound(arr, t),
+            ]
+            timings = []
+            for func in variants:
+                best = float('inf')
+                for _ in range(3):
+                    start = time.perf_counter()
+                    results = [func(t)[1] for t in targets]
+                    best = min(best, (time.perf_counter() - start) / queries)
+                timings.append((best, results))
+            
+            same = timings[0][1] == timings[1][1] == timings[2][1]
+            mark = "" if same else "  ✗ результати відрізняються"
+            label = f"{size:,} {data_name}"
+            print(f"   {label:<22} {build_time:>13.3f} {index.segments:>10,} "
+                  f"{index.nbytes / 1024:>12.1f} {timings[0][0] * 1e6:>8.2f} "
+                  f"{timings[1][0] * 1e6:>7.2f} {timings[2][0] * 1e6:>7.2f}{mark}")
+
+
+def benchmark_finger_search(size=1000000, queries=50000):
+    """
+    Порівнює FingerSearcher з binary_search_with_upper_bound на
+    послідовностях цілей, що блукають з різним кроком.
+    
+    Args:
+        size (int): Розмір масиву
+        queries (int): Довжина послідовності цілей
+    """
+    import time
+    import random
+    
+    print("\n" + "=" * 60)
+    print("👆 FingerSearcher на випадкових блуканнях")
+    print("=" * 60)
+    
+    arr = sorted(random.uniform(0, 1000) for _ in range(size))
+    print(f"📊 Масив з {size:,} елементів (щільність ~{size // 1000:,} на одиницю), "
+          f"{queries:,} запитів")
+    print(f"\n   {'Крок блукання':<16} {'Функція (ітер./мкс)':>20} {'FingerSearcher (ітер./мкс)':>27}")
+    
+    for sigma in (0.001, 0.01, 1.0, None):
+        if sigma is None:
+            label = "випадкові цілі"
+            targets = [random.uniform(0, 1000) for _ in range(queries)]
+        else:
+            label = f"σ = {sigma}"
+            targets = []
+            target = 500.0
+            for _ in range(queries):
+                # Відбиття від країв утримує блукання в діапазоні масиву
+                target = abs(target + random.gauss(0, sigma)) % 1000
+                targets.append(target)
+        
+        rows = []
+        for make in (lambda: (lambda t: binary_search_with_upper_bound(arr, t)),
+                     lambda: FingerSearcher(arr).search):
+            elapsed = float('inf')
+            for _ in range(3):
+                # Новий FingerSearcher на кожен прохід, щоб палець стартував з нуля
+                func = make()
+                start = time.perf_counter()
+                results = [func(t) for t in targets]
+                elapsed = min(elapsed, (time.perf_counter() - start) / queries)
+            rows.append((sum(r[0] for r in results) / queries, elapsed, [r[1] for r in results]))
+        
+        mark = "" if rows[0][2] == rows[1][2] else "  ✗ результати відрізняються"
+        print(f"   {label:<16} {rows[0][0]:>11.1f} / {rows[0][1] * 1e6:>5.2f} "
+              f"{rows[1][0]:>18.1f} / {rows[1][1] * 1e6:>5.2f}{mark}")
+
+
+def benchmark_sorted_list(sizes=(1000000, 10000000), batches=5, batch_size=1000, queries=1000):
+    """
+    Порівнює змішане навантаження (пакети вставок, після кожного - запити)
+    для списку, що пересортовується після кожного пакета, списку з
+    bisect.insort та SortedFloatList.
+    
+    Args:
+        sizes (tuple): Початкові розміри масиву
+        batches (int): Кількість пакетів
+        batch_size (int): Кількість вставок у пакеті
+        queries (int): Кількість запитів після кожного пакета
+    """
+    import gc
+    import time
+    import random
+    
+    print("\n" + "=" * 60)
+    print("📚 SortedFloatList: змішані вставки та запити")
+    print("=" * 60)
+    print(f"📊 {batches} пакетів по {batch_size:,} вставок і {queries:,} запитів")
+    
+    def resort(arr, batch, targets):
+        arr.extend(batch)
+        arr.sort()
+        return [binary_search_with_upper_bound(arr, t)[1] for t in targets]
+    
+    def insort(arr, batch, targets):
+        for value in batch:
+            bisect.insort(arr, value)
+        return [binary_search_with_upper_bound(arr, t)[1] for t in targets]
+    
+    def sorted_list(container, batch, targets):
+        for value in batch:
+            container.add(value)
+        return [container.search(t)[1] for t in targets]
+    
+    for size in sizes:
+        initial = [random.uniform(0, 1000) for _ in range(size)]
+        workload = [([random.uniform(0, 1000) for _ in range(batch_size)],
+                     [random.uniform(0, 1000) for _ in range(queries)])
+                    for _ in range(batches)]
+        
+        print(f"\n   Початковий розмір: {size:,}")
+        print(f"   {'Варіант':<24} {'Завантаження (с)':>17} {'Навантаження (с)':>17}")
+        reference = None
+        # Значення прив'язуються під час створення лямбд, бо initial
+        # видаляється в кінці ітерації
+        variants = [
+            ("список + sort()", lambda values=initial: sorted(values), resort),
+            ("список + insort", lambda values=initial: sorted(values), insort),
+            ("SortedFloatList", lambda values=initial: SortedFloatList(values), sorted_list),
+        ]
+        for name, load, step in variants:
+            if step is insort and size > 1000000:
+                # Кожна вставка зсуває в середньому n / 2 елементів: на 10M
+                # це десятки секунд, тому варіант пропускаємо
+                continue
+            gc.collect()
+            start = time.perf_counter()
+            container = load()
+            load_time = time.perf_counter() - start
+            
+            start = time.perf_counter()
+            results = [step(container, batch, targets) for batch, targets in workload]
+            work_time = time.perf_counter() - start
+            
+            if reference is None:
+                reference = results
+            mark = "" if results == reference else "  ✗ результати відрізняються"
+            print(f"   {name:<24} {load_time:>17.3f} {work_time:>17.3f}{mark}")
+            del container
+        # Лямбди в variants теж тримають initial
+        del initial, workload, variants
+
+
+def benchmark_sorted_file(count=10000000, queries=2000, path="sorted_floats.bin"):
+    """
+    Порівнює пошук у файлі, відкритому через mmap, із завантаженням того
+    самого файлу в список: час відкриття, затримку запитів з холодним і
+    теплим кешем та резидентну пам'ять.
+    
+    Args:
+        count (int): Кількість чисел у файлі
+        queries (int): Кількість запитів у кожному проході
+        path (str): Тимчасовий файл
+    """
+    import gc
+    import time
+    import random
+    
+    print("\n" + "=" * 60)
+    print("💾 Пошук у файлі через mmap vs завантаження в список")
+    print("=" * 60)
+    
+    def resident_mb():
+        # /proc доступний лише в Linux; деінде пам'ять не звітується
+        try:
+            with open("/proc/self/statm") as f:
+                return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 2**20
+        except (OSError, ValueError, AttributeError):
+            return float("nan")
+    
+    def drop_page_cache():
+        # Викидає сторінки файлу з кешу ОС, щоб перший прохід був холодним
+        if not hasattr(os, "posix_fadvise"):
+            return False
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            os.fsync(fd)
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+        finally:
+            os.close(fd)
+        return True
+    
+    def query_time(arr, targets):
+        start = time.perf_counter()
+        results = [binary_search_with_upper_bound(arr, t)[1] for t in targets]
+        return (time.perf_counter() - start) / len(targets), results
+    
+    # Накопичена сума додатних приростів відсортована без сортування
+    save_sorted_floats(path, itertools.accumulate(random.random() for _ in range(count)))
+    targets = [random.uniform(0, count / 2) for _ in range(queries)]
+    print(f"📊 Чисел: {count:,} ({os.path.getsize(path) / 2**20:.0f} МБ), запитів: {queries:,}")
+    
+    try:
+        cold = drop_page_cache()
+        gc.collect()
+        memory_before = resident_mb()
+        start = time.perf_counter()
+        sorted_file = SortedFloatFile(path)
+        open_time = time.perf_counter() - start
+        cold_time, mmap_results = query_time(sorted_file.values, targets)
+        warm_time, _ = query_time(sorted_file.values, targets)
+        mmap_memory = resident_mb() - memory_before
+        sorted_file.close()
+        
+        gc.collect()
+        memory_before = resident_mb()
+        start = time.perf_counter()
+        with open(path, "rb") as f:
+            f.seek(_SORTED_FILE_HEADER.size)
+            arr = array('d')
+            arr.frombytes(f.read())
+            arr = arr.tolist()
+        load_time = time.perf_counter() - start
+        list_time, list_results = query_time(arr, targets)
+        list_memory = resident_mb() - memory_before
+        del arr
+    finally:
+        os.remove(path)
+    
+    cold_label = "Запит, холодний кеш" if cold else "Запит, кеш не скинуто"
+    memory_label = "Пам'ять (МБ)"
+    print(f"\n   {'Варіант':<12} {'Відкриття (с)':>14} {cold_label:>26} "
+          f"{'Запит, теплий':>14} {memory_label:>13}")
+    print(f"   {'mmap':<12} {open_time:>14.4f} {cold_time * 1e6:>23.2f} мкс "
+          f"{warm_time * 1e6:>10.2f} мкс {mmap_memory:>13.1f}")
+    print(f"   {'список':<12} {load_time:>14.4f} {'-':>26} "
+          f"{list_time * 1e6:>10.2f} мкс {list_memory:>13.1f}")
+    mark = "✓" if mmap_results == list_results else "✗"
+    print(f"   {mark} Результати mmap і списку збігаються")
+
+
+def benchmark_static_index(sizes=(1000, 100000, 1000000, 10000000), queries=20000):
+    """
+    Порівнює затримку StaticSortedIndex.search з binary_search_with_upper_bound
+    на масивах різного розміру.
+    
+    Args:
+        sizes (tuple): Розміри масивів (для звіту про 50M додайте 50_000_000)
+        queries (int): Кількість запитів на кожен розмір
+    """
+    import gc
+    import time
+    import random
+    
+    print("\n" + "=" * 60)
+    print("🌲 StaticSortedIndex vs binary_search_with_upper_bound")
+    print("=" * 60)
+    print(f"📊 {queries:,} запитів на розмір, час - мкс/запит")
+    print(f"\n   {'Розмір':>12} {'Побудова (с)':>13} {'Дерево (МБ)':>12} "
+          f"{'Функція':>9} {'Індекс':>9} {'Прискорення':>12}")
+    
+    for size in sizes:
+        # Накопичена сума додатних приростів відсортована без сортування
+        arr = list(itertools.accumulate(random.random() for _ in range(size)))
+        targets = [random.uniform(-1, arr[-1] + 1) for _ in range(queries)]
+        
+        start = time.perf_counter()
+        index = StaticSortedIndex(arr)
+        build_time = time.perf_counter() - start
+        
+        start = time.perf_counter()
+        expected = [binary_search_with_upper_bound(arr, t)[1] for t in targets]
+        function_time = (time.perf_counter() - start) / queries
+        
+        search = index.search
+        start = time.perf_counter()
+        results = [search(t)[1] for t in targets]
+        index_time = (time.perf_counter() - start) / queries
+        
+        mark = "" if results == expected else "  ✗ результати відрізняються"
+        print(f"   {size:>12,} {build_time:>13.3f} {index.nbytes / 2**20:>12.1f} "
+              f"{function_time * 1e6:>9.2f} {index_time * 1e6:>9.2f} "
+              f"{function_time / index_time:>11.1f}x{mark}")
+        
+        del arr, index
+        gc.collect()
+
+
 if __name__ == "__main__":
     test_binary_search()
+    test_search_many()
+    test_tracing()
+    test_bounds()
+    test_range_queries()
+    test_search_modes()
+    test_static_index()
+    test_learned_index()
+    test_finger_search()
+    test_sorted_list()
+    test_sorted_file()
     demo_detailed_search()
+    # Звичайний запуск використовує масиви до 100 тис. елементів (1M для
+    # файлу) і триває кілька секунд; python task2.py --full запускає
+    # бенчмарки на 1M-10M елементів (близько хвилини та сотні МБ пам'яті)
+    full = "--full" in sys.argv[1:]
+    size = 1000000 if full else 100000
+    queries = 20000 if full else 5000
     benchmark_search()
+    benchmark_tracing(size=size, queries=queries)
+    benchmark_bounds(size=size)
+    benchmark_range_query(size=size)
+    benchmark_search_modes(size=size)
+    benchmark_search_many(size=size)
+    benchmark_static_index(sizes=(1000, 100000, 1000000, 10000000) if full else (1000, 100000))
+    benchmark_learned_index(sizes=(100000, 1000000) if full else (100000,), queries=queries)
+    benchmark_finger_search(size=size, queries=queries * 5 // 2)
+    benchmark_sorted_list(sizes=(1000000, 10000000) if full else (100000,))
+    benchmark_sorted_file(count=10000000 if full else 1000000)
     
     print("\n✅ Тестування завершено!")
     print("\n💡 Ключові особливості реалізації:")
     print("   • Повертає кількість ітерацій та верхню межу")
     print("   • Верхня межа - найменший елемент >= target")
-    print("   • Обробляє випадки, коли верхня межа відсутня")
+    print("   • Обробляє випадки, коли верхня межа відсутня, без лінійного проходу")
     print("   • Ефективність O(log n) порівняно з O(n) лінійного пошуку")
@@ -2,75 +2,243 @@
 Завдання 3: Порівняння ефективності алгоритмів пошуку підрядка
 
 Реалізація та порівняння алгоритмів:
-- Боєра-Мура (Boyer-Moore)
+- Боєра-Мура (Boyer-Moore) з правилами поганого символа, хорошого суфікса та Галіла
+- Хорспула (Horspool) та Санді (Sunday)
 - Кнута-Морріса-Пратта (Knuth-Morris-Pratt)
-- Рабіна-Карпа (Rabin-Karp)
+- Рабіна-Карпа (Rabin-Karp) з ковзним хешем за модулем Мерсенна 2^61 - 1
+- Ахо-Корасік (Aho-Corasick) та пакетний Рабін-Карп для одночасного пошуку багатьох підрядків
+
+compile_pattern повертає шаблон з попередньою обробкою, виконаною один раз,
+для повторного пошуку в багатьох текстах.
 """
 
+import collections
+import functools
 import timeit
 import hashlib
+from array import array
 
 
-def boyer_moore_search(text, pattern):
+class CompiledPattern:
     """
-    Алгоритм пошуку підрядка Боєра-Мура.
+    Базовий клас попередньо обробленого шаблону.
     
-    Args:
-        text (str): Текст для пошуку
-        pattern (str): Підрядок для знаходження
+    Попередня обробка (таблиці зсувів, префікс-функція, хеш шаблону)
+    виконується один раз у конструкторі, після чого той самий об'єкт
+    можна застосовувати до будь-якої кількості текстів. Об'єкт не
+    змінюється під час пошуку, тому його безпечно кешувати й спільно
+    використовувати.
+    """
+    
+    algorithm = None
+    
+    def __init__(self, pattern):
+        self.pattern = pattern
+    
+    def __repr__(self):
+        return f"{type(self).__name__}({self.pattern!r})"
+    
+    def finditer(self, text):
+        """
+        Перебирає позиції входжень шаблону в тексті, включно з перекриттями.
         
-    Returns:
-        list: Список позицій, де знайдено підрядок
+        Args:
+            text (str): Текст для пошуку
+            
+        Yields:
+            int: Позиція початку чергового входження
+        """
+        raise NotImplementedError
+    
+    def search(self, text):
+        """
+        Знаходить усі входження шаблону.
+        
+        Args:
+            text (str): Текст для пошуку
+            
+        Returns:
+            list: Список позицій, де знайдено підрядок
+        """
+        return list(self.finditer(text))
+    
+    def count(self, text):
+        """
+        Підраховує входження шаблону без створення списку позицій.
+        
+        Args:
+            text (str): Текст для пошуку
+            
+        Returns:
+            int: Кількість входжень
+        """
+        return sum(1 for _ in self.finditer(text))
+
+
+class BoyerMoorePattern(CompiledPattern):
     """
-    def build_bad_char_table(pattern):
-        """Будує таблицю зсувів для поганих символів."""
-        table = {}
-        for i in range(len(pattern)):
-            table[pattern[i]] = i
-        return table
+    Шаблон для пошуку повним алгоритмом Боєра-Мура.
     
-    if not pattern:
-        return []
+    Зсув вікна - більший із запропонованих правилом поганого символа та
+    правилом хорошого суфікса. Після повного збігу вікно зсувається на
+    період шаблону, а правило Галіла пропускає порівняння префікса, який
+    гарантовано збігається, тож пошук лінійний навіть на періодичних
+    шаблонах на кшталт 'a' * 1000.
+    """
     
-    bad_char_table = build_bad_char_table(pattern)
-    positions = []
-    i = 0
+    algorithm = "boyer-moore"
     
-    while i <= len(text) - len(pattern):
-        j = len(pattern) - 1
+    def __init__(self, pattern):
+        super().__init__(pattern)
+        # Таблиця зсувів для поганих символів: остання позиція символа
+        self._bad_char_table = {}
+        for i in range(len(pattern)):
+            self._bad_char_table[pattern[i]] = i
+        self._good_suffix = self._build_good_suffix(pattern)
+        # Зсув після повного збігу - найменший період шаблону
+        self._period = self._good_suffix[0]
+    
+    @staticmethod
+    def _build_good_suffix(pattern):
+        """
+        Будує таблицю зсувів за сильним правилом хорошого суфікса.
         
-        # Порівнюємо з кінця шаблону
-        while j >= 0 and pattern[j] == text[i + j]:
+        Returns:
+            list: shift[j + 1] - зсув при розбіжності на позиції j
+                (shift[0] - зсув після повного збігу)
+        """
+        m = len(pattern)
+        shift = [0] * (m + 1)
+        # border[i] - початок найширшої межі суфікса pattern[i:]
+        border = [0] * (m + 1)
+        i, j = m, m + 1
+        border[i] = j
+        while i > 0:
+            while j <= m and pattern[i - 1] != pattern[j - 1]:
+                if shift[j] == 0:
+                    shift[j] = j - i
+                j = border[j]
+            i -= 1
             j -= 1
+            border[i] = j
         
-        if j < 0:
-            # Знайдено збіг
-            positions.append(i)
-            i += 1
-        else:
-            # Використовуємо правило поганого символа
-            bad_char = text[i + j]
-            if bad_char in bad_char_table:
-                i += max(1, j - bad_char_table[bad_char])
+        # Суфікси, що не повторюються в шаблоні, зсуваються до найширшої
+        # межі всього шаблону
+        j = border[0]
+        for i in range(m + 1):
+            if shift[i] == 0:
+                shift[i] = j
+            if i == j:
+                j = border[j]
+        return shift
+    
+    def finditer(self, text):
+        pattern = self.pattern
+        if not pattern:
+            return
+        m = len(pattern)
+        bad_char_table = self._bad_char_table
+        good_suffix = self._good_suffix
+        period = self._period
+        i = 0
+        # Позиції вікна, менші за lower, уже відомо, що збігаються (правило Галіла)
+        lower = 0
+        
+        while i <= len(text) - m:
+            j = m - 1
+            
+            # Порівнюємо з кінця шаблону
+            while j >= lower and pattern[j] == text[i + j]:
+                j -= 1
+            
+            if j < lower:
+                # Знайдено збіг: після зсуву на період перші m - period
+                # символів нового вікна збігаються з шаблоном
+                yield i
+                i += period
+                lower = m - period
             else:
-                i += j + 1
+                bad_char_shift = j - bad_char_table.get(text[i + j], -1)
+                i += max(good_suffix[j + 1], bad_char_shift)
+                lower = 0
+
+
+class HorspoolPattern(CompiledPattern):
+    """
+    Шаблон для пошуку алгоритмом Хорспула.
     
-    return positions
+    Спрощений Боєр-Мур: зсув визначається лише символом тексту під
+    останньою позицією шаблону. Вікно порівнюється зі зразком одним
+    викликом str.startswith, який виконується на C.
+    """
+    
+    algorithm = "horspool"
+    
+    def __init__(self, pattern):
+        super().__init__(pattern)
+        m = len(pattern)
+        # Відстань від останнього входження символа (крім останнього) до кінця шаблону
+        self._shift = {}
+        for i in range(m - 1):
+            self._shift[pattern[i]] = m - 1 - i
+    
+    def finditer(self, text):
+        pattern = self.pattern
+        if not pattern:
+            return
+        m = len(pattern)
+        shift = self._shift
+        last = len(text) - m
+        i = 0
+        while i <= last:
+            if text.startswith(pattern, i):
+                yield i
+            i += shift.get(text[i + m - 1], m)
 
 
-def kmp_search(text, pattern):
+class SundayPattern(CompiledPattern):
     """
-    Алгоритм пошуку підрядка Кнута-Морріса-Пратта.
+    Шаблон для пошуку алгоритмом Санді (quick search).
     
-    Args:
-        text (str): Текст для пошуку
-        pattern (str): Підрядок для знаходження
-        
-    Returns:
-        list: Список позицій, де знайдено підрядок
+    Зсув визначається символом тексту одразу після вікна, тому він
+    може сягати m + 1. Вікно порівнюється зі зразком одним викликом
+    str.startswith.
     """
-    def build_lps_array(pattern):
-        """Будує масив найдовших префіксів-суфіксів."""
+    
+    algorithm = "sunday"
+    
+    def __init__(self, pattern):
+        super().__init__(pattern)
+        m = len(pattern)
+        # Відстань від останнього входження символа до позиції за шаблоном
+        self._shift = {}
+        for i in range(m):
+            self._shift[pattern[i]] = m - i
+    
+    def finditer(self, text):
+        pattern = self.pattern
+        if not pattern:
+            return
+        m = len(pattern)
+        shift = self._shift
+        n = len(text)
+        i = 0
+        while i <= n - m:
+            if text.startswith(pattern, i):
+                yield i
+            if i + m >= n:
+                break
+            i += shift.get(text[i + m], m + 1)
+
+
+class KMPPattern(CompiledPattern):
+    """Шаблон для пошуку алгоритмом Кнута-Морріса-Пратта."""
+    
+    algorithm = "kmp"
+    
+    def __init__(self, pattern):
+        super().__init__(pattern)
+        # Масив найдовших префіксів-суфіксів
         lps = [0] * len(pattern)
         length = 0
         i = 1
@@ -86,82 +254,519 @@ def kmp_search(text, pattern):
                 else:
                     lps[i] = 0
                     i += 1
-        return lps
-    
-    if not pattern:
-        return []
-    
-    lps = build_lps_array(pattern)
-    positions = []
-    i = 0  # індекс для тексту
-    j = 0  # індекс для шаблону
-    
-    while i < len(text):
-        if pattern[j] == text[i]:
-            i += 1
-            j += 1
-        
-        if j == len(pattern):
-            positions.append(i - j)
-            j = lps[j - 1]
-        elif i < len(text) and pattern[j] != text[i]:
-            if j != 0:
+        self._lps = lps
+    
+    def finditer(self, text):
+        pattern = self.pattern
+        if not pattern:
+            return
+        lps = self._lps
+        i = 0  # індекс для тексту
+        j = 0  # індекс для шаблону
+        
+        while i < len(text):
+            if pattern[j] == text[i]:
+                i += 1
+                j += 1
+            
+            if j == len(pattern):
+                yield i - j
                 j = lps[j - 1]
-            else:
+            elif i < len(text) and pattern[j] != text[i]:
+                if j != 0:
+                    j = lps[j - 1]
+                else:
+                    i += 1
+
+
+# Простий модуль Мерсенна: ймовірність випадкового збігу хешів двох
+# різних вікон довжини m не перевищує m / 2^61
+MERSENNE_61 = (1 << 61) - 1
+# Найменше просте число, більше за кількість кодових точок Unicode, тож
+# до взяття модуля різні рядки мають різні поліноміальні значення
+DEFAULT_HASH_BASE = 1114117
+
+
+class RabinKarpStats:
+    """
+    Лічильники роботи Рабіна-Карпа, що накопичуються між викликами.
+    
+    Attributes:
+        windows (int): Кількість перевірених вікон тексту
+        hash_hits (int): Вікна, хеш яких збігся з хешем шаблону
+        spurious_hits (int): Збіги хешів без збігу рядків
+    """
+    
+    __slots__ = ("windows", "hash_hits", "spurious_hits")
+    
+    def __init__(self):
+        self.windows = 0
+        self.hash_hits = 0
+        self.spurious_hits = 0
+    
+    @property
+    def spurious_rate(self):
+        """Частка вікон із хибним збігом хешів."""
+        return self.spurious_hits / self.windows if self.windows else 0.0
+    
+    def __repr__(self):
+        return (f"RabinKarpStats(windows={self.windows}, hash_hits={self.hash_hits}, "
+                f"spurious_hits={self.spurious_hits})")
+
+
+class RollingHash:
+    """
+    Поліноміальний ковзний хеш вікна фіксованої довжини.
+    
+    hash(s) = (s[0]·base^(w-1) + ... + s[w-1]) mod modulus, а зсув вікна
+    на один символ перераховує хеш за O(1).
+    """
+    
+    def __init__(self, window, base=DEFAULT_HASH_BASE, modulus=MERSENNE_61):
+        """
+        Args:
+            window (int): Довжина вікна
+            base (int): Основа полінома
+            modulus (int): Модуль (просте число)
+        """
+        self.window = window
+        self.base = base
+        self.modulus = modulus
+        # Вага символа, що залишає вікно
+        self.high = pow(base, window - 1, modulus) if window else 0
+    
+    def hash(self, s):
+        """Обчислює хеш рядка s довжини window."""
+        base, modulus = self.base, self.modulus
+        value = 0
+        for char in s:
+            value = (value * base + ord(char)) % modulus
+        return value
+    
+    def roll(self, value, outgoing, incoming):
+        """Зсуває вікно: прибирає символ outgoing і додає incoming."""
+        return ((value - ord(outgoing) * self.high) * self.base + ord(incoming)) % self.modulus
+
+
+class RabinKarpPattern(CompiledPattern):
+    """
+    Шаблон для пошуку алгоритмом Рабіна-Карпа.
+    
+    Використовує ковзний хеш за модулем 2^61 - 1, тож хибні збіги хешів,
+    що потребують порівняння рядків, практично не трапляються.
+    """
+    
+    algorithm = "rabin-karp"
+    
+    def __init__(self, pattern, base=DEFAULT_HASH_BASE, modulus=MERSENNE_61):
+        """
+        Args:
+            pattern (str): Підрядок для знаходження
+            base (int): Основа полінома ковзного хешу
+            modulus (int): Модуль ковзного хешу (просте число)
+        """
+        super().__init__(pattern)
+        self._rolling = RollingHash(len(pattern), base, modulus)
+        self._pattern_hash = self._rolling.hash(pattern)
+    
+    def finditer(self, text, stats=None):
+        """
+        Перебирає позиції входжень шаблону в тексті, включно з перекриттями.
+        
+        Args:
+            text (str): Текст для пошуку
+            stats (RabinKarpStats): Необов'язкові лічильники вікон, збігів
+                хешів та хибних збігів
+            
+        Yields:
+            int: Позиція початку чергового входження
+        """
+        pattern = self.pattern
+        pattern_len = len(pattern)
+        text_len = len(text)
+        if not pattern or text_len < pattern_len:
+            return
+        rolling = self._rolling
+        base, modulus, high = rolling.base, rolling.modulus, rolling.high
+        pattern_hash = self._pattern_hash
+        last = text_len - pattern_len
+        hash_hits = 0
+        spurious_hits = 0
+        i = 0
+        
+        try:
+            text_hash = rolling.hash(text[:pattern_len])
+            while True:
+                if text_hash == pattern_hash:
+                    hash_hits += 1
+                    # startswith порівнює без створення зрізу тексту
+                    if text.startswith(pattern, i):
+                        yield i
+                    else:
+                        spurious_hits += 1
+                if i == last:
+                    break
+                # Обчислюємо хеш для наступного вікна
+                text_hash = ((text_hash - ord(text[i]) * high) * base
+                             + ord(text[i + pattern_len])) % modulus
                 i += 1
+        finally:
+            # Лічильники оновлюються, навіть якщо перебір зупинили раніше
+            if stats is not None:
+                stats.windows += i + 1
+                stats.hash_hits += hash_hits
+                stats.spurious_hits += spurious_hits
+
+
+PATTERN_ALGORITHMS = {
+    cls.algorithm: cls
+    for cls in (BoyerMoorePattern, HorspoolPattern, SundayPattern, KMPPattern, RabinKarpPattern)
+}
+
+# Як і модуль re, тримаємо обмежену кількість скомпільованих шаблонів
+_PATTERN_CACHE_SIZE = 256
+
+
+@functools.lru_cache(maxsize=_PATTERN_CACHE_SIZE)
+def _compile_cached(algorithm, pattern):
+    return PATTERN_ALGORITHMS[algorithm](pattern)
+
+
+def compile_pattern(pattern, algorithm="boyer-moore"):
+    """
+    Повертає попередньо оброблений шаблон з обмеженого кешу.
     
-    return positions
+    Args:
+        pattern (str): Підрядок для знаходження
+        algorithm (str): 'boyer-moore', 'horspool', 'sunday', 'kmp' або
+            'rabin-karp' (без урахування регістру)
+        
+    Returns:
+        CompiledPattern: Об'єкт з методами search, count та finditer
+        
+    Raises:
+        ValueError: Якщо алгоритм невідомий
+    """
+    algorithm = algorithm.lower()
+    if algorithm not in PATTERN_ALGORITHMS:
+        raise ValueError(f"невідомий алгоритм '{algorithm}', доступні: {', '.join(PATTERN_ALGORITHMS)}")
+    return _compile_cached(algorithm, pattern)
+
 
+def purge_pattern_cache():
+    """Очищає кеш скомпільованих шаблонів."""
+    _compile_cached.cache_clear()
 
-def rabin_karp_search(text, pattern):
+
+def boyer_moore_search(text, pattern):
+    """
+    Алгоритм пошуку підрядка Боєра-Мура (погані символи, хороші суфікси,
+    правило Галіла).
+    
+    Args:
+        text (str): Текст для пошуку
+        pattern (str): Підрядок для знаходження
+        
+    Returns:
+        list: Список позицій, де знайдено підрядок
+    """
+    return BoyerMoorePattern(pattern).search(text)
+
+
+def horspool_search(text, pattern):
+    """
+    Алгоритм пошуку підрядка Хорспула.
+    
+    Args:
+        text (str): Текст для пошуку
+        pattern (str): Підрядок для знаходження
+        
+    Returns:
+        list: Список позицій, де знайдено підрядок
+    """
+    return HorspoolPattern(pattern).search(text)
+
+
+def sunday_search(text, pattern):
+    """
+    Алгоритм пошуку підрядка Санді (quick search).
+    
+    Args:
+        text (str): Текст для пошуку
+        pattern (str): Підрядок для знаходження
+        
+    Returns:
+        list: Список позицій, де знайдено підрядок
+    """
+    return SundayPattern(pattern).search(text)
+
+
+def kmp_search(text, pattern):
+    """
+    Алгоритм пошуку підрядка Кнута-Морріса-Пратта.
+    
+    Args:
+        text (str): Текст для пошуку
+        pattern (str): Підрядок для знаходження
+        
+    Returns:
+        list: Список позицій, де знайдено підрядок
+    """
+    return KMPPattern(pattern).search(text)
+
+
+def rabin_karp_search(text, pattern, base=DEFAULT_HASH_BASE, modulus=MERSENNE_61, stats=None):
     """
     Алгоритм пошуку підрядка Рабіна-Карпа.
     
     Args:
         text (str): Текст для пошуку
         pattern (str): Підрядок для знаходження
+        base (int): Основа полінома ковзного хешу
+        modulus (int): Модуль ковзного хешу (просте число)
+        stats (RabinKarpStats): Необов'язкові лічильники хибних збігів
         
     Returns:
         list: Список позицій, де знайдено підрядок
     """
-    if not pattern:
-        return []
+    return list(RabinKarpPattern(pattern, base, modulus).finditer(text, stats))
+
+
+class AhoCorasick:
+    """
+    Автомат Ахо-Корасік для одночасного пошуку багатьох підрядків.
     
-    # Параметри для хешування
-    d = 256  # кількість символів в алфавіті
-    q = 101  # просте число для модуля
+    Шаблони об'єднуються в префіксне дерево, стани якого пронумеровані:
+    переходи кожного стану зберігаються у словнику символ -> стан, а
+    посилання невдачі та виходи - у масивах, індексованих номером стану.
+    Текст проходиться один раз незалежно від кількості шаблонів.
+    """
+    
+    def __init__(self, patterns):
+        """
+        Будує автомат.
+        
+        Args:
+            patterns: Підрядки для пошуку; повторні шаблони об'єднуються
+        """
+        # Порожній шаблон позначає корінь, який ніколи не звітує про збіг,
+        # тож для нього, як і в boyer_moore_search, повертається []
+        self.patterns = list(dict.fromkeys(patterns))
+        # Стан 0 - корінь дерева
+        self._goto = [{}]
+        # Індекс шаблону, що закінчується в стані, або -1
+        self._match = [-1]
+        
+        for index, pattern in enumerate(self.patterns):
+            state = 0
+            for char in pattern:
+                next_state = self._goto[state].get(char)
+                if next_state is None:
+                    next_state = len(self._goto)
+                    self._goto[state][char] = next_state
+                    self._goto.append({})
+                    self._match.append(-1)
+                state = next_state
+            self._match[state] = index
+        
+        count = len(self._goto)
+        self._fail = array('i', bytes(4 * count))
+        # Найближчий за посиланнями невдачі стан, у якому закінчується шаблон
+        self._output = array('i', bytes(4 * count))
+        
+        # Обхід у ширину гарантує, що посилання невдачі коротших
+        # префіксів уже обчислені
+        queue = collections.deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, child in self._goto[state].items():
+                queue.append(child)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(char, 0)
+                self._fail[child] = target if target != child else 0
+                fail = self._fail[child]
+                self._output[child] = fail if self._match[fail] >= 0 else self._output[fail]
     
-    pattern_len = len(pattern)
-    text_len = len(text)
-    pattern_hash = 0
-    text_hash = 0
-    h = 1
-    positions = []
+    def __len__(self):
+        return len(self.patterns)
     
-    # Обчислюємо h = pow(d, pattern_len-1) % q
-    for i in range(pattern_len - 1):
-        h = (h * d) % q
+    def search(self, text):
+        """
+        Знаходить усі входження всіх шаблонів за один прохід тексту.
+        
+        Args:
+            text (str): Текст для пошуку
+            
+        Returns:
+            dict: {шаблон: список позицій} у тому ж форматі, що й
+                boyer_moore_search чи kmp_search (включно з перекриттями)
+        """
+        goto = self._goto
+        fail = self._fail
+        match = self._match
+        output = self._output
+        lengths = [len(pattern) for pattern in self.patterns]
+        found = [[] for _ in self.patterns]
+        
+        state = 0
+        for i, char in enumerate(text):
+            while True:
+                next_state = goto[state].get(char)
+                if next_state is not None:
+                    state = next_state
+                    break
+                if not state:
+                    break
+                state = fail[state]
+            
+            # Шаблон, що закінчується в самому стані, а далі - ланцюжок виходів
+            hit = state if match[state] >= 0 else output[state]
+            while hit:
+                index = match[hit]
+                found[index].append(i - lengths[index] + 1)
+                hit = output[hit]
+        
+        return dict(zip(self.patterns, found))
+
+
+def aho_corasick_search(text, patterns):
+    """
+    Пошук багатьох підрядків одним проходом тексту (Ахо-Корасік).
     
-    # Обчислюємо хеш шаблону та першого вікна тексту
-    for i in range(pattern_len):
-        pattern_hash = (d * pattern_hash + ord(pattern[i])) % q
-        text_hash = (d * text_hash + ord(text[i])) % q
+    Для повторного пошуку тих самих шаблонів у багатьох текстах краще
+    один раз створити AhoCorasick і викликати його метод search.
     
-    # Ковзаємо шаблон по тексту
-    for i in range(text_len - pattern_len + 1):
-        # Перевіряємо хеші
-        if pattern_hash == text_hash:
-            # Перевіряємо символи один за одним
-            if text[i:i + pattern_len] == pattern:
-                positions.append(i)
+    Args:
+        text (str): Текст для пошуку
+        patterns: Підрядки для знаходження
         
-        # Обчислюємо хеш для наступного вікна
-        if i < text_len - pattern_len:
-            text_hash = (d * (text_hash - ord(text[i]) * h) + ord(text[i + pattern_len])) % q
-            if text_hash < 0:
-                text_hash += q
+    Returns:
+        dict: {шаблон: список позицій} для кожного шаблону
+    """
+    return AhoCorasick(patterns).search(text)
+
+
+class MultiRabinKarp:
+    """
+    Пошук багатьох підрядків алгоритмом Рабіна-Карпа.
+    
+    Шаблони автоматично групуються за довжиною; для кожної довжини
+    ковзний хеш тексту обчислюється один раз, а вікна шукаються у словнику
+    хеш -> шаблони. Кількість проходів тексту дорівнює кількості різних
+    довжин, а не кількості шаблонів.
+    """
+    
+    def __init__(self, patterns, base=DEFAULT_HASH_BASE, modulus=MERSENNE_61):
+        """
+        Args:
+            patterns: Підрядки для пошуку; повторні шаблони об'єднуються
+            base (int): Основа полінома ковзного хешу
+            modulus (int): Модуль ковзного хешу (просте число)
+        """
+        self.patterns = list(dict.fromkeys(patterns))
+        self.base = base
+        self.modulus = modulus
+        # Довжина -> (RollingHash, {хеш: [індекси шаблонів]}); порожні
+        # шаблони не потрапляють у групи, тож для них повертається []
+        self._groups = {}
+        for index, pattern in enumerate(self.patterns):
+            if not pattern:
+                continue
+            group = self._groups.get(len(pattern))
+            if group is None:
+                group = (RollingHash(len(pattern), base, modulus), {})
+                self._groups[len(pattern)] = group
+            rolling, table = group
+            table.setdefault(rolling.hash(pattern), []).append(index)
+    
+    def __len__(self):
+        return len(self.patterns)
     
-    return positions
+    def search(self, text, stats=None):
+        """
+        Знаходить усі входження всіх шаблонів.
+        
+        Args:
+            text (str): Текст для пошуку
+            stats (RabinKarpStats): Необов'язкові лічильники вікон, збігів
+                хешів та хибних збігів (сумуються по всіх довжинах)
+            
+        Returns:
+            dict: {шаблон: список позицій} у тому ж форматі, що й
+                aho_corasick_search (включно з перекриттями)
+        """
+        patterns = self.patterns
+        found = [[] for _ in patterns]
+        text_len = len(text)
+        
+        for pattern_len, (rolling, table) in self._groups.items():
+            if text_len < pattern_len:
+                continue
+            base, modulus, high = rolling.base, rolling.modulus, rolling.high
+            last = text_len - pattern_len
+            hash_hits = 0
+            spurious_hits = 0
+            
+            text_hash = rolling.hash(text[:pattern_len])
+            i = 0
+            while True:
+                candidates = table.get(text_hash)
+                if candidates is not None:
+                    hash_hits += 1
+                    # Шаблони однієї довжини з однаковим хешем різні, тож
+                    # з вікном може збігтися щонайбільше один
+                    for index in candidates:
+                        if text.startswith(patterns[index], i):
+                            found[index].append(i)
+                            break
+                    else:
+                        spurious_hits += 1
+                if i == last:
+                    break
+                text_hash = ((text_hash - ord(text[i]) * high) * base
+                             + ord(text[i + pattern_len])) % modulus
+                i += 1
+            
+            if stats is not None:
+                stats.windows += last + 1
+                stats.hash_hits += hash_hits
+                stats.spurious_hits += spurious_hits
+        
+        return dict(zip(patterns, found))
+
+
+def rabin_karp_multi_search(text, patterns, base=DEFAULT_HASH_BASE, modulus=MERSENNE_61,
+                            stats=None):
+    """
+    Пошук багатьох підрядків одним проходом тексту на кожну довжину
+    шаблонів (Рабін-Карп).
+    
+    Для повторного пошуку тих самих шаблонів у багатьох текстах краще
+    один раз створити MultiRabinKarp і викликати його метод search.
+    
+    Args:
+        text (str): Текст для пошуку
+        patterns: Підрядки для знаходження
+        base (int): Основа полінома ковзного хешу
+        modulus (int): Модуль ковзного хешу (просте число)
+        stats (RabinKarpStats): Необов'язкові лічильники хибних збігів
+        
+    Returns:
+        dict: {шаблон: список позицій} для кожного шаблону
+    """
+    return MultiRabinKarp(patterns, base, modulus).search(text, stats)
+
+
+# Алгоритми пошуку одного підрядка, що порівнюються в бенчмарках
+SEARCH_ALGORITHMS = {
+    'Boyer-Moore': boyer_moore_search,
+    'Horspool': horspool_search,
+    'Sunday': sunday_search,
+    'KMP': kmp_search,
+    'Rabin-Karp': rabin_karp_search
+}
 
 
 def load_text_files():
@@ -233,7 +838,8 @@ def load_text_files():
     return text1, text2
 
 
-def benchmark_algorithms(text, existing_pattern, fake_pattern, text_name):
+def benchmark_algorithms(text, existing_pattern, fake_pattern, text_name,
+                         pattern_counts=(10, 100, 1000)):
     """
     Порівнює швидкість алгоритмів пошуку.
     
@@ -242,15 +848,13 @@ def benchmark_algorithms(text, existing_pattern, fake_pattern, text_name):
         existing_pattern (str): Підрядок, що існує в тексті
         fake_pattern (str): Вигаданий підрядок
         text_name (str): Назва тексту для звіту
+        pattern_counts (tuple): Кількості шаблонів для порівняння пошуку
+            багатьох підрядків (порожній кортеж - пропустити)
         
     Returns:
         dict: Результати вимірювань
     """
-    algorithms = {
-        'Boyer-Moore': boyer_moore_search,
-        'KMP': kmp_search,
-        'Rabin-Karp': rabin_karp_search
-    }
+    algorithms = SEARCH_ALGORITHMS
     
     results = {}
     
@@ -287,9 +891,231 @@ def benchmark_algorithms(text, existing_pattern, fake_pattern, text_name):
         print(f"   📍 Існуючий: {len(positions_existing)} збігів, {time_existing:.6f} сек")
         print(f"   🚫 Вигаданий: {len(positions_fake)} збігів, {time_fake:.6f} сек")
     
+    if pattern_counts:
+        benchmark_multi_pattern(text, algorithms, pattern_counts)
+    
     return results
 
 
+def benchmark_multi_pattern(text, algorithms, pattern_counts):
+    """
+    Порівнює Ахо-Корасік з циклом викликів однопатернових алгоритмів
+    для різної кількості шаблонів.
+    
+    Args:
+        text (str): Текст для пошуку
+        algorithms (dict): Назва -> функція пошуку одного підрядка
+        pattern_counts (tuple): Кількості шаблонів
+    """
+    import random
+    
+    # Фіксоване зерно: однаковий набір шаблонів між запусками
+    rng = random.Random(len(text))
+    
+    def make_patterns(count):
+        # Половина - фрагменти тексту, половина - ті самі фрагменти
+        # з переставленими символами (ймовірно відсутні в тексті)
+        patterns = []
+        for i in range(count):
+            length = rng.randint(4, 12)
+            start = rng.randrange(max(1, len(text) - length))
+            pattern = text[start:start + length]
+            if i % 2:
+                pattern = ''.join(rng.sample(pattern, len(pattern)))
+            patterns.append(pattern)
+        return patterns
+    
+    print(f"\n🧩 Пошук багатьох підрядків: цикл по шаблонах vs Aho-Corasick (сек)")
+    header = ''.join(f"{name:>13}" for name in algorithms)
+    print(f"   {'Шаблонів':>9}{header}{'Aho-Corasick':>14}{'Прискорення':>13}")
+    for count in pattern_counts:
+        patterns = make_patterns(count)
+        loop_times = []
+        expected = None
+        for alg_func in algorithms.values():
+            # Цикл по тисячі шаблонів довгий, тому вимірюємо один прохід
+            loop_times.append(timeit.timeit(
+                lambda: [alg_func(text, pattern) for pattern in patterns], number=1))
+            if expected is None:
+                expected = {pattern: alg_func(text, pattern) for pattern in patterns}
+        ac_time = timeit.timeit(lambda: aho_corasick_search(text, patterns), number=3) / 3
+        
+        mark = "" if aho_corasick_search(text, patterns) == expected else "  ✗ результати відрізняються"
+        times = ''.join(f"{t:>13.4f}" for t in loop_times)
+        print(f"   {count:>9}{times}{ac_time:>14.4f}{min(loop_times) / ac_time:>12.1f}x{mark}")
+
+
+def benchmark_multi_rabin_karp(text, pattern_counts=(1000, 50000), shingle_size=8,
+                               loop_sample=200):
+    """
+    Порівнює пакетний Рабін-Карп з циклом rabin_karp_search по шаблонах
+    та з Ахо-Корасік на наборах шинглів однакової довжини.
+    
+    Args:
+        text (str): Текст для пошуку
+        pattern_counts (tuple): Кількості шинглів
+        shingle_size (int): Довжина шингла
+        loop_sample (int): Скільки шаблонів реально проганяти циклом;
+            час для більших наборів екстраполюється пропорційно
+    """
+    import random
+    
+    # Фіксоване зерно: однаковий набір шинглів між запусками
+    rng = random.Random(len(text))
+    
+    def make_shingles(count, sizes):
+        # Половина - вікна тексту, половина - ті самі вікна з
+        # переставленими символами (здебільшого відсутні в тексті)
+        shingles = set()
+        while len(shingles) < count:
+            length = rng.choice(sizes)
+            start = rng.randrange(len(text) - length)
+            shingle = text[start:start + length]
+            if rng.random() < 0.5:
+                shingle = ''.join(rng.sample(shingle, length))
+            shingles.add(shingle)
+        return sorted(shingles)
+    
+    cases = [(f"{count} x {shingle_size}", make_shingles(count, [shingle_size]))
+             for count in pattern_counts]
+    cases.append((f"{pattern_counts[0]} x 4-12",
+                  make_shingles(pattern_counts[0], list(range(4, 13)))))
+    
+    print(f"\n" + "="*70)
+    print("🧬 ПАКЕТНИЙ RABIN-KARP ДЛЯ ШИНГЛІВ")
+    print("="*70)
+    print(f"📊 Текст: {len(text):,} символів, час - сек "
+          f"(* - екстрапольовано з {loop_sample} шаблонів)")
+    print(f"   {'Шаблонів':<11} {'Цикл':>10} {'Пакетний RK':>12} {'Aho-Corasick':>13} "
+          f"{'Хибних':>7} {'Прискорення':>12}")
+    for label, shingles in cases:
+        sample = shingles[:loop_sample]
+        loop_time = timeit.timeit(
+            lambda: [rabin_karp_search(text, shingle) for shingle in sample], number=1)
+        loop_time *= len(shingles) / len(sample)
+        extrapolated = "*" if len(sample) < len(shingles) else " "
+        
+        batch_time = min(timeit.repeat(
+            lambda: rabin_karp_multi_search(text, shingles), number=1, repeat=3))
+        ac_time = timeit.timeit(lambda: aho_corasick_search(text, shingles), number=1)
+        
+        stats = RabinKarpStats()
+        found = rabin_karp_multi_search(text, shingles, stats=stats)
+        expected = {shingle: rabin_karp_search(text, shingle) for shingle in sample}
+        mark = "" if all(found[s] == expected[s] for s in sample) else "  ✗ результати відрізняються"
+        print(f"   {label:<11} {loop_time:>9.3f}{extrapolated} {batch_time:>12.4f} {ac_time:>13.4f} "
+              f"{stats.spurious_hits:>7} {loop_time / batch_time:>11.0f}x{mark}")
+
+
+def benchmark_compiled_patterns(text, document_size=200):
+    """
+    Вимірює економію на кожному документі від попередньо скомпільованого
+    шаблону порівняно з викликом функції, що повторює попередню обробку.
+    
+    Args:
+        text (str): Текст, що ділиться на короткі документи
+        document_size (int): Розмір документа в символах
+    """
+    documents = [text[i:i + document_size] for i in range(0, len(text), document_size)]
+    middle = len(text) // 2
+    patterns = [
+        ('короткий', 'та'),
+        ('довгий', text[middle:middle + 100]),
+    ]
+    functions = {
+        'boyer-moore': ('Boyer-Moore', boyer_moore_search),
+        'horspool': ('Horspool', horspool_search),
+        'sunday': ('Sunday', sunday_search),
+        'kmp': ('KMP', kmp_search),
+        'rabin-karp': ('Rabin-Karp', rabin_karp_search),
+    }
+    
+    print(f"\n" + "="*70)
+    print("📦 ПОПЕРЕДНЬО СКОМПІЛЬОВАНІ ШАБЛОНИ")
+    print("="*70)
+    print(f"📊 {len(documents)} документів по {document_size} символів, час - мкс на документ")
+    print(f"\n   {'Алгоритм':<13} {'Шаблон':<16} {'Функція':>9} {'compile_pattern':>16} {'Економія':>9}")
+    for algorithm, (alg_name, alg_func) in functions.items():
+        for label, pattern in patterns:
+            compiled = compile_pattern(pattern, algorithm)
+            function_time = min(timeit.repeat(
+                lambda: [alg_func(document, pattern) for document in documents],
+                number=3, repeat=3)) / 3 / len(documents)
+            compiled_time = min(timeit.repeat(
+                lambda: [compiled.search(document) for document in documents],
+                number=3, repeat=3)) / 3 / len(documents)
+            saving = 1 - compiled_time / function_time
+            description = f"{label} ({len(pattern)})"
+            print(f"   {alg_name:<13} {description:<16} {function_time * 1e6:>9.2f} "
+                  f"{compiled_time * 1e6:>16.2f} {saving:>8.0%}")
+
+
+def benchmark_worst_case(text_size=10**6, pattern_size=1000):
+    """
+    Порівнює алгоритми на найгірших для них вхідних даних: тексті з
+    одного символа та періодичних шаблонах.
+    
+    Args:
+        text_size (int): Довжина тексту
+        pattern_size (int): Довжина шаблону
+    """
+    text = 'a' * text_size
+    cases = [
+        ("'a' * m", 'a' * pattern_size),
+        ("'b' + 'a' * (m-1)", 'b' + 'a' * (pattern_size - 1)),
+        ("'a' * (m-1) + 'b'", 'a' * (pattern_size - 1) + 'b'),
+    ]
+    
+    print(f"\n" + "="*70)
+    print("🧨 НАЙГІРШІ ВИПАДКИ")
+    print("="*70)
+    print(f"📊 Текст: 'a' * {text_size:,}, довжина шаблону m = {pattern_size:,}, час - сек")
+    header = ''.join(f"{name:>12}" for name in SEARCH_ALGORITHMS)
+    print(f"\n   {'Шаблон':<20}{header}{'Збігів':>10}")
+    for label, pattern in cases:
+        times = []
+        counts = set()
+        for alg_func in SEARCH_ALGORITHMS.values():
+            start = timeit.default_timer()
+            counts.add(len(alg_func(text, pattern)))
+            times.append(timeit.default_timer() - start)
+        count = counts.pop() if len(counts) == 1 else "✗ різні"
+        print(f"   {label:<20}{''.join(f'{t:>12.3f}' for t in times)}{count:>10}")
+
+
+def benchmark_rolling_hash(text1, text2):
+    """
+    Порівнює частку хибних збігів хешів та пропускну здатність
+    Рабіна-Карпа зі старими параметрами (основа 256, модуль 101) та з
+    модулем 2^61 - 1.
+    
+    Args:
+        text1 (str): Перший текст
+        text2 (str): Другий текст
+    """
+    parameters = [
+        ('256 / 101', 256, 101),
+        ('1114117 / 2^61-1', DEFAULT_HASH_BASE, MERSENNE_61),
+    ]
+    patterns = ['та', 'алгоритм', 'структура даних', 'xyz123nonexistent']
+    
+    print(f"\n" + "="*70)
+    print("🎲 КОВЗНИЙ ХЕШ RABIN-KARP: ХИБНІ ЗБІГИ ТА ПРОПУСКНА ЗДАТНІСТЬ")
+    print("="*70)
+    for text_name, text in (('Стаття 1', text1), ('Стаття 2', text2)):
+        print(f"\n📄 {text_name} ({len(text)} символів)")
+        print(f"   {'Шаблон':<19} {'Основа / модуль':<17} {'Збігів':>7} "
+              f"{'Хибних':>7} {'Частка':>8} {'Мсимв/с':>8}")
+        for pattern in patterns:
+            for label, base, modulus in parameters:
+                compiled = RabinKarpPattern(pattern, base, modulus)
+                stats = RabinKarpStats()
+                found = len(list(compiled.finditer(text, stats)))
+                elapsed = min(timeit.repeat(lambda: compiled.search(text), number=3, repeat=3)) / 3
+                print(f"   {pattern!r:<19} {label:<17} {found:>7} {stats.spurious_hits:>7} "
+                      f"{stats.spurious_rate:>8.3%} {len(text) / elapsed / 1e6:>8.2f}")
+
+
 def analyze_results(results1, results2, text1_name, text2_name):
     """
     Аналізує та виводить підсумкові результати.
@@ -353,13 +1179,182 @@ def analyze_results(results1, results2, text1_name, text2_name):
         print(f"      {alg}: {speedup:.2f}x швидше")
 
 
+def test_aho_corasick():
+    """
+    Порівнює aho_corasick_search з kmp_search для кожного шаблону на
+    випадкових текстах з малим алфавітом (багато перекриттів).
+    """
+    import random
+    
+    print("🧩 Тестування Aho-Corasick")
+    print("=" * 50)
+    
+    text = "he said she sells his shells"
+    patterns = ["he", "she", "his", "hers", "shells"]
+    print(f"   Текст: '{text}'")
+    for pattern, positions in aho_corasick_search(text, patterns).items():
+        print(f"     '{pattern}': {positions}")
+    
+    rng = random.Random(41)
+    errors = 0
+    checks = 0
+    for _ in range(500):
+        alphabet = rng.choice(["ab", "abc", "абв"])
+        text = ''.join(rng.choice(alphabet) for _ in range(rng.randint(0, 80)))
+        patterns = [''.join(rng.choice(alphabet) for _ in range(rng.randint(0, 5)))
+                    for _ in range(rng.randint(1, 10))]
+        found = aho_corasick_search(text, patterns)
+        for pattern in patterns:
+            checks += 1
+            if found[pattern] != kmp_search(text, pattern):
+                errors += 1
+    
+    mark = "✓" if errors == 0 else "✗"
+    print(f"   {mark} Перевірено {checks} шаблонів, помилок: {errors}\n")
+
+
+def test_compiled_patterns():
+    """
+    Перевіряє, що скомпільовані шаблони всіх алгоритмів і функції пошуку
+    дають ті самі позиції, що й повний перебір, а кеш повертає той самий
+    об'єкт.
+    """
+    import random
+    
+    print("📦 Тестування compile_pattern")
+    print("=" * 50)
+    
+    compiled = compile_pattern("ab", "kmp")
+    print(f"   {compiled}: search = {compiled.search('abcabab')}, "
+          f"count = {compiled.count('abcabab')}, finditer = {list(compiled.finditer('abcabab'))}")
+    
+    rng = random.Random(43)
+    functions = {
+        'boyer-moore': boyer_moore_search,
+        'horspool': horspool_search,
+        'sunday': sunday_search,
+        'kmp': kmp_search,
+        'rabin-karp': rabin_karp_search,
+    }
+    errors = 0
+    checks = 0
+    for _ in range(300):
+        alphabet = rng.choice(["ab", "abc", "абв"])
+        text = ''.join(rng.choice(alphabet) for _ in range(rng.randint(0, 60)))
+        pattern = ''.join(rng.choice(alphabet) for _ in range(rng.randint(0, 6)))
+        # Еталон - перевірка кожної позиції (порожній шаблон не шукається)
+        expected = [i for i in range(len(text) - len(pattern) + 1)
+                    if text.startswith(pattern, i)] if pattern else []
+        for algorithm, func in functions.items():
+            checks += 1
+            compiled = compile_pattern(pattern, algorithm)
+            if (func(text, pattern) != expected or compiled.search(text) != expected
+                    or compiled.count(text) != len(expected)
+                    or list(compiled.finditer(text)) != expected):
+                errors += 1
+    
+    if compile_pattern("алгоритм", "KMP") is not compile_pattern("алгоритм", "kmp"):
+        errors += 1
+    try:
+        compile_pattern("x", "naive")
+        errors += 1
+    except ValueError:
+        pass
+    
+    mark = "✓" if errors == 0 else "✗"
+    print(f"   {mark} Перевірено {checks} випадків, помилок: {errors}\n")
+
+
+def test_rolling_hash():
+    """
+    Перевіряє ковзний хеш, лічильники RabinKarpStats та однакові позиції
+    для різних основ і модулів.
+    """
+    import random
+    
+    print("🎲 Тестування ковзного хешу Rabin-Karp")
+    print("=" * 50)
+    
+    errors = 0
+    rolling = RollingHash(3)
+    text = "абвгде"
+    value = rolling.hash(text[:3])
+    for i in range(len(text) - 3):
+        value = rolling.roll(value, text[i], text[i + 3])
+        if value != rolling.hash(text[i + 1:i + 4]):
+            errors += 1
+    
+    stats = RabinKarpStats()
+    print(f"   rabin_karp_search('abcabab', 'ab', base=2, modulus=3) = "
+          f"{rabin_karp_search('abcabab', 'ab', base=2, modulus=3, stats=stats)}, {stats}")
+    
+    rng = random.Random(44)
+    parameters = [(DEFAULT_HASH_BASE, MERSENNE_61), (256, 101), (2, 3)]
+    checks = 0
+    for _ in range(300):
+        alphabet = rng.choice(["ab", "abc", "абв"])
+        text = ''.join(rng.choice(alphabet) for _ in range(rng.randint(0, 60)))
+        pattern = ''.join(rng.choice(alphabet) for _ in range(rng.randint(1, 6)))
+        expected = kmp_search(text, pattern)
+        windows = max(len(text) - len(pattern) + 1, 0)
+        for base, modulus in parameters:
+            checks += 1
+            stats = RabinKarpStats()
+            if (rabin_karp_search(text, pattern, base, modulus, stats) != expected
+                    or stats.windows != windows
+                    or stats.hash_hits - stats.spurious_hits != len(expected)):
+                errors += 1
+    
+    mark = "✓" if errors == 0 else "✗"
+    print(f"   {mark} Перевірено {checks} випадків, помилок: {errors}\n")
+
+
+def test_multi_rabin_karp():
+    """
+    Порівнює rabin_karp_multi_search з aho_corasick_search на шаблонах
+    різної довжини, у тому числі зі слабким хешем, що дає колізії.
+    """
+    import random
+    
+    print("🧬 Тестування пакетного Rabin-Karp")
+    print("=" * 50)
+    
+    text = "he said she sells his shells"
+    patterns = ["he", "she", "his", "hers", "shells"]
+    stats = RabinKarpStats()
+    print(f"   Текст: '{text}'")
+    for pattern, positions in rabin_karp_multi_search(text, patterns, stats=stats).items():
+        print(f"     '{pattern}': {positions}")
+    print(f"   {stats}")
+    
+    rng = random.Random(45)
+    errors = 0
+    checks = 0
+    for _ in range(500):
+        alphabet = rng.choice(["ab", "abc", "абв"])
+        text = ''.join(rng.choice(alphabet) for _ in range(rng.randint(0, 80)))
+        patterns = [''.join(rng.choice(alphabet) for _ in range(rng.randint(0, 6)))
+                    for _ in range(rng.randint(1, 12))]
+        expected = aho_corasick_search(text, patterns)
+        for base, modulus in ((DEFAULT_HASH_BASE, MERSENNE_61), (2, 3)):
+            checks += 1
+            stats = RabinKarpStats()
+            found = rabin_karp_multi_search(text, patterns, base, modulus, stats)
+            if (found != expected
+                    or stats.hash_hits - stats.spurious_hits != sum(map(len, found.values()))):
+                errors += 1
+    
+    mark = "✓" if errors == 0 else "✗"
+    print(f"   {mark} Перевірено {checks} наборів шаблонів, помилок: {errors}\n")
+
+
 def main():
     """
     Головна функція для запуску всіх тестів.
     """
     print("🔍 Порівняння алгоритмів пошуку підрядків")
     print("="*50)
-    print("📋 Алгоритми: Boyer-Moore, KMP, Rabin-Karp")
+    print(f"📋 Алгоритми: {', '.join(SEARCH_ALGORITHMS)}")
     print("📄 Тестування на двох текстових файлах")
     
     # Завантажуємо тексти
@@ -417,9 +1412,7 @@ def main():
         print(f"\n🔸 {description} ('{pattern}'):")
         
         times = {}
-        for alg_name, alg_func in [('Boyer-Moore', boyer_moore_search), 
-                                  ('KMP', kmp_search), 
-                                  ('Rabin-Karp', rabin_karp_search)]:
+        for alg_name, alg_func in SEARCH_ALGORITHMS.items():
             time_taken = timeit.timeit(lambda: alg_func(text1, pattern), number=5) / 5
             times[alg_name] = time_taken
             count = len(alg_func(text1, pattern))
@@ -427,14 +1420,28 @@ def main():
         
         fastest = min(times.keys(), key=lambda x: times[x])
         print(f"   🏆 Найшвидший: {fastest}")
+    
+    benchmark_compiled_patterns(text1)
+    benchmark_rolling_hash(text1, text2)
+    benchmark_multi_rabin_karp(text1)
+    benchmark_worst_case()
 
 
 if __name__ == "__main__":
+    test_aho_corasick()
+    test_compiled_patterns()
+    test_rolling_hash()
+    test_multi_rabin_karp()
     main()
     
     print("\n✅ Тестування завершено!")
     print("\n💡 Висновки:")
     print("   • Boyer-Moore ефективний для довгих підрядків та великих алфавітів")
+    print("   • Правило хорошого суфікса та правило Галіла роблять Boyer-Moore лінійним на періодичних шаблонах")
     print("   • KMP показує стабільну продуктивність для всіх випадків")
     print("   • Rabin-Karp добре працює з короткими підрядками")
+    print("   • Модуль 2^61 - 1 практично прибирає хибні збіги хешів у Rabin-Karp")
+    print("   • Aho-Corasick шукає багато підрядків одним проходом тексту")
+    print("   • Пакетний Rabin-Karp проходить текст один раз на кожну довжину шаблонів")
+    print("   • compile_pattern прибирає повторну попередню обробку шаблону для кожного документа")
     print("   • Результати можуть залежати від характеристик тексту та підрядка")